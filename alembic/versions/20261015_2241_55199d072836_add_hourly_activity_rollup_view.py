@@ -0,0 +1,45 @@
+"""Add hourly activity rollup view
+
+Revision ID: 55199d072836
+Revises: d4e02e562314
+Create Date: 2026-10-15 22:41:14.075622
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '55199d072836'
+down_revision: Union[str, None] = 'd4e02e562314'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Pre-aggregated message counts per (group, day of week, hour of day).
+    # Refreshed after each sync; see groupme_backup/db/rollups.py.
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW mv_hourly_activity AS
+        SELECT
+            group_id,
+            EXTRACT(DOW FROM created_at)::INTEGER AS day_of_week,
+            EXTRACT(HOUR FROM created_at)::INTEGER AS hour_of_day,
+            COUNT(*) AS message_count
+        FROM messages
+        WHERE system = FALSE
+        GROUP BY group_id, day_of_week, hour_of_day
+        """
+    )
+    # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute(
+        "CREATE UNIQUE INDEX idx_mv_hourly_activity_key "
+        "ON mv_hourly_activity (group_id, day_of_week, hour_of_day)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_hourly_activity")
@@ -0,0 +1,48 @@
+"""Add user engagement rollup view
+
+Revision ID: f0d26b25194f
+Revises: 5729217a4269
+Create Date: 2026-10-15 22:57:17.284073
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f0d26b25194f'
+down_revision: Union[str, None] = '5729217a4269'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Per-user message and like totals for each group, used by the
+    # like-to-message ratio. Refreshed after each sync; see
+    # groupme_backup/db/rollups.py.
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW mv_user_engagement AS
+        SELECT
+            m.group_id,
+            m.user_id,
+            COUNT(DISTINCT m.id) AS message_count,
+            COUNT(mf.user_id) AS total_likes
+        FROM messages m
+        LEFT JOIN message_favorites mf ON m.id = mf.message_id
+        WHERE m.system = FALSE
+        AND m.user_id IS NOT NULL
+        GROUP BY m.group_id, m.user_id
+        """
+    )
+    # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute(
+        "CREATE UNIQUE INDEX idx_mv_user_engagement_key "
+        "ON mv_user_engagement (group_id, user_id)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_user_engagement")
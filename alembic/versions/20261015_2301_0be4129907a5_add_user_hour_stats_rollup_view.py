@@ -0,0 +1,52 @@
+"""Add user hour stats rollup view
+
+Revision ID: 0be4129907a5
+Revises: f0d26b25194f
+Create Date: 2026-10-15 23:01:44.204882
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0be4129907a5'
+down_revision: Union[str, None] = 'f0d26b25194f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Per-user message counts and text length totals for each group, day of
+    # week and hour of day, used by the leaderboards and message length
+    # stats. Refreshed after each sync; see groupme_backup/db/rollups.py.
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW mv_user_hour_stats AS
+        SELECT
+            group_id,
+            user_id,
+            EXTRACT(DOW FROM created_at)::INTEGER AS day_of_week,
+            EXTRACT(HOUR FROM created_at)::INTEGER AS hour_of_day,
+            COUNT(*) AS message_count,
+            COUNT(*) FILTER (WHERE text IS NOT NULL AND text != '') AS text_count,
+            SUM(LENGTH(text)) FILTER (WHERE text != '') AS total_length,
+            MAX(LENGTH(text)) FILTER (WHERE text != '') AS max_length,
+            MIN(LENGTH(text)) FILTER (WHERE text != '') AS min_length
+        FROM messages
+        WHERE system = FALSE
+        AND user_id IS NOT NULL
+        GROUP BY group_id, user_id, day_of_week, hour_of_day
+        """
+    )
+    # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute(
+        "CREATE UNIQUE INDEX idx_mv_user_hour_stats_key "
+        "ON mv_user_hour_stats (group_id, user_id, day_of_week, hour_of_day)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_user_hour_stats")
@@ -0,0 +1,30 @@
+"""Add trigram index on message names
+
+Revision ID: 54e8398430aa
+Revises: 0be4129907a5
+Create Date: 2026-10-15 23:04:33.022190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '54e8398430aa'
+down_revision: Union[str, None] = '0be4129907a5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Built concurrently so existing backups stay writable during the migration
+    with op.get_context().autocommit_block():
+        op.create_index('idx_messages_name_trgm', 'messages', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    # The pg_trgm extension is left installed; other objects may depend on it
+    op.drop_index('idx_messages_name_trgm', table_name='messages', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
@@ -0,0 +1,43 @@
+"""Add group_id to attachments
+
+Revision ID: 3e7a9c5d1f20
+Revises: 54e8398430aa
+Create Date: 2026-10-15 23:21:42.508316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e7a9c5d1f20'
+down_revision: Union[str, None] = '54e8398430aa'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Added nullable, backfilled from messages, then tightened to NOT NULL
+    op.add_column('attachments', sa.Column('group_id', sa.String(length=50), nullable=True))
+    op.execute(
+        """
+        UPDATE attachments a
+        SET group_id = m.group_id
+        FROM messages m
+        WHERE a.message_id = m.id
+        """
+    )
+    op.alter_column('attachments', 'group_id', nullable=False)
+    op.create_foreign_key('attachments_group_id_fkey', 'attachments', 'groups', ['group_id'], ['id'], ondelete='CASCADE')
+
+    # Built concurrently so existing backups stay writable during the migration
+    with op.get_context().autocommit_block():
+        op.create_index('idx_attachments_group_emoji', 'attachments', ['group_id', 'placeholder'], unique=False, postgresql_where=sa.text("type = 'emoji' AND placeholder IS NOT NULL"), postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_attachments_group_emoji', table_name='attachments', postgresql_where=sa.text("type = 'emoji' AND placeholder IS NOT NULL"))
+    op.drop_constraint('attachments_group_id_fkey', 'attachments', type_='foreignkey')
+    op.drop_column('attachments', 'group_id')
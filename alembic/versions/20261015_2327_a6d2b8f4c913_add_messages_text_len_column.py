@@ -0,0 +1,58 @@
+"""Add stored text_len column to messages
+
+Revision ID: a6d2b8f4c913
+Revises: 3e7a9c5d1f20
+Create Date: 2026-10-15 23:27:18.736045
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6d2b8f4c913'
+down_revision: Union[str, None] = '3e7a9c5d1f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_user_hour_stats(length_expr: str) -> None:
+    op.execute(
+        f"""
+        CREATE MATERIALIZED VIEW mv_user_hour_stats AS
+        SELECT
+            group_id,
+            user_id,
+            EXTRACT(DOW FROM created_at)::INTEGER AS day_of_week,
+            EXTRACT(HOUR FROM created_at)::INTEGER AS hour_of_day,
+            COUNT(*) AS message_count,
+            COUNT(*) FILTER (WHERE text IS NOT NULL AND text != '') AS text_count,
+            SUM({length_expr}) FILTER (WHERE text != '') AS total_length,
+            MAX({length_expr}) FILTER (WHERE text != '') AS max_length,
+            MIN({length_expr}) FILTER (WHERE text != '') AS min_length
+        FROM messages
+        WHERE system = FALSE
+        AND user_id IS NOT NULL
+        GROUP BY group_id, user_id, day_of_week, hour_of_day
+        """
+    )
+    # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute(
+        "CREATE UNIQUE INDEX idx_mv_user_hour_stats_key "
+        "ON mv_user_hour_stats (group_id, user_id, day_of_week, hour_of_day)"
+    )
+
+
+def upgrade() -> None:
+    op.add_column('messages', sa.Column('text_len', sa.Integer(), sa.Computed('length(text)', persisted=True), nullable=True))
+    # Rebuild the rollup on the stored length so refreshes skip LENGTH(text)
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_user_hour_stats")
+    _create_user_hour_stats("text_len")
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_user_hour_stats")
+    _create_user_hour_stats("LENGTH(text)")
+    op.drop_column('messages', 'text_len')
@@ -0,0 +1,45 @@
+"""Add user mentions rollup view
+
+Revision ID: c4b7e1a95d08
+Revises: a6d2b8f4c913
+Create Date: 2026-10-15 23:33:51.927460
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4b7e1a95d08'
+down_revision: Union[str, None] = 'a6d2b8f4c913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Times each user was @mentioned in each group, used by the most
+    # mentioned users leaderboard. Refreshed after each sync; see
+    # groupme_backup/db/rollups.py.
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW mv_user_mentions AS
+        SELECT
+            m.group_id,
+            mn.user_id,
+            COUNT(*) AS mention_count
+        FROM mentions mn
+        JOIN messages m ON mn.message_id = m.id
+        GROUP BY m.group_id, mn.user_id
+        """
+    )
+    # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute(
+        "CREATE UNIQUE INDEX idx_mv_user_mentions_key "
+        "ON mv_user_mentions (group_id, user_id)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_user_mentions")
@@ -0,0 +1,45 @@
+"""Add emoji usage rollup view
+
+Revision ID: e91f3a6c7b24
+Revises: c4b7e1a95d08
+Create Date: 2026-10-15 23:39:06.184523
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e91f3a6c7b24'
+down_revision: Union[str, None] = 'c4b7e1a95d08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Emoji attachment counts per group and placeholder, used by emoji usage
+    # stats. Refreshed after each sync; see groupme_backup/db/rollups.py.
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW mv_emoji_usage AS
+        SELECT
+            group_id,
+            placeholder,
+            COUNT(*) AS emoji_count
+        FROM attachments
+        WHERE type = 'emoji'
+        AND placeholder IS NOT NULL
+        GROUP BY group_id, placeholder
+        """
+    )
+    # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute(
+        "CREATE UNIQUE INDEX idx_mv_emoji_usage_key "
+        "ON mv_emoji_usage (group_id, placeholder)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_emoji_usage")
@@ -0,0 +1,47 @@
+"""Add user aliases rollup view
+
+Revision ID: 333ef19b69ca
+Revises: e91f3a6c7b24
+Create Date: 2026-10-15 23:45:12.408317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '333ef19b69ca'
+down_revision: Union[str, None] = 'e91f3a6c7b24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Display name counts and message totals per group and user, used by
+    # the alias listings. Refreshed after each sync; see
+    # groupme_backup/db/rollups.py.
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW mv_user_aliases AS
+        SELECT
+            group_id,
+            user_id,
+            COUNT(DISTINCT name) AS alias_count,
+            COUNT(*) AS total_messages
+        FROM messages
+        WHERE user_id IS NOT NULL
+        AND name IS NOT NULL
+        GROUP BY group_id, user_id
+        """
+    )
+    # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute(
+        "CREATE UNIQUE INDEX idx_mv_user_aliases_key "
+        "ON mv_user_aliases (group_id, user_id)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_user_aliases")
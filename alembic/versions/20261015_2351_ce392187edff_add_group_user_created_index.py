@@ -0,0 +1,28 @@
+"""Add group/user/created_at covering index on messages
+
+Revision ID: ce392187edff
+Revises: 333ef19b69ca
+Create Date: 2026-10-15 23:51:40.726195
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ce392187edff'
+down_revision: Union[str, None] = '333ef19b69ca'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built concurrently so existing backups stay writable during the migration
+    with op.get_context().autocommit_block():
+        op.create_index('idx_messages_group_user_created', 'messages', ['group_id', 'user_id', 'created_at'], unique=False, postgresql_include=['name', 'text_len', 'system'], postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_messages_group_user_created', table_name='messages', postgresql_include=['name', 'text_len', 'system'])
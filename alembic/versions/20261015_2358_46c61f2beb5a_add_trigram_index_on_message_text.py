@@ -0,0 +1,30 @@
+"""Add trigram index on message text
+
+Revision ID: 46c61f2beb5a
+Revises: ce392187edff
+Create Date: 2026-10-15 23:58:19.530871
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '46c61f2beb5a'
+down_revision: Union[str, None] = 'ce392187edff'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Built concurrently so existing backups stay writable during the migration
+    with op.get_context().autocommit_block():
+        op.create_index('idx_messages_text_trgm', 'messages', ['text'], unique=False, postgresql_using='gin', postgresql_ops={'text': 'gin_trgm_ops'}, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    # The pg_trgm extension is left installed; other objects may depend on it
+    op.drop_index('idx_messages_text_trgm', table_name='messages', postgresql_using='gin', postgresql_ops={'text': 'gin_trgm_ops'})
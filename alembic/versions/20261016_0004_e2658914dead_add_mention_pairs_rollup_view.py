@@ -0,0 +1,48 @@
+"""Add mention pairs rollup view
+
+Revision ID: e2658914dead
+Revises: 46c61f2beb5a
+Create Date: 2026-10-16 00:04:47.318260
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2658914dead'
+down_revision: Union[str, None] = '46c61f2beb5a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Mention counts per group, mentioning user (and the name they posted
+    # under) and mentioned user, used by who-mentions-who. Refreshed after
+    # each sync; see groupme_backup/db/rollups.py.
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW mv_mention_pairs AS
+        SELECT
+            m.group_id,
+            m.user_id AS mentioner_id,
+            COALESCE(NULLIF(m.name, ''), 'Unknown') AS mentioner_name,
+            mn.user_id AS mentioned_id,
+            COUNT(*) AS mention_count
+        FROM mentions mn
+        JOIN messages m ON mn.message_id = m.id
+        WHERE m.user_id IS NOT NULL
+        GROUP BY m.group_id, m.user_id, mentioner_name, mn.user_id
+        """
+    )
+    # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute(
+        "CREATE UNIQUE INDEX idx_mv_mention_pairs_key "
+        "ON mv_mention_pairs (group_id, mentioner_id, mentioner_name, mentioned_id)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_mention_pairs")
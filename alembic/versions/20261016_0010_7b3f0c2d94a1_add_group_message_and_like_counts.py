@@ -0,0 +1,46 @@
+"""Add message and like counts to groups
+
+Revision ID: 7b3f0c2d94a1
+Revises: e2658914dead
+Create Date: 2026-10-16 00:10:27.318406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b3f0c2d94a1'
+down_revision: Union[str, None] = 'e2658914dead'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Kept up to date by the sync from here on; backfilled once for existing groups
+    op.add_column('groups', sa.Column('message_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('groups', sa.Column('like_count', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        """
+        UPDATE groups g
+        SET message_count = (
+            SELECT COUNT(*)
+            FROM messages m
+            WHERE m.group_id = g.id
+            AND m.system = FALSE
+        ),
+        like_count = (
+            SELECT COUNT(*)
+            FROM message_favorites mf
+            JOIN messages m ON mf.message_id = m.id
+            WHERE m.group_id = g.id
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('groups', 'like_count')
+    op.drop_column('groups', 'message_count')
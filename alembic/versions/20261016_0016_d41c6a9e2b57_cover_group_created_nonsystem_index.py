@@ -0,0 +1,32 @@
+"""Cover id and user_id in the non-system group/created_at index
+
+Revision ID: d41c6a9e2b57
+Revises: 7b3f0c2d94a1
+Create Date: 2026-10-16 00:16:05.942117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41c6a9e2b57'
+down_revision: Union[str, None] = '7b3f0c2d94a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The covering index is built before the old one is dropped, and both
+    # concurrently, so date-window queries always have an index to use
+    with op.get_context().autocommit_block():
+        op.create_index('idx_messages_group_created_nonsystem_cover', 'messages', ['group_id', 'created_at'], unique=False, postgresql_include=['id', 'user_id'], postgresql_where=sa.text('system = FALSE'), postgresql_concurrently=True)
+        op.drop_index('idx_messages_group_created_nonsystem', table_name='messages', postgresql_where=sa.text('system = FALSE'), postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('idx_messages_group_created_nonsystem', 'messages', ['group_id', 'created_at'], unique=False, postgresql_where=sa.text('system = FALSE'), postgresql_concurrently=True)
+        op.drop_index('idx_messages_group_created_nonsystem_cover', table_name='messages', postgresql_include=['id', 'user_id'], postgresql_where=sa.text('system = FALSE'), postgresql_concurrently=True)
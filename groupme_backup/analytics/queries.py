@@ -1,21 +1,147 @@
 """Analytics query functions for GroupMe data."""
 
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
-
-from sqlalchemy import desc, func, text
+import copy
+import functools
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+from sqlalchemy import Result, Row, Select, bindparam, desc, exists, func, literal, select, text
 from sqlalchemy.orm import Session
 
+from ..config.settings import get_settings
 from ..db.models import Attachment, Group, Message, MessageFavorite, User
+from ..utils.cache import DiskCache, TTLCache
+
+T = TypeVar("T")
+_MISSING = object()
+
+# Aggregate results keyed by (database, function, group_id, args,
+# last_synced_at); a new sync changes the key, so stale entries are never
+# returned and simply age out.
+_results_cache = TTLCache(maxsize=512, ttl=60)
+
+# Same keys, persisted so a new CLI invocation can skip the query as well
+DISK_CACHE_DIR = Path.home() / ".cache" / "groupme-backup" / "analytics"
+_disk_cache: Optional[DiskCache] = None
+
+
+def _get_disk_cache() -> Optional[DiskCache]:
+    """Get the on-disk results cache, or None when it is disabled."""
+    global _disk_cache
+    ttl = get_settings().analytics_disk_cache_ttl
+    if not ttl:
+        return None
+    if _disk_cache is None:
+        _disk_cache = DiskCache(DISK_CACHE_DIR, ttl=ttl)
+    return _disk_cache
+
+
+def clear_results_cache() -> None:
+    """
+    Drop every memoized analytics result, in memory and on disk.
+
+    Called after the rollup views are refreshed: a sync updates
+    last_synced_at before the refresh, so rollup-backed results cached in
+    between carry the new key but the old data.
+    """
+    _results_cache.clear()
+    disk_cache = _get_disk_cache()
+    if disk_cache is not None:
+        disk_cache.clear()
+
+
+_LAST_SYNCED_AT = select(Group.last_synced_at).where(Group.id == bindparam("group_id"))
+
+
+def _database_key() -> Tuple[str, int, str]:
+    """Identify the configured database, so caches never mix two databases."""
+    settings = get_settings()
+    return (settings.db_host, settings.db_port, settings.db_name)
+
+
+def _memoized(fn: Callable[..., T]) -> Callable[..., T]:
+    """
+    Cache an analytics function's result per (database, group_id, args,
+    last_synced_at).
+
+    The wrapped function must take (session, group_id, ...) and return plain
+    data. A hit costs one primary-key lookup on groups instead of the full
+    aggregate; results are deep-copied so callers can mutate them freely.
+    Misses in memory fall back to the on-disk cache before running the query.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(session: Session, group_id: str, *args: Any, **kwargs: Any) -> T:
+        last_synced_at = session.scalar(_LAST_SYNCED_AT, {"group_id": group_id})
+        cache_key = (
+            _database_key(),
+            fn.__name__,
+            group_id,
+            args,
+            tuple(sorted(kwargs.items())),
+            last_synced_at,
+        )
+        cached = _results_cache.get(cache_key, _MISSING)
+        if cached is not _MISSING:
+            return cast(T, copy.deepcopy(cached))
+
+        disk_cache = _get_disk_cache()
+        if disk_cache is not None:
+            cached = disk_cache.get(cache_key, _MISSING)
+            if cached is not _MISSING:
+                _results_cache.set(cache_key, cached)
+                return cast(T, copy.deepcopy(cached))
+
+        result = fn(session, group_id, *args, **kwargs)
+        _results_cache.set(cache_key, copy.deepcopy(result))
+        if disk_cache is not None:
+            disk_cache.set(cache_key, result)
+        return result
+
+    return wrapper
+
+
+def _as_dicts(result: Result) -> List[Dict[str, Any]]:
+    """
+    Convert result rows to dictionaries keyed by column name.
+
+    Zipping the column keys with each plain row tuple avoids building a
+    RowMapping per row, which roughly halves conversion time on large results.
+    """
+    keys = list(result.keys())
+    return [dict(zip(keys, row, strict=True)) for row in result]
+
+
+def _cutoff(days: int) -> datetime:
+    """
+    Return the UTC timestamp `days` days before now.
+
+    Always passed to queries as the bound :cutoff parameter, never inlined,
+    so every `days` value shares one statement and server-side plan.
+    """
+    return datetime.now(timezone.utc) - timedelta(days=days)
 
 
-def format_message_with_attachments(text: Optional[str], attachments: List[Attachment]) -> str:
+def format_message_with_attachments(text: Optional[str], attachments: Iterable[Any]) -> str:
     """
     Format message text with attachment indicators and URLs.
 
     Args:
         text: Message text (can be None)
-        attachments: List of Attachment objects
+        attachments: Attachment objects or rows with ``type`` and ``url``
 
     Returns:
         Formatted text with emoji indicators and attachment URLs
@@ -56,6 +182,96 @@ def format_message_with_attachments(text: Optional[str], attachments: List[Attac
     return base_text
 
 
+# Queries are built once at import, as select() statements or text() constants
+# with bound parameters (group_id, cutoff, limit). Each call then skips
+# statement construction and reuses the engine's compiled-statement cache entry.
+
+# Longest message text the CLI displays (200 characters) plus room to detect
+# that it was cut; longer bodies are truncated in SQL so they never cross the wire
+_MESSAGE_TEXT_MAX = 210
+
+# Message text is cut to a preview in SQL so KB-sized messages are not sent
+# over the wire only to be truncated for display
+_TEXT_PREVIEW_LEN = 60
+
+# Read paths select plain columns rather than Message entities, so rows skip
+# identity-map bookkeeping and attachments never lazy-load one message at a time
+_MESSAGE_COLUMNS = (
+    Message.id,
+    func.substr(Message.text, 1, _MESSAGE_TEXT_MAX).label("text"),
+    Message.name,
+    Message.user_id,
+    Message.created_at,
+)
+
+_ATTACHMENTS_FOR_MESSAGES = (
+    select(Attachment.message_id, Attachment.type, Attachment.url)
+    .where(Attachment.message_id.in_(bindparam("message_ids", expanding=True)))
+    .order_by(Attachment.id)
+)
+
+
+def _attachments_by_message(
+    session: Session, message_ids: List[str]
+) -> Dict[str, List[Row]]:
+    """Load attachment type/url rows for many messages in one query."""
+    attachments: Dict[str, List[Row]] = {}
+    if not message_ids:
+        return attachments
+    for att in session.execute(_ATTACHMENTS_FOR_MESSAGES, {"message_ids": message_ids}):
+        attachments.setdefault(att.message_id, []).append(att)
+    return attachments
+
+
+# popular shows 60 characters of each message; one more is enough to tell the
+# CLI the text was cut, so the rest of the body is never sent
+_POPULAR_TEXT_MAX = 61
+
+_POPULAR_MESSAGE_COLUMNS = (
+    Message.id,
+    func.substr(Message.text, 1, _POPULAR_TEXT_MAX).label("text"),
+    Message.name,
+    Message.user_id,
+    Message.created_at,
+)
+
+# Aggregate from message_favorites so only liked messages are grouped and
+# sorted; unliked messages never enter the top-N sort.
+_POPULAR_MESSAGE_IDS = (
+    select(
+        MessageFavorite.message_id.label("id"),
+        func.count().label("like_count"),
+    )
+    .join(Message, Message.id == MessageFavorite.message_id)
+    .where(Message.group_id == bindparam("group_id"))
+    .where(Message.created_at >= bindparam("cutoff"))
+    .where(Message.system == False)
+    .group_by(MessageFavorite.message_id)
+    .order_by(desc("like_count"))
+    .limit(bindparam("limit"))
+    .subquery()
+)
+
+_MOST_POPULAR_MESSAGES = (
+    select(*_POPULAR_MESSAGE_COLUMNS, _POPULAR_MESSAGE_IDS.c.like_count)
+    .join(_POPULAR_MESSAGE_IDS, Message.id == _POPULAR_MESSAGE_IDS.c.id)
+    .order_by(desc(_POPULAR_MESSAGE_IDS.c.like_count))
+)
+
+# Fills the remaining slots with zero-like messages when fewer than `limit`
+# messages in the window were liked at all.
+_UNLIKED_MESSAGES = (
+    select(*_POPULAR_MESSAGE_COLUMNS, literal(0).label("like_count"))
+    .where(Message.group_id == bindparam("group_id"))
+    .where(Message.created_at >= bindparam("cutoff"))
+    .where(Message.system == False)
+    .where(~exists().where(MessageFavorite.message_id == Message.id))
+    .order_by(desc(Message.created_at))
+    .limit(bindparam("limit"))
+)
+
+
+@_memoized
 def get_most_popular_messages(
     session: Session, group_id: str, days: int = 7, limit: int = 10
 ) -> List[Dict[str, Any]]:
@@ -69,61 +285,105 @@ def get_most_popular_messages(
         limit: Maximum number of results
 
     Returns:
-        List of dictionaries with message info and like counts
+        List of dictionaries with message info and like counts; text is cut
+        to _POPULAR_TEXT_MAX characters
     """
-    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    cutoff = _cutoff(days)
 
-    # First get message IDs with like counts
-    subquery = (
-        session.query(
-            Message.id,
-            func.count(MessageFavorite.user_id).label("like_count"),
-        )
-        .outerjoin(MessageFavorite, Message.id == MessageFavorite.message_id)
-        .filter(Message.group_id == group_id)
-        .filter(Message.created_at >= cutoff)
-        .filter(Message.system == False)
-        .group_by(Message.id)
-        .order_by(desc("like_count"))
-        .limit(limit)
-        .subquery()
-    )
+    # Top liked message IDs, joined back to the message columns
+    rows = list(session.execute(
+        _MOST_POPULAR_MESSAGES,
+        {"group_id": group_id, "cutoff": cutoff, "limit": limit},
+    ))
 
-    # Then fetch full message objects with attachments
-    messages = (
-        session.query(Message)
-        .join(subquery, Message.id == subquery.c.id)
-        .order_by(desc(subquery.c.like_count))
-        .all()
-    )
+    if len(rows) < limit:
+        rows.extend(session.execute(
+            _UNLIKED_MESSAGES,
+            {"group_id": group_id, "cutoff": cutoff, "limit": limit - len(rows)},
+        ))
 
-    results = []
-    for msg in messages:
-        like_count = (
-            session.query(func.count(MessageFavorite.user_id))
-            .filter(MessageFavorite.message_id == msg.id)
-            .scalar()
-        )
-        results.append(
-            {
-                "message_id": msg.id,
-                "text": format_message_with_attachments(msg.text, msg.attachments),
-                "sender_name": msg.name or "Unknown",
-                "created_at": msg.created_at,
-                "like_count": like_count,
-            }
-        )
+    attachments = _attachments_by_message(session, [row.id for row in rows])
 
-    return results
+    return [
+        {
+            "message_id": row.id,
+            "text": format_message_with_attachments(row.text, attachments.get(row.id, ())),
+            "sender_name": row.name or "Unknown",
+            "created_at": row.created_at,
+            "like_count": row.like_count,
+        }
+        for row in rows
+    ]
 
 
+_LONGEST_CONSECUTIVE_STREAK = text(
+    """
+WITH message_groups AS (
+    SELECT
+        m.id,
+        m.user_id,
+        m.name,
+        m.created_at,
+        CASE
+            WHEN m.user_id != prev.user_id OR prev.user_id IS NULL
+            THEN 1
+            ELSE 0
+        END AS is_new_group
+    FROM messages m
+    LEFT JOIN LATERAL (
+        SELECT p.user_id
+        FROM messages p
+        WHERE p.group_id = m.group_id
+        AND p.system = FALSE
+        AND p.created_at < m.created_at
+        ORDER BY p.created_at DESC
+        LIMIT 1
+    ) prev ON TRUE
+    WHERE m.group_id = :group_id
+    AND m.system = FALSE
+),
+streak_groups AS (
+    SELECT
+        id,
+        user_id,
+        name,
+        created_at,
+        SUM(is_new_group) OVER (ORDER BY created_at) AS streak_id
+    FROM message_groups
+),
+streak_counts AS (
+    SELECT
+        user_id,
+        name,
+        streak_id,
+        COUNT(*) AS consecutive_count,
+        MIN(created_at) AS streak_start,
+        MAX(created_at) AS streak_end
+    FROM streak_groups
+    GROUP BY user_id, name, streak_id
+)
+SELECT
+    user_id,
+    name,
+    consecutive_count,
+    streak_start,
+    streak_end
+FROM streak_counts
+ORDER BY consecutive_count DESC
+LIMIT 1;
+"""
+)
+
+
+@_memoized
 def get_longest_consecutive_streak(
     session: Session, group_id: str
 ) -> Dict[str, Any] | None:
     """
     Find the longest consecutive message streak by a single user.
 
-    Uses window functions to identify message runs.
+    Each message's predecessor is found with a LATERAL lookup on the partial
+    non-system (group_id, created_at) index rather than a LAG() window sort.
 
     Args:
         session: Database session
@@ -132,71 +392,32 @@ def get_longest_consecutive_streak(
     Returns:
         Dictionary with streak information or None
     """
-    sql = text(
-        """
-    WITH message_groups AS (
-        SELECT
-            id,
-            user_id,
-            name,
-            created_at,
-            CASE
-                WHEN user_id != LAG(user_id) OVER (ORDER BY created_at)
-                    OR LAG(user_id) OVER (ORDER BY created_at) IS NULL
-                THEN 1
-                ELSE 0
-            END AS is_new_group
-        FROM messages
-        WHERE group_id = :group_id
-        AND system = FALSE
-        ORDER BY created_at
-    ),
-    streak_groups AS (
-        SELECT
-            id,
-            user_id,
-            name,
-            created_at,
-            SUM(is_new_group) OVER (ORDER BY created_at) AS streak_id
-        FROM message_groups
-    ),
-    streak_counts AS (
-        SELECT
-            user_id,
-            name,
-            streak_id,
-            COUNT(*) AS consecutive_count,
-            MIN(created_at) AS streak_start,
-            MAX(created_at) AS streak_end
-        FROM streak_groups
-        GROUP BY user_id, name, streak_id
-    )
-    SELECT
-        user_id,
-        name,
-        consecutive_count,
-        streak_start,
-        streak_end
-    FROM streak_counts
-    ORDER BY consecutive_count DESC
-    LIMIT 1;
-    """
+    result = (
+        session.execute(_LONGEST_CONSECUTIVE_STREAK, {"group_id": group_id})
+        .mappings()
+        .first()
     )
 
-    result = session.execute(sql, {"group_id": group_id}).fetchone()
+    return dict(result) if result else None
 
-    if result:
-        return {
-            "user_id": result[0],
-            "name": result[1],
-            "consecutive_count": result[2],
-            "streak_start": result[3],
-            "streak_end": result[4],
-        }
 
-    return None
+_MOST_ACTIVE_USERS = (
+    select(
+        User.id.label("user_id"),
+        func.coalesce(func.nullif(User.name, ""), "Unknown").label("name"),
+        func.count(Message.id).label("message_count"),
+    )
+    .join(Message, User.id == Message.user_id)
+    .where(Message.group_id == bindparam("group_id"))
+    .where(Message.created_at >= bindparam("cutoff"))
+    .where(Message.system == False)
+    .group_by(User.id, User.name)
+    .order_by(desc("message_count"))
+    .limit(bindparam("limit"))
+)
 
 
+@_memoized
 def get_most_active_users(
     session: Session, group_id: str, days: int = 30, limit: int = 10
 ) -> List[Dict[str, Any]]:
@@ -212,36 +433,34 @@ def get_most_active_users(
     Returns:
         List of dictionaries with user info and message counts
     """
-    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    cutoff = _cutoff(days)
 
-    query = (
-        session.query(
-            User.id,
-            User.name,
-            func.count(Message.id).label("message_count"),
-        )
-        .join(Message, User.id == Message.user_id)
-        .filter(Message.group_id == group_id)
-        .filter(Message.created_at >= cutoff)
-        .filter(Message.system == False)
-        .group_by(User.id, User.name)
-        .order_by(desc("message_count"))
-        .limit(limit)
+    rows = session.execute(
+        _MOST_ACTIVE_USERS,
+        {"group_id": group_id, "cutoff": cutoff, "limit": limit},
     )
 
-    results = []
-    for row in query.all():
-        results.append(
-            {
-                "user_id": row.id,
-                "name": row.name or "Unknown",
-                "message_count": row.message_count,
-            }
-        )
-
-    return results
+    return _as_dicts(rows)
 
 
+_MOST_LIKED_USERS = (
+    select(
+        User.id.label("user_id"),
+        func.coalesce(func.nullif(User.name, ""), "Unknown").label("name"),
+        func.count(MessageFavorite.user_id).label("total_likes"),
+    )
+    .join(Message, User.id == Message.user_id)
+    .join(MessageFavorite, Message.id == MessageFavorite.message_id)
+    .where(Message.group_id == bindparam("group_id"))
+    .where(Message.created_at >= bindparam("cutoff"))
+    .where(Message.system == False)
+    .group_by(User.id, User.name)
+    .order_by(desc("total_likes"))
+    .limit(bindparam("limit"))
+)
+
+
+@_memoized
 def get_most_liked_users(
     session: Session, group_id: str, days: int = 30, limit: int = 10
 ) -> List[Dict[str, Any]]:
@@ -257,41 +476,53 @@ def get_most_liked_users(
     Returns:
         List of dictionaries with user info and total likes
     """
-    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    cutoff = _cutoff(days)
 
-    query = (
-        session.query(
-            User.id,
-            User.name,
-            func.count(MessageFavorite.user_id).label("total_likes"),
-        )
-        .join(Message, User.id == Message.user_id)
-        .join(MessageFavorite, Message.id == MessageFavorite.message_id)
-        .filter(Message.group_id == group_id)
-        .filter(Message.created_at >= cutoff)
-        .filter(Message.system == False)
-        .group_by(User.id, User.name)
-        .order_by(desc("total_likes"))
-        .limit(limit)
+    rows = session.execute(
+        _MOST_LIKED_USERS,
+        {"group_id": group_id, "cutoff": cutoff, "limit": limit},
     )
 
-    results = []
-    for row in query.all():
-        results.append(
-            {
-                "user_id": row.id,
-                "name": row.name or "Unknown",
-                "total_likes": row.total_likes,
-            }
-        )
+    return _as_dicts(rows)
 
-    return results
+
+# One round trip: the group row, with the message and like totals the sync
+# keeps on it, plus an index-only scan for users and the date range
+_GROUP_STATISTICS = text(
+    """
+SELECT
+    g.name AS group_name,
+    g.last_synced_at,
+    g.message_count AS total_messages,
+    g.like_count AS total_likes,
+    s.total_users,
+    s.first_message,
+    s.last_message,
+    CAST(g.message_count AS FLOAT)
+        / (EXTRACT(DAY FROM s.last_message - s.first_message) + 1)
+        AS avg_messages_per_day
+FROM groups g
+CROSS JOIN LATERAL (
+    SELECT
+        COUNT(DISTINCT user_id) AS total_users,
+        MIN(created_at) AS first_message,
+        MAX(created_at) AS last_message
+    FROM messages
+    WHERE group_id = g.id
+    AND system = FALSE
+) s
+WHERE g.id = :group_id;
+"""
+)
 
 
 def get_group_statistics(session: Session, group_id: str) -> Dict[str, Any]:
     """
     Get general statistics for a group.
 
+    Every figure comes from a single query, so the command costs one round
+    trip whether or not it has run before in this process.
+
     Args:
         session: Database session
         group_id: Group ID to analyze
@@ -299,72 +530,52 @@ def get_group_statistics(session: Session, group_id: str) -> Dict[str, Any]:
     Returns:
         Dictionary with various statistics
     """
-    # Get group info
-    group = session.query(Group).filter(Group.id == group_id).first()
+    row = session.execute(_GROUP_STATISTICS, {"group_id": group_id}).one_or_none()
 
-    if not group:
+    if not row:
         return {"error": "Group not found"}
 
-    # Total messages
-    total_messages = (
-        session.query(func.count(Message.id))
-        .filter(Message.group_id == group_id)
-        .filter(Message.system == False)
-        .scalar()
-    )
-
-    # Total users
-    total_users = (
-        session.query(func.count(func.distinct(Message.user_id)))
-        .filter(Message.group_id == group_id)
-        .filter(Message.system == False)
-        .scalar()
-    )
+    return {
+        "group_name": row.group_name,
+        "total_messages": row.total_messages,
+        "total_users": row.total_users,
+        "total_likes": row.total_likes,
+        "first_message": row.first_message,
+        "last_message": row.last_message,
+        "avg_messages_per_day": round(row.avg_messages_per_day or 0, 2),
+        "last_synced_at": row.last_synced_at,
+    }
 
-    # Total likes
-    total_likes = (
-        session.query(func.count(MessageFavorite.user_id))
-        .join(Message, MessageFavorite.message_id == Message.id)
-        .filter(Message.group_id == group_id)
-        .scalar()
-    )
 
-    # Date range
-    date_range = (
-        session.query(
-            func.min(Message.created_at).label("first_message"),
-            func.max(Message.created_at).label("last_message"),
-        )
-        .filter(Message.group_id == group_id)
-        .filter(Message.system == False)
-        .first()
+# Up to 168 cells, aggregated into one JSON array so the driver decodes a
+# single value instead of building a row per cell.
+# day_of_week: 0=Sunday, 6=Saturday; hour_of_day: 0-23
+_HOURLY_ACTIVITY_HEATMAP = text(
+    """
+SELECT json_agg(
+    json_build_object(
+        'day_of_week', day_of_week,
+        'hour_of_day', hour_of_day,
+        'message_count', message_count
     )
-
-    # Average messages per day
-    if date_range and date_range.first_message and date_range.last_message:
-        days_span = (date_range.last_message - date_range.first_message).days + 1
-        avg_messages_per_day = total_messages / days_span if days_span > 0 else 0
-    else:
-        avg_messages_per_day = 0
-
-    return {
-        "group_name": group.name,
-        "total_messages": total_messages,
-        "total_users": total_users,
-        "total_likes": total_likes,
-        "first_message": date_range.first_message if date_range else None,
-        "last_message": date_range.last_message if date_range else None,
-        "avg_messages_per_day": round(avg_messages_per_day, 2),
-        "last_synced_at": group.last_synced_at,
-    }
+    ORDER BY day_of_week, hour_of_day
+)
+FROM mv_hourly_activity
+WHERE group_id = :group_id;
+"""
+)
 
 
+@_memoized
 def get_hourly_activity_heatmap(
     session: Session, group_id: str
 ) -> List[Dict[str, Any]]:
     """
     Get message count by hour of day and day of week.
 
+    Reads from the mv_hourly_activity rollup, which is refreshed after each
+    sync, so counts reflect the most recent backup rather than live data.
+
     Args:
         session: Database session
         group_id: Group ID to analyze
@@ -372,37 +583,43 @@ def get_hourly_activity_heatmap(
     Returns:
         List of dictionaries with day, hour, and message count
     """
-    sql = text(
-        """
-    SELECT
-        EXTRACT(DOW FROM created_at)::INTEGER AS day_of_week,
-        EXTRACT(HOUR FROM created_at)::INTEGER AS hour_of_day,
-        COUNT(*) AS message_count
-    FROM messages
-    WHERE group_id = :group_id
-    AND system = FALSE
-    GROUP BY day_of_week, hour_of_day
-    ORDER BY day_of_week, hour_of_day;
-    """
+    return (
+        session.execute(_HOURLY_ACTIVITY_HEATMAP, {"group_id": group_id}).scalar()
+        or []
     )
 
-    results = []
-    for row in session.execute(sql, {"group_id": group_id}):
-        results.append(
-            {
-                "day_of_week": row[0],  # 0=Sunday, 6=Saturday
-                "hour_of_day": row[1],  # 0-23
-                "message_count": row[2],
-            }
-        )
-
-    return results
-
 
+_RESPONSE_TIME_ANALYSIS = text(
+    """
+WITH message_gaps AS (
+    SELECT EXTRACT(EPOCH FROM (
+        created_at - LAG(created_at) OVER (ORDER BY created_at)
+    )) AS gap_seconds
+    FROM messages
+    WHERE group_id = :group_id
+    AND system = FALSE
+)
+SELECT
+    AVG(gap_seconds) AS avg_gap_seconds,
+    MIN(gap_seconds) AS min_gap_seconds,
+    MAX(gap_seconds) AS max_gap_seconds,
+    PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY gap_seconds) AS median_gap_seconds
+FROM message_gaps
+WHERE gap_seconds IS NOT NULL
+AND gap_seconds > 0;
+"""
+)
+
+
+@_memoized
 def get_response_time_analysis(session: Session, group_id: str) -> Dict[str, Any]:
     """
     Analyze average time between messages (conversation pace).
 
+    Gaps are computed with LAG() in one ordered pass over the partial
+    non-system (group_id, created_at) index, as in get_dashboard_bundle, and
+    the average, extremes and median are all aggregated in SQL.
+
     Args:
         session: Database session
         group_id: Group ID to analyze
@@ -410,32 +627,7 @@ def get_response_time_analysis(session: Session, group_id: str) -> Dict[str, Any
     Returns:
         Dictionary with response time statistics
     """
-    sql = text(
-        """
-    WITH message_gaps AS (
-        SELECT
-            id,
-            created_at,
-            LAG(created_at) OVER (ORDER BY created_at) AS prev_message_time,
-            EXTRACT(EPOCH FROM (
-                created_at - LAG(created_at) OVER (ORDER BY created_at)
-            )) AS gap_seconds
-        FROM messages
-        WHERE group_id = :group_id
-        AND system = FALSE
-    )
-    SELECT
-        AVG(gap_seconds) AS avg_gap_seconds,
-        MIN(gap_seconds) AS min_gap_seconds,
-        MAX(gap_seconds) AS max_gap_seconds,
-        PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY gap_seconds) AS median_gap_seconds
-    FROM message_gaps
-    WHERE gap_seconds IS NOT NULL
-    AND gap_seconds > 0;
-    """
-    )
-
-    result = session.execute(sql, {"group_id": group_id}).fetchone()
+    result = session.execute(_RESPONSE_TIME_ANALYSIS, {"group_id": group_id}).fetchone()
 
     if result and result[0] is not None:
         return {
@@ -461,21 +653,19 @@ def get_response_time_analysis(session: Session, group_id: str) -> Dict[str, Any
 # TIME-BASED ANALYTICS
 # ============================================================================
 
+_PEAK_ACTIVITY_TIMES = text("""
+SELECT day_of_week, hour_of_day, message_count
+FROM mv_hourly_activity
+WHERE group_id = :group_id
+ORDER BY message_count DESC
+LIMIT 1;
+""")
+
+
+@_memoized
 def get_peak_activity_times(session: Session, group_id: str) -> Dict[str, Any]:
-    """Get peak activity times (most active hour and day)."""
-    sql = text("""
-    SELECT 
-        EXTRACT(DOW FROM created_at)::INTEGER AS day_of_week,
-        EXTRACT(HOUR FROM created_at)::INTEGER AS hour_of_day,
-        COUNT(*) AS message_count
-    FROM messages
-    WHERE group_id = :group_id AND system = FALSE
-    GROUP BY day_of_week, hour_of_day
-    ORDER BY message_count DESC
-    LIMIT 1;
-    """)
-    
-    result = session.execute(sql, {"group_id": group_id}).fetchone()
+    """Get peak activity times (most active hour and day, from mv_hourly_activity)."""
+    result = session.execute(_PEAK_ACTIVITY_TIMES, {"group_id": group_id}).fetchone()
     
     if result:
         days = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
@@ -487,423 +677,537 @@ def get_peak_activity_times(session: Session, group_id: str) -> Dict[str, Any]:
     return {}
 
 
+_DAILY_MESSAGE_TREND = text("""
+SELECT
+    d.day::DATE AS date,
+    COALESCE(c.message_count, 0) AS message_count
+FROM generate_series(CAST(:cutoff AS DATE), CURRENT_DATE, INTERVAL '1 day') AS d(day)
+LEFT JOIN (
+    SELECT DATE(created_at) AS day, COUNT(*) AS message_count
+    FROM messages
+    WHERE group_id = :group_id
+      AND system = FALSE
+      AND created_at >= :cutoff
+    GROUP BY 1
+) c ON c.day = d.day::DATE
+ORDER BY d.day;
+""")
+
+
+@_memoized
 def get_daily_message_trend(
     session: Session, group_id: str, days: int = 30
 ) -> List[Dict[str, Any]]:
-    """Get daily message counts for trend analysis."""
-    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    """Get daily message counts for trend analysis, including zero days."""
+    cutoff = _cutoff(days)
     
-    sql = text("""
-    SELECT 
-        DATE(created_at) AS message_date,
-        COUNT(*) AS message_count
+    rows = session.execute(
+        _DAILY_MESSAGE_TREND,
+        {"group_id": group_id, "cutoff": cutoff},
+        execution_options={"yield_per": 1000},
+    )
+
+    return _as_dicts(rows)
+
+
+_DASHBOARD_BUNDLE = text("""
+WITH base AS (
+    SELECT id, user_id, created_at
     FROM messages
-    WHERE group_id = :group_id 
-      AND system = FALSE
-      AND created_at >= :cutoff
-    GROUP BY message_date
-    ORDER BY message_date;
-    """)
-    
-    results = []
-    for row in session.execute(sql, {"group_id": group_id, "cutoff": cutoff}):
-        results.append({
-            "date": row[0],
-            "message_count": row[1],
-        })
-    
-    return results
+    WHERE group_id = :group_id AND system = FALSE
+),
+hourly AS (
+    SELECT
+        EXTRACT(DOW FROM created_at)::INTEGER AS day_of_week,
+        EXTRACT(HOUR FROM created_at)::INTEGER AS hour_of_day,
+        COUNT(*) AS message_count
+    FROM base
+    GROUP BY 1, 2
+),
+peak AS (
+    SELECT day_of_week, hour_of_day, message_count
+    FROM hourly
+    ORDER BY message_count DESC
+    LIMIT 1
+),
+daily AS (
+    SELECT d.day::DATE AS date, COALESCE(c.message_count, 0) AS message_count
+    FROM generate_series(CAST(:cutoff AS DATE), CURRENT_DATE, INTERVAL '1 day') AS d(day)
+    LEFT JOIN (
+        SELECT DATE(created_at) AS day, COUNT(*) AS message_count
+        FROM base
+        WHERE created_at >= :cutoff
+        GROUP BY 1
+    ) c ON c.day = d.day::DATE
+),
+gaps AS (
+    SELECT EXTRACT(EPOCH FROM (
+        created_at - LAG(created_at) OVER (ORDER BY created_at)
+    )) AS gap_seconds
+    FROM base
+),
+totals AS (
+    SELECT
+        COUNT(*) AS total_messages,
+        COUNT(DISTINCT user_id) AS total_users,
+        MIN(created_at) AS first_message,
+        MAX(created_at) AS last_message
+    FROM base
+)
+SELECT
+    g.name AS group_name,
+    g.last_synced_at,
+    t.total_messages,
+    t.total_users,
+    t.first_message,
+    t.last_message,
+    g.like_count AS total_likes,
+    (SELECT day_of_week FROM peak) AS peak_day_of_week,
+    (SELECT hour_of_day FROM peak) AS peak_hour,
+    (SELECT message_count FROM peak) AS peak_message_count,
+    (
+        SELECT json_agg(hourly ORDER BY day_of_week, hour_of_day)
+        FROM hourly
+    ) AS heatmap,
+    (
+        SELECT json_agg(json_build_object(
+            'date', daily.date,
+            'message_count', daily.message_count
+        ) ORDER BY daily.date)
+        FROM daily
+    ) AS trend,
+    (
+        SELECT json_agg(i ORDER BY i.image_count DESC)
+        FROM (
+            SELECT
+                u.id AS user_id,
+                COALESCE(NULLIF(u.name, ''), 'Unknown') AS name,
+                COUNT(a.id) AS image_count
+            FROM attachments a
+            JOIN messages m ON a.message_id = m.id
+            JOIN users u ON m.user_id = u.id
+            WHERE m.group_id = :group_id AND a.type = 'image'
+            GROUP BY u.id, u.name
+            ORDER BY image_count DESC
+            LIMIT :limit
+        ) i
+    ) AS images,
+    (
+        SELECT json_agg(t ORDER BY t.count DESC)
+        FROM (
+            SELECT a.type, COUNT(a.id) AS count
+            FROM attachments a
+            JOIN messages m ON a.message_id = m.id
+            WHERE m.group_id = :group_id
+            GROUP BY a.type
+        ) t
+    ) AS attachments,
+    gap.avg_gap_seconds,
+    gap.min_gap_seconds,
+    gap.max_gap_seconds,
+    gap.median_gap_seconds
+FROM groups g
+CROSS JOIN totals t
+CROSS JOIN (
+    SELECT
+        AVG(gap_seconds) AS avg_gap_seconds,
+        MIN(gap_seconds) AS min_gap_seconds,
+        MAX(gap_seconds) AS max_gap_seconds,
+        PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY gap_seconds) AS median_gap_seconds
+    FROM gaps
+    WHERE gap_seconds > 0
+) gap
+WHERE g.id = :group_id;
+""")
+
+
+@_memoized
+def get_dashboard_bundle(
+    session: Session, group_id: str, days: int = 30, limit: int = 10
+) -> Dict[str, Any]:
+    """
+    Get statistics, peak time, heatmap, trend, pace and attachments in one round-trip.
+
+    Every message section is computed from a single CTE over the group's
+    messages, so unlike the individual functions the heatmap reflects live
+    data rather than the rollup view.
+
+    Args:
+        session: Database session
+        group_id: Group ID to analyze
+        days: Number of days to include in the daily trend
+        limit: Maximum number of image sharers to include
+
+    Returns:
+        Dictionary with "statistics", "peak", "heatmap", "trend",
+        "response_time", "images" and "attachments" sections, shaped like
+        the corresponding functions
+    """
+    cutoff = _cutoff(days)
+
+    row = session.execute(
+        _DASHBOARD_BUNDLE, {"group_id": group_id, "cutoff": cutoff, "limit": limit}
+    ).first()
+
+    if not row:
+        return {"error": "Group not found"}
+
+    if row.first_message and row.last_message:
+        days_span = (row.last_message - row.first_message).days + 1
+        avg_messages_per_day = row.total_messages / days_span if days_span > 0 else 0
+    else:
+        avg_messages_per_day = 0
+
+    if row.peak_message_count:
+        days_of_week = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
+        peak = {
+            "peak_day": days_of_week[row.peak_day_of_week],
+            "peak_hour": row.peak_hour,
+            "message_count": row.peak_message_count,
+        }
+    else:
+        peak = {}
+
+    if row.avg_gap_seconds is not None:
+        response_time = {
+            "avg_gap_seconds": float(row.avg_gap_seconds),
+            "min_gap_seconds": float(row.min_gap_seconds),
+            "max_gap_seconds": float(row.max_gap_seconds),
+            "median_gap_seconds": float(row.median_gap_seconds),
+            "avg_gap_minutes": float(row.avg_gap_seconds) / 60,
+            "median_gap_minutes": float(row.median_gap_seconds) / 60,
+        }
+    else:
+        response_time = {
+            "avg_gap_seconds": 0,
+            "min_gap_seconds": 0,
+            "max_gap_seconds": 0,
+            "median_gap_seconds": 0,
+            "avg_gap_minutes": 0,
+            "median_gap_minutes": 0,
+        }
+
+    return {
+        "statistics": {
+            "group_name": row.group_name,
+            "total_messages": row.total_messages,
+            "total_users": row.total_users,
+            "total_likes": row.total_likes,
+            "first_message": row.first_message,
+            "last_message": row.last_message,
+            "avg_messages_per_day": round(avg_messages_per_day, 2),
+            "last_synced_at": row.last_synced_at,
+        },
+        "peak": peak,
+        "heatmap": row.heatmap or [],
+        "trend": [
+            {"date": date.fromisoformat(day["date"]), "message_count": day["message_count"]}
+            for day in row.trend or []
+        ],
+        "response_time": response_time,
+        "images": row.images or [],
+        "attachments": row.attachments or [],
+    }
 
 
 # ============================================================================
 # ATTACHMENT ANALYTICS
 # ============================================================================
 
+_IMAGE_SHARING_STATS = (
+    select(
+        User.id.label("user_id"),
+        func.coalesce(func.nullif(User.name, ""), "Unknown").label("name"),
+        func.count(Attachment.id).label("image_count"),
+    )
+    .join(Message, User.id == Message.user_id)
+    .join(Attachment, Message.id == Attachment.message_id)
+    .where(Message.group_id == bindparam("group_id"))
+    .where(Attachment.type == "image")
+    .group_by(User.id, User.name)
+    .order_by(desc("image_count"))
+    .limit(bindparam("limit"))
+)
+
+
+@_memoized
 def get_image_sharing_stats(
     session: Session, group_id: str, limit: int = 10
 ) -> List[Dict[str, Any]]:
     """Get users who share the most images."""
-    from ..db.models import Attachment
-    
-    query = (
-        session.query(
-            User.id,
-            User.name,
-            func.count(Attachment.id).label("image_count"),
-        )
-        .join(Message, User.id == Message.user_id)
-        .join(Attachment, Message.id == Attachment.message_id)
-        .filter(Message.group_id == group_id)
-        .filter(Attachment.type == "image")
-        .group_by(User.id, User.name)
-        .order_by(desc("image_count"))
-        .limit(limit)
+    rows = session.execute(
+        _IMAGE_SHARING_STATS, {"group_id": group_id, "limit": limit}
     )
     
-    results = []
-    for row in query.all():
-        results.append({
-            "user_id": row.id,
-            "name": row.name or "Unknown",
-            "image_count": row.image_count,
-        })
-    
-    return results
+    return _as_dicts(rows)
 
 
+_ATTACHMENT_TYPE_DISTRIBUTION = (
+    select(
+        Attachment.type,
+        func.count(Attachment.id).label("count"),
+    )
+    .join(Message, Attachment.message_id == Message.id)
+    .where(Message.group_id == bindparam("group_id"))
+    .group_by(Attachment.type)
+    .order_by(desc("count"))
+)
+
+
+@_memoized
 def get_attachment_type_distribution(
     session: Session, group_id: str
 ) -> List[Dict[str, Any]]:
     """Get distribution of attachment types in the group."""
-    from ..db.models import Attachment
-    
-    query = (
-        session.query(
-            Attachment.type,
-            func.count(Attachment.id).label("count"),
-        )
-        .join(Message, Attachment.message_id == Message.id)
-        .filter(Message.group_id == group_id)
-        .group_by(Attachment.type)
-        .order_by(desc("count"))
-    )
-    
-    results = []
-    for row in query.all():
-        results.append({
-            "type": row.type,
-            "count": row.count,
-        })
+    rows = session.execute(_ATTACHMENT_TYPE_DISTRIBUTION, {"group_id": group_id})
     
-    return results
+    return _as_dicts(rows)
 
 
 # ============================================================================
 # ENGAGEMENT ANALYTICS
 # ============================================================================
 
+_LIKE_TO_MESSAGE_RATIO = text("""
+SELECT
+    e.user_id,
+    COALESCE(NULLIF(u.name, ''), 'Unknown') AS name,
+    e.message_count,
+    e.total_likes,
+    ROUND(CAST(e.total_likes AS NUMERIC) / e.message_count, 2)::FLOAT AS likes_per_message
+FROM mv_user_engagement e
+JOIN users u ON e.user_id = u.id
+WHERE e.group_id = :group_id
+  AND e.message_count >= 10  -- At least 10 messages
+ORDER BY likes_per_message DESC
+LIMIT :limit;
+""")
+
+
+@_memoized
 def get_like_to_message_ratio(
     session: Session, group_id: str, limit: int = 10
 ) -> List[Dict[str, Any]]:
-    """Get users with best like-to-message ratio."""
-    sql = text("""
-    WITH user_stats AS (
-        SELECT
-            m.user_id,
-            u.name,
-            COUNT(DISTINCT m.id) AS message_count,
-            COUNT(DISTINCT mf.message_id) AS messages_with_likes,
-            COUNT(mf.user_id) AS total_likes
-        FROM messages m
-        JOIN users u ON m.user_id = u.id
-        LEFT JOIN message_favorites mf ON m.id = mf.message_id
-        WHERE m.group_id = :group_id AND m.system = FALSE
-        GROUP BY m.user_id, u.name
-        HAVING COUNT(DISTINCT m.id) >= 10  -- At least 10 messages
+    """
+    Get users with best like-to-message ratio.
+
+    Reads per-user totals from the mv_user_engagement rollup, which is
+    refreshed after each sync.
+    """
+    rows = session.execute(
+        _LIKE_TO_MESSAGE_RATIO, {"group_id": group_id, "limit": limit}
     )
-    SELECT
-        user_id,
-        name,
-        message_count,
-        total_likes,
-        ROUND(CAST(total_likes AS NUMERIC) / message_count, 2) AS likes_per_message
-    FROM user_stats
-    ORDER BY likes_per_message DESC
-    LIMIT :limit;
-    """)
-    
-    results = []
-    for row in session.execute(sql, {"group_id": group_id, "limit": limit}):
-        results.append({
-            "user_id": row[0],
-            "name": row[1] or "Unknown",
-            "message_count": row[2],
-            "total_likes": row[3],
-            "likes_per_message": float(row[4]),
-        })
-    
-    return results
 
+    return _as_dicts(rows)
+
+
+_MOST_MENTIONED_USERS = text("""
+SELECT
+    mm.user_id,
+    COALESCE(NULLIF(u.name, ''), 'Unknown') AS name,
+    mm.mention_count
+FROM mv_user_mentions mm
+JOIN users u ON mm.user_id = u.id
+WHERE mm.group_id = :group_id
+ORDER BY mm.mention_count DESC
+LIMIT :limit;
+""")
 
+
+@_memoized
 def get_most_mentioned_users(
     session: Session, group_id: str, limit: int = 10
 ) -> List[Dict[str, Any]]:
-    """Get users who are @mentioned most often."""
-    from ..db.models import Mention
-    
-    query = (
-        session.query(
-            User.id,
-            User.name,
-            func.count(Mention.id).label("mention_count"),
-        )
-        .join(Mention, User.id == Mention.user_id)
-        .join(Message, Mention.message_id == Message.id)
-        .filter(Message.group_id == group_id)
-        .group_by(User.id, User.name)
-        .order_by(desc("mention_count"))
-        .limit(limit)
+    """Get users who are @mentioned most often (from mv_user_mentions)."""
+    rows = session.execute(
+        _MOST_MENTIONED_USERS, {"group_id": group_id, "limit": limit}
     )
     
-    results = []
-    for row in query.all():
-        results.append({
-            "user_id": row.id,
-            "name": row.name or "Unknown",
-            "mention_count": row.mention_count,
-        })
-    
-    return results
-
-
+    return _as_dicts(rows)
+
+
+# A starter is a message with no other message in the preceding silence
+# window; the anti-join probes the (group_id, created_at) index per row
+# instead of sorting the whole group for a LAG() window.
+_CONVERSATION_STARTERS = text("""
+SELECT
+    m.user_id,
+    COALESCE(NULLIF(u.name, ''), 'Unknown') AS name,
+    COUNT(*) AS conversation_starts
+FROM messages m
+JOIN users u ON m.user_id = u.id
+WHERE m.group_id = :group_id
+  AND m.system = FALSE
+  AND NOT EXISTS (
+      SELECT 1
+      FROM messages p
+      WHERE p.group_id = m.group_id
+        AND p.system = FALSE
+        AND p.created_at < m.created_at
+        AND p.created_at >= m.created_at - make_interval(mins => :silence_threshold)
+  )
+GROUP BY m.user_id, u.name
+ORDER BY conversation_starts DESC
+LIMIT :limit;
+""")
+
+
+@_memoized
 def get_conversation_starters(
     session: Session, group_id: str, silence_threshold: int = 60, limit: int = 10
 ) -> List[Dict[str, Any]]:
     """Find who starts conversations after long silences (in minutes)."""
-    sql = text("""
-    WITH message_gaps AS (
-        SELECT
-            id,
-            user_id,
-            created_at,
-            EXTRACT(EPOCH FROM (created_at - LAG(created_at) OVER (ORDER BY created_at))) / 60 AS gap_minutes
-        FROM messages
-        WHERE group_id = :group_id AND system = FALSE
-    )
-    SELECT
-        mg.user_id,
-        u.name,
-        COUNT(*) AS conversation_starts
-    FROM message_gaps mg
-    JOIN users u ON mg.user_id = u.id
-    WHERE gap_minutes > :silence_threshold OR gap_minutes IS NULL
-    GROUP BY mg.user_id, u.name
-    ORDER BY conversation_starts DESC
-    LIMIT :limit;
-    """)
-    
-    results = []
-    for row in session.execute(sql, {
+    rows = session.execute(_CONVERSATION_STARTERS, {
         "group_id": group_id,
         "silence_threshold": silence_threshold,
         "limit": limit
-    }):
-        results.append({
-            "user_id": row[0],
-            "name": row[1] or "Unknown",
-            "conversation_starts": row[2],
-        })
-    
-    return results
+    })
+
+    return _as_dicts(rows)
 
 
 # ============================================================================
 # CONTENT ANALYTICS
 # ============================================================================
 
+_MESSAGE_LENGTH_STATS = text("""
+SELECT
+    s.user_id,
+    COALESCE(NULLIF(u.name, ''), 'Unknown') AS name,
+    SUM(s.text_count)::INTEGER AS message_count,
+    COALESCE(ROUND(SUM(s.total_length)::NUMERIC / NULLIF(SUM(s.text_count), 0)), 0)::INTEGER AS avg_length,
+    MAX(s.max_length) AS max_length,
+    MIN(s.min_length) AS min_length
+FROM mv_user_hour_stats s
+JOIN users u ON s.user_id = u.id
+WHERE s.group_id = :group_id
+GROUP BY s.user_id, u.name
+HAVING SUM(s.text_count) >= 10
+ORDER BY avg_length DESC
+LIMIT :limit;
+""")
+
+
+@_memoized
 def get_message_length_stats(
     session: Session, group_id: str, limit: int = 10
 ) -> List[Dict[str, Any]]:
-    """Get average message length by user."""
-    sql = text("""
-    SELECT
-        m.user_id,
-        u.name,
-        COUNT(*) AS message_count,
-        ROUND(AVG(LENGTH(m.text))) AS avg_length,
-        MAX(LENGTH(m.text)) AS max_length,
-        MIN(LENGTH(m.text)) AS min_length
-    FROM messages m
-    JOIN users u ON m.user_id = u.id
-    WHERE m.group_id = :group_id
-      AND m.system = FALSE
-      AND m.text IS NOT NULL
-      AND m.text != ''
-    GROUP BY m.user_id, u.name
-    HAVING COUNT(*) >= 10
-    ORDER BY avg_length DESC
-    LIMIT :limit;
-    """)
-
-    results = []
-    for row in session.execute(sql, {"group_id": group_id, "limit": limit}):
-        results.append({
-            "user_id": row[0],
-            "name": row[1] or "Unknown",
-            "message_count": row[2],
-            "avg_length": int(row[3]) if row[3] else 0,
-            "max_length": row[4],
-            "min_length": row[5],
-        })
+    """
+    Get average message length by user.
 
-    return results
+    Reads from the mv_user_hour_stats rollup, which is refreshed after each
+    sync. Only messages with non-empty text are counted.
+    """
+    rows = session.execute(
+        _MESSAGE_LENGTH_STATS, {"group_id": group_id, "limit": limit}
+    )
 
+    return _as_dicts(rows)
 
-def get_emoji_usage(
-    session: Session, group_id: str, limit: int = 20
-) -> List[Dict[str, Any]]:
-    """Get emoji usage statistics from emoji attachments."""
-    from ..db.models import Attachment
-    
-    sql = text("""
-    SELECT 
-        a.placeholder,
-        COUNT(*) AS usage_count
-    FROM attachments a
-    JOIN messages m ON a.message_id = m.id
-    WHERE m.group_id = :group_id 
-      AND a.type = 'emoji'
-      AND a.placeholder IS NOT NULL
-    GROUP BY a.placeholder
-    ORDER BY usage_count DESC
-    LIMIT :limit;
-    """)
-    
-    results = []
-    for row in session.execute(sql, {"group_id": group_id, "limit": limit}):
-        results.append({
-            "emoji": row[0],
-            "count": row[1],
-        })
-    
-    return results
 
+_EMOJI_USAGE = text("""
+SELECT
+    placeholder AS emoji,
+    emoji_count AS count
+FROM mv_emoji_usage
+WHERE group_id = :group_id
+ORDER BY emoji_count DESC
+LIMIT :limit;
+""")
 
-# ============================================================================
-# USER-SPECIFIC ANALYTICS
-# ============================================================================
 
-def get_user_name_history(
-    session: Session, group_id: str, user_id: str
-) -> List[Dict[str, Any]]:
-    """Get all names a user has used, with first/last seen dates."""
-    sql = text("""
-    SELECT DISTINCT
-        name,
-        MIN(created_at) AS first_used,
-        MAX(created_at) AS last_used,
-        COUNT(*) AS message_count
-    FROM messages
-    WHERE group_id = :group_id AND user_id = :user_id AND name IS NOT NULL
-    GROUP BY name
-    ORDER BY first_used;
-    """)
-    
-    results = []
-    for row in session.execute(sql, {"group_id": group_id, "user_id": user_id}):
-        results.append({
-            "name": row[0],
-            "first_used": row[1],
-            "last_used": row[2],
-            "message_count": row[3],
-        })
-    
-    return results
-
-
-def get_messages_by_name(
-    session: Session, group_id: str, name: str, limit: int = 50
+@_memoized
+def get_emoji_usage(
+    session: Session, group_id: str, limit: int = 20
 ) -> List[Dict[str, Any]]:
-    """Get recent messages sent under a specific name."""
-    query = (
-        session.query(
-            Message.id,
-            Message.text,
-            Message.name,
-            Message.user_id,
-            Message.created_at,
-        )
-        .filter(Message.group_id == group_id)
-        .filter(Message.name.ilike(f"%{name}%"))
-        .filter(Message.system == False)
-        .order_by(desc(Message.created_at))
-        .limit(limit)
-    )
-    
-    results = []
-    for row in query.all():
-        results.append({
-            "message_id": row.id,
-            "text": row.text or "(no text)",
-            "name": row.name,
-            "user_id": row.user_id,
-            "created_at": row.created_at,
-        })
-    
-    return results
-
+    """Get emoji usage statistics from emoji attachments (from mv_emoji_usage)."""
+    rows = session.execute(_EMOJI_USAGE, {"group_id": group_id, "limit": limit})
 
-def get_user_aliases(session: Session, group_id: str) -> List[Dict[str, Any]]:
-    """Get users with multiple names (aliases)."""
-    sql = text("""
-    WITH user_names AS (
-        SELECT 
-            user_id,
-            ARRAY_AGG(DISTINCT name ORDER BY name) AS names,
-            COUNT(DISTINCT name) AS name_count
-        FROM messages
-        WHERE group_id = :group_id AND name IS NOT NULL AND user_id IS NOT NULL
-        GROUP BY user_id
-        HAVING COUNT(DISTINCT name) > 1
-    )
-    SELECT 
-        user_id,
-        names,
-        name_count
-    FROM user_names
-    ORDER BY name_count DESC;
-    """)
-    
-    results = []
-    for row in session.execute(sql, {"group_id": group_id}):
-        results.append({
-            "user_id": row[0],
-            "names": row[1],
-            "alias_count": row[2],
-        })
-    
-    return results
+    return _as_dicts(rows)
 
 
 # ============================================================================
 # SOCIAL NETWORK ANALYTICS
 # ============================================================================
 
+_MENTION_INTERACTION_MATRIX = text("""
+SELECT
+    p.mentioner_id,
+    p.mentioner_name,
+    p.mentioned_id,
+    COALESCE(NULLIF(u.name, ''), 'Unknown') AS mentioned_name,
+    p.mention_count
+FROM mv_mention_pairs p
+JOIN users u ON p.mentioned_id = u.id
+WHERE p.group_id = :group_id
+ORDER BY p.mention_count DESC
+LIMIT :limit;
+""")
+
+
 def get_mention_interaction_matrix(
     session: Session, group_id: str, limit: int = 20
-) -> List[Dict[str, Any]]:
-    """Get who mentions whom the most."""
-    from ..db.models import Mention
-    
-    sql = text("""
-    SELECT 
-        m.user_id AS mentioner_id,
-        m.name AS mentioner_name,
-        mn.user_id AS mentioned_id,
-        u.name AS mentioned_name,
-        COUNT(*) AS mention_count
-    FROM mentions mn
-    JOIN messages m ON mn.message_id = m.id
-    JOIN users u ON mn.user_id = u.id
-    WHERE m.group_id = :group_id
-    GROUP BY m.user_id, m.name, mn.user_id, u.name
-    ORDER BY mention_count DESC
-    LIMIT :limit;
-    """)
-    
-    results = []
-    for row in session.execute(sql, {"group_id": group_id, "limit": limit}):
-        results.append({
-            "mentioner_id": row[0],
-            "mentioner_name": row[1] or "Unknown",
-            "mentioned_id": row[2],
-            "mentioned_name": row[3] or "Unknown",
-            "mention_count": row[4],
-        })
-    
-    return results
+) -> Iterator[Dict[str, Any]]:
+    """
+    Get who mentions whom the most (from mv_mention_pairs).
+
+    Rows are yielded as they arrive from a server-side cursor rather than
+    buffered into a list, so callers can render them incrementally. Not
+    memoized, since a cached copy would defeat the streaming.
+    """
+    rows = session.execute(
+        _MENTION_INTERACTION_MATRIX,
+        {"group_id": group_id, "limit": limit},
+        execution_options={"stream_results": True, "yield_per": 1000},
+    )
+    keys = list(rows.keys())
+    for row in rows:
+        yield dict(zip(keys, row, strict=True))
 
 
+# Each message is paired only with the message immediately before it,
+# found with LAG() in one ordered pass instead of a range self-join
+_REPLY_PATTERNS = text("""
+WITH ordered AS (
+    SELECT
+        user_id,
+        created_at,
+        LAG(user_id) OVER w AS prev_user_id,
+        LAG(created_at) OVER w AS prev_created_at
+    FROM messages
+    WHERE group_id = :group_id
+      AND system = FALSE
+      AND created_at >= :cutoff
+    WINDOW w AS (ORDER BY created_at)
+),
+-- Aggregate on user IDs alone; names are joined for the top pairs only
+pair_counts AS (
+    SELECT
+        prev_user_id AS first_user_id,
+        user_id AS second_user_id,
+        COUNT(*) AS reply_count,
+        AVG(EXTRACT(EPOCH FROM (created_at - prev_created_at)) / 60) AS avg_gap_minutes
+    FROM ordered
+    WHERE prev_user_id != user_id
+      AND created_at - prev_created_at <= make_interval(mins => :time_window)
+    GROUP BY prev_user_id, user_id
+)
+SELECT
+    p.first_user_id,
+    COALESCE(NULLIF(u1.name, ''), 'Unknown') AS first_user_name,
+    p.second_user_id,
+    COALESCE(NULLIF(u2.name, ''), 'Unknown') AS second_user_name,
+    p.reply_count,
+    ROUND(p.avg_gap_minutes::numeric, 2)::FLOAT AS avg_response_minutes
+FROM pair_counts p
+JOIN users u1 ON p.first_user_id = u1.id
+JOIN users u2 ON p.second_user_id = u2.id
+ORDER BY p.reply_count DESC
+LIMIT :limit;
+""")
+
+
+@_memoized
 def get_reply_patterns(
     session: Session,
     group_id: str,
@@ -914,6 +1218,9 @@ def get_reply_patterns(
     """
     Detect reply patterns (who responds to whom within time window).
 
+    A reply is a message from a different user that directly follows
+    another message within the time window.
+
     Args:
         session: Database session
         group_id: Group ID to analyze
@@ -924,244 +1231,320 @@ def get_reply_patterns(
     Returns:
         List of reply patterns with counts and average response times
     """
-    # Use Python datetime to calculate cutoff
-    from datetime import datetime, timedelta, timezone
-    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    cutoff = _cutoff(days)
 
-    sql = text("""
-    WITH recent_messages AS (
-        SELECT
-            user_id,
-            created_at
-        FROM messages
-        WHERE group_id = :group_id
-          AND system = FALSE
-          AND created_at >= :cutoff
-    ),
-    message_pairs AS (
-        SELECT
-            m1.user_id AS first_user_id,
-            u1.name AS first_user_name,
-            m2.user_id AS second_user_id,
-            u2.name AS second_user_name,
-            EXTRACT(EPOCH FROM (m2.created_at - m1.created_at)) / 60 AS gap_minutes
-        FROM recent_messages m1
-        JOIN recent_messages m2
-          ON m1.user_id != m2.user_id
-          AND m2.created_at > m1.created_at
-          AND EXTRACT(EPOCH FROM (m2.created_at - m1.created_at)) / 60 <= :time_window
-        JOIN users u1 ON m1.user_id = u1.id
-        JOIN users u2 ON m2.user_id = u2.id
-    )
-    SELECT
-        first_user_id,
-        first_user_name,
-        second_user_id,
-        second_user_name,
-        COUNT(*) AS reply_count,
-        ROUND(AVG(gap_minutes)::numeric, 2) AS avg_response_time
-    FROM message_pairs
-    GROUP BY first_user_id, first_user_name, second_user_id, second_user_name
-    ORDER BY reply_count DESC
-    LIMIT :limit;
-    """)
-    
-    results = []
-    for row in session.execute(sql, {
+    rows = session.execute(_REPLY_PATTERNS, {
         "group_id": group_id,
         "cutoff": cutoff,
         "time_window": time_window,
         "limit": limit
-    }):
-        results.append({
-            "first_user_id": row[0],
-            "first_user_name": row[1] or "Unknown",
-            "second_user_id": row[2],
-            "second_user_name": row[3] or "Unknown",
-            "reply_count": row[4],
-            "avg_response_minutes": float(row[5]),
-        })
-    
-    return results
+    })
+
+    return _as_dicts(rows)
 
 
 # ============================================================================
 # LEADERBOARDS
 # ============================================================================
 
+_NIGHT_OWL_LEADERBOARD = text("""
+SELECT
+    s.user_id,
+    COALESCE(NULLIF(u.name, ''), 'Unknown') AS name,
+    SUM(s.message_count)::INTEGER AS night_messages,
+    ROUND(100.0 * SUM(s.message_count) / SUM(SUM(s.message_count)) OVER (), 1)::FLOAT AS percentage
+FROM mv_user_hour_stats s
+JOIN users u ON s.user_id = u.id
+WHERE s.group_id = :group_id
+  AND s.hour_of_day >= 0
+  AND s.hour_of_day < 5
+GROUP BY s.user_id, u.name
+ORDER BY night_messages DESC
+LIMIT :limit;
+""")
+
+
+@_memoized
 def get_night_owl_leaderboard(
     session: Session, group_id: str, limit: int = 10
 ) -> List[Dict[str, Any]]:
-    """Users who post most between midnight and 5 AM."""
-    sql = text("""
-    SELECT
-        m.user_id,
-        u.name,
-        COUNT(*) AS night_messages,
-        ROUND(100.0 * COUNT(*) / SUM(COUNT(*)) OVER (), 1) AS percentage
-    FROM messages m
-    JOIN users u ON m.user_id = u.id
-    WHERE m.group_id = :group_id
-      AND m.system = FALSE
-      AND EXTRACT(HOUR FROM m.created_at) >= 0
-      AND EXTRACT(HOUR FROM m.created_at) < 5
-    GROUP BY m.user_id, u.name
-    ORDER BY night_messages DESC
-    LIMIT :limit;
-    """)
-    
-    results = []
-    for row in session.execute(sql, {"group_id": group_id, "limit": limit}):
-        results.append({
-            "user_id": row[0],
-            "name": row[1] or "Unknown",
-            "night_messages": row[2],
-            "percentage": float(row[3]),
-        })
-    
-    return results
+    """Users who post most between midnight and 5 AM (from mv_user_hour_stats)."""
+    rows = session.execute(
+        _NIGHT_OWL_LEADERBOARD, {"group_id": group_id, "limit": limit}
+    )
+
+    return _as_dicts(rows)
+
 
+_EARLY_BIRD_LEADERBOARD = text("""
+SELECT
+    s.user_id,
+    COALESCE(NULLIF(u.name, ''), 'Unknown') AS name,
+    SUM(s.message_count)::INTEGER AS morning_messages,
+    ROUND(100.0 * SUM(s.message_count) / SUM(SUM(s.message_count)) OVER (), 1)::FLOAT AS percentage
+FROM mv_user_hour_stats s
+JOIN users u ON s.user_id = u.id
+WHERE s.group_id = :group_id
+  AND s.hour_of_day >= 5
+  AND s.hour_of_day < 9
+GROUP BY s.user_id, u.name
+ORDER BY morning_messages DESC
+LIMIT :limit;
+""")
 
+
+@_memoized
 def get_early_bird_leaderboard(
     session: Session, group_id: str, limit: int = 10
 ) -> List[Dict[str, Any]]:
-    """Users who post most between 5 AM and 9 AM."""
-    sql = text("""
-    SELECT
-        m.user_id,
-        u.name,
-        COUNT(*) AS morning_messages,
-        ROUND(100.0 * COUNT(*) / SUM(COUNT(*)) OVER (), 1) AS percentage
-    FROM messages m
-    JOIN users u ON m.user_id = u.id
-    WHERE m.group_id = :group_id
-      AND m.system = FALSE
-      AND EXTRACT(HOUR FROM m.created_at) >= 5
-      AND EXTRACT(HOUR FROM m.created_at) < 9
-    GROUP BY m.user_id, u.name
-    ORDER BY morning_messages DESC
-    LIMIT :limit;
-    """)
-    
-    results = []
-    for row in session.execute(sql, {"group_id": group_id, "limit": limit}):
-        results.append({
-            "user_id": row[0],
-            "name": row[1] or "Unknown",
-            "morning_messages": row[2],
-            "percentage": float(row[3]),
-        })
-    
-    return results
+    """Users who post most between 5 AM and 9 AM (from mv_user_hour_stats)."""
+    rows = session.execute(
+        _EARLY_BIRD_LEADERBOARD, {"group_id": group_id, "limit": limit}
+    )
+
+    return _as_dicts(rows)
 
 
+_WEEKEND_WARRIOR_LEADERBOARD = text("""
+WITH user_totals AS (
+    SELECT
+        user_id,
+        SUM(message_count) FILTER (WHERE day_of_week IN (0, 6)) AS weekend,
+        SUM(message_count) AS total
+    FROM mv_user_hour_stats
+    WHERE group_id = :group_id
+    GROUP BY user_id
+)
+SELECT
+    t.user_id,
+    COALESCE(NULLIF(u.name, ''), 'Unknown') AS name,
+    t.weekend::INTEGER AS weekend_messages,
+    t.total::INTEGER AS total_messages,
+    ROUND(100.0 * t.weekend / t.total, 1)::FLOAT AS weekend_percentage
+FROM user_totals t
+JOIN users u ON t.user_id = u.id
+WHERE t.total >= 50  -- At least 50 messages
+  AND t.weekend > 0
+ORDER BY weekend_percentage DESC
+LIMIT :limit;
+""")
+
+
+@_memoized
 def get_weekend_warrior_leaderboard(
     session: Session, group_id: str, limit: int = 10
 ) -> List[Dict[str, Any]]:
-    """Users most active on weekends (Saturday/Sunday)."""
-    sql = text("""
-    WITH total_messages AS (
-        SELECT user_id, COUNT(*) AS total
-        FROM messages
-        WHERE group_id = :group_id AND system = FALSE
-        GROUP BY user_id
-    ),
-    weekend_messages AS (
-        SELECT user_id, COUNT(*) AS weekend
-        FROM messages
-        WHERE group_id = :group_id
-          AND system = FALSE
-          AND EXTRACT(DOW FROM created_at) IN (0, 6)
-        GROUP BY user_id
+    """Users most active on weekends (Saturday/Sunday, from mv_user_hour_stats)."""
+    rows = session.execute(
+        _WEEKEND_WARRIOR_LEADERBOARD, {"group_id": group_id, "limit": limit}
     )
+
+    return _as_dicts(rows)
+
+
+# All five per-user leaderboards from one pass over each rollup view; every
+# section is returned as a JSON array so the result is a single row
+_ALL_LEADERBOARDS = text("""
+WITH per_user AS (
+    SELECT
+        s.user_id,
+        COALESCE(NULLIF(u.name, ''), 'Unknown') AS name,
+        SUM(s.message_count) FILTER (WHERE s.hour_of_day < 5) AS night,
+        SUM(s.message_count) FILTER (WHERE s.hour_of_day >= 5 AND s.hour_of_day < 9) AS morning,
+        SUM(s.message_count) FILTER (WHERE s.day_of_week IN (0, 6)) AS weekend,
+        SUM(s.message_count) AS total,
+        SUM(s.text_count) AS text_count,
+        SUM(s.total_length) AS total_length,
+        MAX(s.max_length) AS max_length,
+        MIN(s.min_length) AS min_length
+    FROM mv_user_hour_stats s
+    JOIN users u ON s.user_id = u.id
+    WHERE s.group_id = :group_id
+    GROUP BY s.user_id, u.name
+),
+night_owl AS (
     SELECT
-        t.user_id,
-        u.name,
-        w.weekend AS weekend_messages,
-        t.total AS total_messages,
-        ROUND(100.0 * w.weekend / t.total, 1) AS weekend_percentage
-    FROM total_messages t
-    JOIN weekend_messages w ON t.user_id = w.user_id
-    JOIN users u ON t.user_id = u.id
-    WHERE t.total >= 50  -- At least 50 messages
+        user_id,
+        name,
+        night::INTEGER AS night_messages,
+        ROUND(100.0 * night / SUM(night) OVER (), 1)::FLOAT AS percentage
+    FROM per_user
+    WHERE night > 0
+    ORDER BY night DESC
+    LIMIT :limit
+),
+early_bird AS (
+    SELECT
+        user_id,
+        name,
+        morning::INTEGER AS morning_messages,
+        ROUND(100.0 * morning / SUM(morning) OVER (), 1)::FLOAT AS percentage
+    FROM per_user
+    WHERE morning > 0
+    ORDER BY morning DESC
+    LIMIT :limit
+),
+weekend_warrior AS (
+    SELECT
+        user_id,
+        name,
+        weekend::INTEGER AS weekend_messages,
+        total::INTEGER AS total_messages,
+        ROUND(100.0 * weekend / total, 1)::FLOAT AS weekend_percentage
+    FROM per_user
+    WHERE total >= 50 AND weekend > 0
     ORDER BY weekend_percentage DESC
-    LIMIT :limit;
-    """)
-    
-    results = []
-    for row in session.execute(sql, {"group_id": group_id, "limit": limit}):
-        results.append({
-            "user_id": row[0],
-            "name": row[1] or "Unknown",
-            "weekend_messages": row[2],
-            "total_messages": row[3],
-            "weekend_percentage": float(row[4]),
-        })
-    
-    return results
+    LIMIT :limit
+),
+message_length AS (
+    SELECT
+        user_id,
+        name,
+        text_count::INTEGER AS message_count,
+        COALESCE(ROUND(total_length::NUMERIC / NULLIF(text_count, 0)), 0)::INTEGER AS avg_length,
+        max_length,
+        min_length
+    FROM per_user
+    WHERE text_count >= 10
+    ORDER BY avg_length DESC
+    LIMIT :limit
+),
+like_ratio AS (
+    SELECT
+        e.user_id,
+        COALESCE(NULLIF(u.name, ''), 'Unknown') AS name,
+        e.message_count,
+        e.total_likes,
+        ROUND(CAST(e.total_likes AS NUMERIC) / e.message_count, 2)::FLOAT AS likes_per_message
+    FROM mv_user_engagement e
+    JOIN users u ON e.user_id = u.id
+    WHERE e.group_id = :group_id
+      AND e.message_count >= 10
+    ORDER BY likes_per_message DESC
+    LIMIT :limit
+)
+SELECT
+    (SELECT json_agg(n ORDER BY n.night_messages DESC) FROM night_owl n) AS night_owl,
+    (SELECT json_agg(e ORDER BY e.morning_messages DESC) FROM early_bird e) AS early_bird,
+    (SELECT json_agg(w ORDER BY w.weekend_percentage DESC) FROM weekend_warrior w) AS weekend_warrior,
+    (SELECT json_agg(l ORDER BY l.likes_per_message DESC) FROM like_ratio l) AS like_ratio,
+    (SELECT json_agg(m ORDER BY m.avg_length DESC) FROM message_length m) AS message_length;
+""")
+
+
+@_memoized
+def get_all_leaderboards(
+    session: Session, group_id: str, limit: int = 10
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Get the night owl, early bird, weekend warrior, like ratio and message
+    length leaderboards in one query.
 
+    Each section has the same shape and filters as the corresponding
+    single-leaderboard function.
 
-def get_controversial_messages(
-    session: Session, group_id: str, days: int = 30, limit: int = 10
-) -> List[Dict[str, Any]]:
-    """Messages with both high likes AND many replies (controversial)."""
-    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-    
-    sql = text("""
-    WITH message_stats AS (
-        SELECT 
-            m.id,
-            m.text,
-            m.name,
-            m.created_at,
-            COUNT(DISTINCT mf.user_id) AS like_count,
-            COUNT(DISTINCT m2.id) FILTER (
-                WHERE m2.created_at > m.created_at 
-                AND m2.created_at <= m.created_at + INTERVAL '10 minutes'
-            ) AS reply_count
-        FROM messages m
-        LEFT JOIN message_favorites mf ON m.id = mf.message_id
-        LEFT JOIN messages m2 ON m.group_id = m2.group_id
-        WHERE m.group_id = :group_id
-          AND m.system = FALSE
-          AND m.created_at >= :cutoff
-        GROUP BY m.id, m.text, m.name, m.created_at
-    )
-    SELECT 
+    Args:
+        session: Database session
+        group_id: Group ID to analyze
+        limit: Maximum number of users per leaderboard
+
+    Returns:
+        Dictionary with "night_owl", "early_bird", "weekend_warrior",
+        "like_ratio" and "message_length" lists
+    """
+    row = session.execute(
+        _ALL_LEADERBOARDS, {"group_id": group_id, "limit": limit}
+    ).one()
+
+    return {name: value or [] for name, value in row._mapping.items()}
+
+
+_CONTROVERSIAL_MESSAGES = text("""
+WITH candidates AS MATERIALIZED (
+    -- Filter the driving set before probing favorites or replies; only
+    -- narrow columns are carried until the top K are known
+    SELECT id, group_id, created_at
+    FROM messages
+    WHERE group_id = :group_id
+      AND system = FALSE
+      AND created_at >= :cutoff
+),
+liked AS MATERIALIZED (
+    -- One hash join and aggregate over favorites instead of a probe per
+    -- candidate; messages under the like threshold drop out here.
+    -- (message_id, user_id) is the primary key, so no DISTINCT needed
+    SELECT c.id, c.group_id, c.created_at, COUNT(*) AS like_count
+    FROM candidates c
+    JOIN message_favorites mf ON mf.message_id = c.id
+    GROUP BY c.id, c.group_id, c.created_at
+    HAVING COUNT(*) >= 3
+),
+message_stats AS (
+    SELECT l.*, r.reply_count
+    FROM liked l
+    -- Bounded range scan on (group_id, created_at), only for messages
+    -- that already meet the like threshold
+    CROSS JOIN LATERAL (
+        SELECT COUNT(*) AS reply_count
+        FROM messages m2
+        WHERE m2.group_id = l.group_id
+          AND m2.created_at > l.created_at
+          AND m2.created_at <= l.created_at + INTERVAL '10 minutes'
+    ) r
+),
+top_k AS (
+    SELECT
         id,
-        text,
-        name,
         created_at,
         like_count,
         reply_count,
         like_count + reply_count AS controversy_score
     FROM message_stats
-    WHERE like_count >= 3 AND reply_count >= 3
+    WHERE reply_count >= 3
     ORDER BY controversy_score DESC
-    LIMIT :limit;
-    """)
+    LIMIT :limit
+)
+-- Text and name are fetched for the K winners only
+SELECT
+    t.id AS message_id,
+    SUBSTR(COALESCE(NULLIF(m.text, ''), '(no text)'), 1, :preview_len) AS text_preview,
+    LENGTH(COALESCE(NULLIF(m.text, ''), '(no text)')) AS full_len,
+    COALESCE(NULLIF(m.name, ''), 'Unknown') AS name,
+    t.created_at,
+    t.like_count,
+    t.reply_count,
+    t.controversy_score
+FROM top_k t
+JOIN messages m ON m.id = t.id
+ORDER BY t.controversy_score DESC;
+""")
+
+
+@_memoized
+def get_controversial_messages(
+    session: Session, group_id: str, days: int = 30, limit: int = 10
+) -> List[Dict[str, Any]]:
+    """Messages with both high likes AND many replies (controversial)."""
+    cutoff = _cutoff(days)
     
-    results = []
-    for row in session.execute(sql, {"group_id": group_id, "cutoff": cutoff, "limit": limit}):
-        results.append({
-            "message_id": row[0],
-            "text": row[1] or "(no text)",
-            "name": row[2] or "Unknown",
-            "created_at": row[3],
-            "like_count": row[4],
-            "reply_count": row[5],
-            "controversy_score": row[6],
-        })
+    rows = session.execute(
+        _CONTROVERSIAL_MESSAGES,
+        {
+            "group_id": group_id,
+            "cutoff": cutoff,
+            "limit": limit,
+            "preview_len": _TEXT_PREVIEW_LEN,
+        },
+    )
 
-    return results
+    return _as_dicts(rows)
 
 
 # ============================================================================
 # SEARCH FUNCTIONS
 # ============================================================================
 
-def search_messages(
-    session: Session,
+def _search_statement(
     group_id: str,
     text: Optional[str] = None,
     user: Optional[str] = None,
@@ -1171,112 +1554,176 @@ def search_messages(
     case_sensitive: bool = False,
     exact: bool = False,
     limit: int = 50,
-) -> List[Dict[str, Any]]:
-    """
-    Search messages with flexible filtering.
-
-    Args:
-        session: Database session
-        group_id: Group ID to search in
-        text: Text to search for (optional)
-        user: Username to filter by (optional)
-        liked_by: Username who liked the message (optional)
-        after: Only messages after this date (optional)
-        before: Only messages before this date (optional)
-        case_sensitive: Whether text search is case-sensitive
-        exact: Whether to match exact phrase vs substring
-        limit: Maximum number of results
+) -> Select:
+    """Build the filtered, newest-first search query."""
+    # Likes are counted per returned row with an indexed scalar subquery, so
+    # there is no outer join to message_favorites and no GROUP BY
+    like_count = (
+        select(func.count())
+        .where(MessageFavorite.message_id == Message.id)
+        .correlate(Message)
+        .scalar_subquery()
+        .label("like_count")
+    )
 
-    Returns:
-        List of matching messages with metadata
-    """
     query = (
-        session.query(
-            Message.id,
-            Message.text,
-            Message.name,
-            Message.user_id,
-            Message.created_at,
-            func.count(MessageFavorite.user_id).label("like_count"),
-        )
-        .outerjoin(MessageFavorite, Message.id == MessageFavorite.message_id)
-        .filter(Message.group_id == group_id)
-        .filter(Message.system == False)
+        select(*_MESSAGE_COLUMNS, like_count)
+        .where(Message.group_id == group_id)
+        .where(Message.system == False)
     )
 
     # Text search
     if text:
         if exact:
             if case_sensitive:
-                query = query.filter(Message.text == text)
+                query = query.where(Message.text == text)
             else:
-                query = query.filter(func.lower(Message.text) == func.lower(text))
+                query = query.where(func.lower(Message.text) == func.lower(text))
         else:
             if case_sensitive:
-                query = query.filter(Message.text.contains(text))
+                query = query.where(Message.text.contains(text))
             else:
-                query = query.filter(Message.text.ilike(f"%{text}%"))
+                query = query.where(Message.text.ilike(f"%{text}%"))
 
     # User filter
     if user:
-        query = query.filter(Message.name.ilike(f"%{user}%"))
+        query = query.where(Message.name.ilike(f"%{user}%"))
 
     # Date filters
     if after:
-        query = query.filter(Message.created_at >= after)
+        query = query.where(Message.created_at >= after)
     if before:
-        query = query.filter(Message.created_at <= before)
+        query = query.where(Message.created_at <= before)
 
     # Liked by filter
     if liked_by:
         # Subquery to find user IDs matching the name
-        liked_by_user_ids = (
-            session.query(User.id)
-            .filter(User.name.ilike(f"%{liked_by}%"))
-            .subquery()
-        )
+        liked_by_user_ids = select(User.id).where(User.name.ilike(f"%{liked_by}%"))
 
         # Filter messages liked by those users
-        query = query.filter(
+        query = query.where(
             Message.id.in_(
-                session.query(MessageFavorite.message_id)
-                .filter(MessageFavorite.user_id.in_(liked_by_user_ids))
+                select(MessageFavorite.message_id)
+                .where(MessageFavorite.user_id.in_(liked_by_user_ids))
             )
         )
 
-    # Get message IDs first
-    subquery = (
-        query.group_by(Message.id)
-        .order_by(desc(Message.created_at))
-        .limit(limit)
-        .subquery()
+    return query.order_by(desc(Message.created_at)).limit(limit)
+
+
+def _search_results(session: Session, rows: Sequence[Row]) -> List[Dict[str, Any]]:
+    """Format search rows, loading their attachments in one query."""
+    attachments = _attachments_by_message(session, [row.id for row in rows])
+
+    return [
+        {
+            "message_id": row.id,
+            "text": format_message_with_attachments(row.text, attachments.get(row.id, ())),
+            "sender_name": row.name or "Unknown",
+            "user_id": row.user_id,
+            "created_at": row.created_at,
+            "like_count": row.like_count,
+        }
+        for row in rows
+    ]
+
+
+def search_messages(
+    session: Session,
+    group_id: str,
+    text: Optional[str] = None,
+    user: Optional[str] = None,
+    liked_by: Optional[str] = None,
+    after: Optional[datetime] = None,
+    before: Optional[datetime] = None,
+    case_sensitive: bool = False,
+    exact: bool = False,
+    limit: int = 50,
+) -> List[Dict[str, Any]]:
+    """
+    Search messages with flexible filtering.
+
+    Args:
+        session: Database session
+        group_id: Group ID to search in
+        text: Text to search for (optional)
+        user: Username to filter by (optional)
+        liked_by: Username who liked the message (optional)
+        after: Only messages after this date (optional)
+        before: Only messages before this date (optional)
+        case_sensitive: Whether text search is case-sensitive
+        exact: Whether to match exact phrase vs substring
+        limit: Maximum number of results
+
+    Returns:
+        List of matching messages with metadata; text is cut to
+        _MESSAGE_TEXT_MAX characters
+    """
+    query = _search_statement(
+        group_id,
+        text=text,
+        user=user,
+        liked_by=liked_by,
+        after=after,
+        before=before,
+        case_sensitive=case_sensitive,
+        exact=exact,
+        limit=limit,
     )
+    return _search_results(session, session.execute(query).all())
+
+
+# Rows per server-side cursor fetch (and per attachments query) when streaming
+_SEARCH_BATCH_SIZE = 200
+
+
+def iter_search_messages(
+    session: Session, group_id: str, **filters: Any
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream search results instead of building the whole list.
+
+    Takes the same filters as search_messages. Rows are read from a
+    server-side cursor in batches, and attachments are loaded per batch, so
+    memory stays flat however large the limit is.
+
+    Args:
+        session: Database session
+        group_id: Group ID to search in
+        **filters: Keyword filters accepted by search_messages
 
-    # Fetch full Message objects with attachments
-    messages = (
-        session.query(Message)
-        .join(subquery, Message.id == subquery.c.id)
-        .order_by(desc(Message.created_at))
-        .all()
+    Yields:
+        Matching messages, newest first, in the same shape as search_messages
+    """
+    result = session.execute(
+        _search_statement(group_id, **filters),
+        execution_options={"stream_results": True, "yield_per": _SEARCH_BATCH_SIZE},
     )
+    for rows in result.partitions():
+        yield from _search_results(session, rows)
 
-    results = []
-    for msg in messages:
-        like_count = (
-            session.query(func.count(MessageFavorite.user_id))
-            .filter(MessageFavorite.message_id == msg.id)
-            .scalar()
-        )
-        results.append({
-            "message_id": msg.id,
-            "text": format_message_with_attachments(msg.text, msg.attachments),
-            "sender_name": msg.name or "Unknown",
-            "user_id": msg.user_id,
-            "created_at": msg.created_at,
-            "like_count": like_count,
-        })
 
-    return results
+_CONTEXT_TARGET = (
+    select(*_MESSAGE_COLUMNS)
+    .where(Message.id == bindparam("message_id"))
+    .where(Message.group_id == bindparam("group_id"))
+)
+
+_CONTEXT_BEFORE = (
+    select(*_MESSAGE_COLUMNS)
+    .where(Message.group_id == bindparam("group_id"))
+    .where(Message.created_at < bindparam("created_at"))
+    .order_by(desc(Message.created_at))
+    .limit(bindparam("limit"))
+)
+
+_CONTEXT_AFTER = (
+    select(*_MESSAGE_COLUMNS)
+    .where(Message.group_id == bindparam("group_id"))
+    .where(Message.created_at > bindparam("created_at"))
+    .order_by(Message.created_at)
+    .limit(bindparam("limit"))
+)
 
 
 def get_message_context(
@@ -1297,42 +1744,38 @@ def get_message_context(
         after_count: Number of messages after
 
     Returns:
-        Dictionary with before, target, and after messages
+        Dictionary with before, target, and after messages; text is cut to
+        _MESSAGE_TEXT_MAX characters
     """
     # Get the target message
-    target = session.query(Message).filter(
-        Message.id == message_id,
-        Message.group_id == group_id
+    target = session.execute(
+        _CONTEXT_TARGET, {"message_id": message_id, "group_id": group_id}
     ).first()
 
     if not target:
         return {"error": "Message not found"}
 
     # Get messages before
-    before_messages = (
-        session.query(Message)
-        .filter(Message.group_id == group_id)
-        .filter(Message.created_at < target.created_at)
-        .order_by(desc(Message.created_at))
-        .limit(before_count)
-        .all()
-    )
+    before_messages = session.execute(
+        _CONTEXT_BEFORE,
+        {"group_id": group_id, "created_at": target.created_at, "limit": before_count},
+    ).all()
     before_messages.reverse()  # Chronological order
 
     # Get messages after
-    after_messages = (
-        session.query(Message)
-        .filter(Message.group_id == group_id)
-        .filter(Message.created_at > target.created_at)
-        .order_by(Message.created_at)
-        .limit(after_count)
-        .all()
+    after_messages = session.execute(
+        _CONTEXT_AFTER,
+        {"group_id": group_id, "created_at": target.created_at, "limit": after_count},
+    ).all()
+
+    attachments = _attachments_by_message(
+        session, [msg.id for msg in (*before_messages, target, *after_messages)]
     )
 
     def format_message(msg):
         return {
             "message_id": msg.id,
-            "text": format_message_with_attachments(msg.text, msg.attachments),
+            "text": format_message_with_attachments(msg.text, attachments.get(msg.id, ())),
             "sender_name": msg.name or "Unknown",
             "created_at": msg.created_at,
         }
@@ -1344,6 +1787,170 @@ def get_message_context(
     }
 
 
+# Context for many targets in one round trip: each side is a LATERAL range
+# scan on (group_id, created_at), the same lookup get_message_context does
+_SEARCH_RESULTS_CONTEXT = text("""
+WITH targets AS (
+    SELECT id, created_at
+    FROM messages
+    WHERE group_id = :group_id
+    AND id IN :message_ids
+)
+SELECT t.id AS target_id, 'before' AS side, c.*
+FROM targets t
+CROSS JOIN LATERAL (
+    SELECT m.id, SUBSTR(m.text, 1, :text_max) AS text, m.name, m.created_at
+    FROM messages m
+    WHERE m.group_id = :group_id
+    AND m.created_at < t.created_at
+    ORDER BY m.created_at DESC
+    LIMIT :before_count
+) c
+UNION ALL
+SELECT t.id AS target_id, 'after' AS side, c.*
+FROM targets t
+CROSS JOIN LATERAL (
+    SELECT m.id, SUBSTR(m.text, 1, :text_max) AS text, m.name, m.created_at
+    FROM messages m
+    WHERE m.group_id = :group_id
+    AND m.created_at > t.created_at
+    ORDER BY m.created_at
+    LIMIT :after_count
+) c
+ORDER BY target_id, created_at
+""").bindparams(bindparam("message_ids", expanding=True))
+
+
+def get_search_results_with_context(
+    session: Session,
+    group_id: str,
+    message_ids: List[str],
+    before_count: int = 3,
+    after_count: int = 3,
+) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+    """
+    Get the surrounding messages for many messages at once.
+
+    Equivalent to calling get_message_context for each ID, but issues one
+    query for the context rows and one for their attachments.
+
+    Args:
+        session: Database session
+        group_id: Group ID
+        message_ids: Message IDs to get context for
+        before_count: Number of messages before each
+        after_count: Number of messages after each
+
+    Returns:
+        Dictionary mapping each message ID to its before and after messages,
+        both in chronological order; text is cut to _MESSAGE_TEXT_MAX
+        characters
+    """
+    contexts: Dict[str, Dict[str, List[Dict[str, Any]]]] = {
+        message_id: {"before": [], "after": []} for message_id in message_ids
+    }
+    if not message_ids:
+        return contexts
+
+    rows = session.execute(
+        _SEARCH_RESULTS_CONTEXT,
+        {
+            "group_id": group_id,
+            "message_ids": message_ids,
+            "before_count": before_count,
+            "after_count": after_count,
+            "text_max": _MESSAGE_TEXT_MAX,
+        },
+    ).all()
+    attachments = _attachments_by_message(session, list({row.id for row in rows}))
+
+    for row in rows:
+        contexts[row.target_id][row.side].append({
+            "message_id": row.id,
+            "text": format_message_with_attachments(row.text, attachments.get(row.id, ())),
+            "sender_name": row.name or "Unknown",
+            "created_at": row.created_at,
+        })
+
+    return contexts
+
+
+# Likers of many messages at once, oldest like first
+_LIKERS = (
+    select(MessageFavorite.message_id, User.name)
+    .join(User, User.id == MessageFavorite.user_id)
+    .where(MessageFavorite.message_id.in_(bindparam("message_ids", expanding=True)))
+    .order_by(MessageFavorite.message_id, MessageFavorite.created_at)
+)
+
+
+def get_likers(session: Session, message_ids: List[str]) -> Dict[str, List[str]]:
+    """
+    Get the names of the users who liked each message, in one query.
+
+    Args:
+        session: Database session
+        message_ids: Message IDs to look up
+
+    Returns:
+        Dictionary mapping each liked message ID to its likers' names, oldest
+        like first; messages without likes are absent
+    """
+    likers: Dict[str, List[str]] = {}
+    if not message_ids:
+        return likers
+    for row in session.execute(_LIKERS, {"message_ids": message_ids}):
+        likers.setdefault(row.message_id, []).append(row.name)
+    return likers
+
+
+# A user with at least one message in the group whose current name matches
+_USER_BY_NAME = (
+    select(User)
+    .join(Message, User.id == Message.user_id)
+    .where(Message.group_id == bindparam("group_id"))
+    .where(User.name.ilike(bindparam("pattern")))
+    .limit(1)
+)
+
+
+# The user and their alias history in one round-trip; the history comes back
+# as a single JSON array rather than one row per name
+_USER_ALIASES = text("""
+WITH target AS (
+    SELECT u.id, u.name
+    FROM users u
+    WHERE u.name ILIKE :pattern
+      AND EXISTS (
+          SELECT 1 FROM messages m
+          WHERE m.group_id = :group_id AND m.user_id = u.id
+      )
+    LIMIT 1
+),
+alias_hist AS (
+    SELECT
+        m.name,
+        COUNT(*) AS message_count,
+        MIN(m.created_at) AS first_used,
+        MAX(m.created_at) AS last_used
+    FROM messages m
+    JOIN target t ON m.user_id = t.id
+    WHERE m.group_id = :group_id
+    AND m.name IS NOT NULL
+    GROUP BY m.name
+)
+SELECT
+    t.id AS user_id,
+    t.name AS current_name,
+    (
+        SELECT json_agg(alias_hist ORDER BY message_count DESC)
+        FROM alias_hist
+    ) AS aliases
+FROM target t
+""")
+
+
+@_memoized
 def get_user_aliases(
     session: Session, group_id: str, user_search: str
 ) -> Dict[str, Any]:
@@ -1358,56 +1965,58 @@ def get_user_aliases(
     Returns:
         Dictionary with user info and all aliases with usage stats
     """
-    # Find user by current name
-    user = (
-        session.query(User)
-        .join(Message, User.id == Message.user_id)
-        .filter(Message.group_id == group_id)
-        .filter(User.name.ilike(f"%{user_search}%"))
-        .first()
-    )
+    row = session.execute(
+        _USER_ALIASES, {"group_id": group_id, "pattern": f"%{user_search}%"}
+    ).first()
 
-    if not user:
+    if not row:
         return {"error": f"No user found matching '{user_search}'"}
 
-    # Get all names they've used with stats
-    aliases_query = text("""
-        SELECT
-            name,
-            COUNT(*) as message_count,
-            MIN(created_at) as first_used,
-            MAX(created_at) as last_used
-        FROM messages
-        WHERE user_id = :user_id
-        AND group_id = :group_id
-        AND name IS NOT NULL
-        GROUP BY name
-        ORDER BY message_count DESC
-    """)
-
-    result = session.execute(
-        aliases_query, {"user_id": user.id, "group_id": group_id}
-    ).fetchall()
-
-    aliases = []
-    for row in result:
-        aliases.append({
-            "name": row.name,
-            "message_count": row.message_count,
-            "first_used": row.first_used,
-            "last_used": row.last_used,
-        })
+    # Timestamps inside json_agg come back as ISO strings
+    aliases = [
+        {
+            **alias,
+            "first_used": datetime.fromisoformat(alias["first_used"]),
+            "last_used": datetime.fromisoformat(alias["last_used"]),
+        }
+        for alias in row.aliases or []
+    ]
 
     return {
-        "user_id": user.id,
-        "current_name": user.name,
+        "user_id": row.user_id,
+        "current_name": row.current_name,
         "total_aliases": len(aliases),
         "aliases": aliases,
     }
 
 
+# Returned as one JSON array; every column is a JSON-native type. Alias
+# counts per user come from the mv_user_aliases rollup rather than messages.
+_ALL_USERS_WITH_ALIASES = text("""
+    WITH user_aliases AS (
+        SELECT
+            a.user_id,
+            u.name as current_name,
+            a.alias_count,
+            a.total_messages
+        FROM mv_user_aliases a
+        JOIN users u ON a.user_id = u.id
+        WHERE a.group_id = :group_id
+        AND a.alias_count >= :min_aliases
+        ORDER BY a.alias_count DESC
+        LIMIT :limit
+    )
+    SELECT json_agg(user_aliases ORDER BY alias_count DESC)
+    FROM user_aliases
+""")
+
+
+@_memoized
 def get_all_users_with_aliases(
-    session: Session, group_id: str, min_aliases: int = 2
+    session: Session,
+    group_id: str,
+    min_aliases: int = 2,
+    limit: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
     """
     Get all users who have used multiple display names.
@@ -1416,40 +2025,34 @@ def get_all_users_with_aliases(
         session: Database session
         group_id: Group ID
         min_aliases: Minimum number of different names to include
+        limit: Maximum users to return (None for all)
 
     Returns:
         List of users with their alias count
     """
-    query = text("""
-        SELECT
-            m.user_id,
-            u.name as current_name,
-            COUNT(DISTINCT m.name) as alias_count,
-            COUNT(*) as total_messages
-        FROM messages m
-        JOIN users u ON m.user_id = u.id
-        WHERE m.group_id = :group_id
-        AND m.user_id IS NOT NULL
-        AND m.name IS NOT NULL
-        GROUP BY m.user_id, u.name
-        HAVING COUNT(DISTINCT m.name) >= :min_aliases
-        ORDER BY alias_count DESC
-    """)
-
     result = session.execute(
-        query, {"group_id": group_id, "min_aliases": min_aliases}
-    ).fetchall()
+        _ALL_USERS_WITH_ALIASES,
+        {"group_id": group_id, "min_aliases": min_aliases, "limit": limit},
+    ).scalar()
 
-    users = []
-    for row in result:
-        users.append({
-            "user_id": row.user_id,
-            "current_name": row.current_name,
-            "alias_count": row.alias_count,
-            "total_messages": row.total_messages,
-        })
+    return result or []
 
-    return users
+
+_USER_MESSAGES_BY_NAME = (
+    select(
+        *_MESSAGE_COLUMNS,
+        select(func.count())
+        .where(MessageFavorite.message_id == Message.id)
+        .correlate(Message)
+        .scalar_subquery()
+        .label("like_count"),
+    )
+    .where(Message.group_id == bindparam("group_id"))
+    .where(Message.user_id == bindparam("user_id"))
+    .where(Message.name.ilike(bindparam("pattern")))
+    .order_by(Message.created_at.desc())
+    .limit(bindparam("limit"))
+)
 
 
 def get_messages_by_name(
@@ -1470,59 +2073,202 @@ def get_messages_by_name(
         limit: Maximum messages to return
 
     Returns:
-        Dictionary with user info and messages from that naming period
+        Dictionary with user info and messages from that naming period;
+        message text is cut to _MESSAGE_TEXT_MAX characters
     """
     # Find user by current name
-    user = (
-        session.query(User)
-        .join(Message, User.id == Message.user_id)
-        .filter(Message.group_id == group_id)
-        .filter(User.name.ilike(f"%{user_search}%"))
-        .first()
-    )
+    user = session.scalars(
+        _USER_BY_NAME, {"group_id": group_id, "pattern": f"%{user_search}%"}
+    ).first()
 
     if not user:
         return {"error": f"No user found matching '{user_search}'"}
 
-    # Find messages sent under the specific name
-    messages = (
-        session.query(Message)
-        .filter(Message.group_id == group_id)
-        .filter(Message.user_id == user.id)
-        .filter(Message.name.ilike(f"%{name_search}%"))
-        .order_by(Message.created_at.desc())
-        .limit(limit)
-        .all()
-    )
+    # Find messages sent under the specific name, newest first. Likes are
+    # counted in SQL and attachments loaded in one extra query. One row past
+    # the limit is fetched to tell whether more exist, without a COUNT(*).
+    rows = session.execute(
+        _USER_MESSAGES_BY_NAME,
+        {
+            "group_id": group_id,
+            "user_id": user.id,
+            "pattern": f"%{name_search}%",
+            "limit": limit + 1,
+        },
+    ).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    attachments = _attachments_by_message(session, [row.id for row in rows])
+
+    messages = []
+    for msg in rows:
+        messages.append({
+            "message_id": msg.id,
+            "text": format_message_with_attachments(msg.text, attachments.get(msg.id, ())),
+            "created_at": msg.created_at,
+            "like_count": msg.like_count,
+        })
 
     if not messages:
         return {
             "error": f"No messages found for user '{user.name}' with name matching '{name_search}'"
         }
 
-    # Get stats for this name period
-    first_msg = messages[-1]
-    last_msg = messages[0]
-    exact_name = first_msg.name
+    # Rows are newest first
+    first_msg = rows[-1]
+    last_msg = rows[0]
 
+    # Get stats for this name period
     results = {
         "user_id": user.id,
         "current_name": user.name,
-        "historical_name": exact_name,
+        "historical_name": first_msg.name,
         "message_count": len(messages),
         "date_range": {
             "first": first_msg.created_at,
             "last": last_msg.created_at,
         },
-        "messages": [],
+        "messages": messages,
+        "has_more": has_more,
     }
 
-    for msg in messages:
-        results["messages"].append({
-            "message_id": msg.id,
-            "text": format_message_with_attachments(msg.text, msg.attachments),
-            "created_at": msg.created_at,
-            "like_count": len(msg.favorites),
-        })
-
     return results
+
+
+# The user is resolved the same way as get_user_aliases; their messages are
+# scanned once (narrow columns only) for alias history and totals, and text
+# is read only for the sampled recent messages
+_USER_PROFILE = text("""
+WITH target AS (
+    SELECT u.id, u.name
+    FROM users u
+    WHERE u.name ILIKE :pattern
+      AND EXISTS (
+          SELECT 1 FROM messages m
+          WHERE m.group_id = :group_id AND m.user_id = u.id
+      )
+    LIMIT 1
+),
+user_msgs AS MATERIALIZED (
+    SELECT m.id, m.name, m.created_at
+    FROM messages m
+    JOIN target t ON m.user_id = t.id
+    WHERE m.group_id = :group_id
+),
+alias_hist AS (
+    SELECT
+        name,
+        COUNT(*) AS message_count,
+        MIN(created_at) AS first_used,
+        MAX(created_at) AS last_used
+    FROM user_msgs
+    WHERE name IS NOT NULL
+    GROUP BY name
+),
+agg AS (
+    SELECT
+        COUNT(*) AS message_count,
+        MIN(created_at) AS first_message,
+        MAX(created_at) AS last_message,
+        (
+            SELECT COUNT(*)
+            FROM message_favorites mf
+            JOIN user_msgs um ON mf.message_id = um.id
+        ) AS total_likes
+    FROM user_msgs
+),
+sample_msgs AS (
+    SELECT
+        um.id AS message_id,
+        um.name,
+        um.created_at,
+        SUBSTR(COALESCE(NULLIF(m.text, ''), '(no text)'), 1, :preview_len) AS text_preview,
+        LENGTH(COALESCE(NULLIF(m.text, ''), '(no text)')) AS full_len,
+        (
+            SELECT COUNT(*) FROM message_favorites mf WHERE mf.message_id = um.id
+        ) AS like_count
+    FROM (
+        SELECT id, name, created_at
+        FROM user_msgs
+        ORDER BY created_at DESC
+        LIMIT :limit
+    ) um
+    JOIN messages m ON m.id = um.id
+)
+SELECT
+    t.id AS user_id,
+    t.name AS current_name,
+    a.message_count,
+    a.total_likes,
+    a.first_message,
+    a.last_message,
+    (
+        SELECT json_agg(alias_hist ORDER BY message_count DESC)
+        FROM alias_hist
+    ) AS aliases,
+    (
+        SELECT json_agg(sample_msgs ORDER BY created_at DESC)
+        FROM sample_msgs
+    ) AS recent_messages
+FROM target t
+CROSS JOIN agg a;
+""")
+
+
+def get_user_profile(
+    session: Session, group_id: str, user_search: str, limit: int = 10
+) -> Dict[str, Any]:
+    """
+    Get a user's alias history, message totals and recent messages together.
+
+    Combines what the aliases and by-name commands show into a single
+    round-trip, so the user's messages are scanned once.
+
+    Args:
+        session: Database session
+        group_id: Group ID
+        user_search: Partial current name to find the user
+        limit: Maximum recent messages to include
+
+    Returns:
+        Dictionary with user info, "aliases", "stats" and "recent_messages"
+    """
+    row = session.execute(
+        _USER_PROFILE,
+        {
+            "group_id": group_id,
+            "pattern": f"%{user_search}%",
+            "limit": limit,
+            "preview_len": _TEXT_PREVIEW_LEN,
+        },
+    ).first()
+
+    if not row:
+        return {"error": f"No user found matching '{user_search}'"}
+
+    # Timestamps inside json_agg come back as ISO strings
+    aliases = [
+        {
+            **alias,
+            "first_used": datetime.fromisoformat(alias["first_used"]),
+            "last_used": datetime.fromisoformat(alias["last_used"]),
+        }
+        for alias in row.aliases or []
+    ]
+    recent_messages = [
+        {**msg, "created_at": datetime.fromisoformat(msg["created_at"])}
+        for msg in row.recent_messages or []
+    ]
+
+    return {
+        "user_id": row.user_id,
+        "current_name": row.current_name,
+        "stats": {
+            "message_count": row.message_count,
+            "total_likes": row.total_likes,
+            "first_message": row.first_message,
+            "last_message": row.last_message,
+        },
+        "aliases": aliases,
+        "recent_messages": recent_messages,
+    }
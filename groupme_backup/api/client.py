@@ -1,15 +1,17 @@
 """GroupMe API client with rate limiting."""
 
 import logging
+import threading
 import time
-from collections import deque
-from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from ..utils.cache import TTLCache
 from .exceptions import (
     AuthenticationError,
     GroupMeAPIError,
@@ -25,7 +27,11 @@ class GroupMeClient:
     """
     GroupMe API client with built-in rate limiting.
 
-    Implements a sliding window rate limiter to prevent exceeding API limits.
+    Implements a token bucket rate limiter to prevent exceeding API limits.
+
+    Uses a pooled keep-alive requests session over HTTP/1.1. Message history
+    is paged with before_id/since_id cursors, so each page depends on the
+    previous one and HTTP/2 multiplexing would not overlap those requests.
     """
 
     def __init__(
@@ -49,8 +55,15 @@ class GroupMeClient:
         self.rate_limit_calls = rate_limit_calls
         self.rate_limit_period = rate_limit_period
 
-        # Sliding window for rate limiting
-        self.request_times: deque = deque()
+        # Token bucket for rate limiting: starts full and refills at
+        # rate_limit_calls tokens per rate_limit_period seconds
+        self._tokens: float = float(rate_limit_calls)
+        self._last_refill: float = time.monotonic()
+        self._rate_limit_lock = threading.Lock()
+
+        # Group and user lookups change rarely; skip repeat requests
+        self._group_cache = TTLCache(maxsize=1024, ttl=300)
+        self._user_cache = TTLCache(maxsize=1024, ttl=300)
 
         # Set up session with retry strategy
         self.session = requests.Session()
@@ -60,39 +73,41 @@ class GroupMeClient:
             status_forcelist=[500, 502, 503, 504],
             allowed_methods=["GET", "POST"],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Larger keep-alive pool so concurrent requests reuse TLS connections
+        # instead of opening new ones
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=32,
+            pool_maxsize=32,
+            pool_block=False,
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
     def _wait_for_rate_limit(self) -> None:
         """
-        Implement sliding window rate limiting.
+        Implement token bucket rate limiting.
 
-        Waits if necessary to stay within rate limits.
+        Takes one token per request, waiting for the bucket to refill if it
+        is empty. Safe to call from several threads.
         """
-        now = datetime.now(timezone.utc)
-        cutoff = now - timedelta(seconds=self.rate_limit_period)
-
-        # Remove old requests outside the window
-        while self.request_times and self.request_times[0] < cutoff:
-            self.request_times.popleft()
-
-        # If at limit, wait until we can make another request
-        if len(self.request_times) >= self.rate_limit_calls:
-            sleep_time = (self.request_times[0] - cutoff).total_seconds()
-            if sleep_time > 0:
-                logger.warning(
-                    f"Rate limit reached. Sleeping for {sleep_time:.2f} seconds..."
-                )
-                time.sleep(sleep_time + 0.1)  # Small buffer
-                # Recalculate after sleep
-                now = datetime.now(timezone.utc)
-                cutoff = now - timedelta(seconds=self.rate_limit_period)
-                while self.request_times and self.request_times[0] < cutoff:
-                    self.request_times.popleft()
-
-        # Record this request
-        self.request_times.append(now)
+        with self._rate_limit_lock:
+            rate = self.rate_limit_calls / self.rate_limit_period
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.rate_limit_calls),
+                self._tokens + (now - self._last_refill) * rate,
+            )
+            self._last_refill = now
+
+            if self._tokens < 1:
+                sleep_time = (1 - self._tokens) / rate
+                logger.warning(f"Rate limit reached. Sleeping for {sleep_time:.2f} seconds...")
+                time.sleep(sleep_time)
+                self._last_refill = time.monotonic()
+                self._tokens = 0.0
+            else:
+                self._tokens -= 1
 
     def _make_request(
         self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None
@@ -134,7 +149,9 @@ class GroupMeClient:
 
         # Handle different status codes
         if response.status_code == 200:
-            return response.json()
+            # orjson parses large message pages several times faster than json
+            data: Dict[str, Any] = orjson.loads(response.content)
+            return data
         elif response.status_code == 304:
             # Not modified - no new data
             return {"response": {"messages": []}}
@@ -167,29 +184,49 @@ class GroupMeClient:
         """
         params = {"page": page, "per_page": min(per_page, 100), "omit": "memberships"}
         data = self._make_request("GET", "/groups", params)
-        return data.get("response", [])
+        groups: List[Dict[str, Any]] = data.get("response", [])
+        return groups
 
-    def get_all_groups(self) -> List[Dict[str, Any]]:
+    def get_all_groups(self, max_workers: int = 4) -> List[Dict[str, Any]]:
         """
         Fetch all groups across all pages.
 
+        The first page is fetched alone since most accounts fit on it; if it
+        is full, later pages are fetched max_workers at a time in parallel.
+
+        Args:
+            max_workers: Number of pages to request concurrently
+
         Returns:
             List of all group dictionaries
         """
-        all_groups = []
-        page = 1
-
-        while True:
-            groups = self.get_groups(page=page, per_page=100)
-            if not groups:
-                break
-            all_groups.extend(groups)
-            logger.info(f"Fetched {len(groups)} groups from page {page}")
-            page += 1
-
-            # GroupMe typically returns fewer than per_page when on last page
-            if len(groups) < 100:
-                break
+        per_page = 100
+        all_groups = self.get_groups(page=1, per_page=per_page)
+        logger.info(f"Fetched {len(all_groups)} groups from page 1")
+
+        # GroupMe typically returns fewer than per_page when on last page
+        next_page = 2
+        last_page_full = len(all_groups) == per_page
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while last_page_full:
+                pages = range(next_page, next_page + max_workers)
+                futures = [
+                    executor.submit(self.get_groups, page=page, per_page=per_page) for page in pages
+                ]
+
+                for page, future in zip(pages, futures, strict=True):
+                    groups = future.result()
+                    if not groups:
+                        last_page_full = False
+                        break
+                    all_groups.extend(groups)
+                    logger.info(f"Fetched {len(groups)} groups from page {page}")
+                    if len(groups) < per_page:
+                        last_page_full = False
+                        break
+
+                next_page += max_workers
 
         logger.info(f"Total groups fetched: {len(all_groups)}")
         return all_groups
@@ -204,8 +241,14 @@ class GroupMeClient:
         Returns:
             Group dictionary
         """
+        cached: Optional[Dict[str, Any]] = self._group_cache.get(group_id)
+        if cached is not None:
+            return cached
+
         data = self._make_request("GET", f"/groups/{group_id}")
-        return data.get("response", {})
+        group: Dict[str, Any] = data.get("response", {})
+        self._group_cache.set(group_id, group)
+        return group
 
     def get_messages(
         self,
@@ -236,7 +279,7 @@ class GroupMeClient:
             params["since_id"] = since_id
 
         data = self._make_request("GET", f"/groups/{group_id}/messages", params)
-        messages = data.get("response", {}).get("messages", [])
+        messages: List[Dict[str, Any]] = data.get("response", {}).get("messages", [])
 
         logger.debug(
             f"Fetched {len(messages)} messages from group {group_id} "
@@ -255,5 +298,11 @@ class GroupMeClient:
         Returns:
             User dictionary
         """
+        cached: Optional[Dict[str, Any]] = self._user_cache.get(user_id)
+        if cached is not None:
+            return cached
+
         data = self._make_request("GET", f"/users/{user_id}")
-        return data.get("response", {})
+        user: Dict[str, Any] = data.get("response", {})
+        self._user_cache.set(user_id, user)
+        return user
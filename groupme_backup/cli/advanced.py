@@ -1,31 +1,47 @@
 """Advanced analytics CLI commands."""
 
+import itertools
+import sys
+from decimal import Decimal
+from typing import Any, Dict, Iterable
+
 import click
+import orjson
 from rich.console import Console
+from rich.live import Live
 from rich.table import Table
 
 from ..analytics import queries
 from ..db.session import get_session
+from .common import parse_group_identifier
 from .main import cli
 
 console = Console()
 
 
-def parse_group_identifier(identifier: str) -> str:
-    """Parse group identifier - can be a numeric index or group ID."""
-    from ..utils.groups_cache import get_group_id_by_index
+def _json_default(value: Any) -> Any:
+    """Serialize values orjson has no native support for."""
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
 
-    try:
-        index = int(identifier)
-        group_id = get_group_id_by_index(index)
-        if group_id:
-            return group_id
-        else:
-            console.print(f"[red]Error:[/red] No group at index {index}")
-            console.print("Run [cyan]groupme-backup groups[/cyan] to see available groups")
-            raise click.Abort()
-    except ValueError:
-        return identifier
+
+def _write_ndjson(rows: Iterable[Dict[str, Any]]) -> bool:
+    """
+    Write rows as newline-delimited JSON when stdout is not a terminal.
+
+    Lets commands piped into jq or awk skip building and styling a Rich
+    table. Returns True if the rows were written, in which case the caller
+    should return without rendering.
+    """
+    if console.is_terminal:
+        return False
+
+    out = sys.stdout.buffer
+    for row in rows:
+        out.write(orjson.dumps(row, default=_json_default) + b"\n")
+    out.flush()
+    return True
 
 
 # ============================================================================
@@ -45,6 +61,9 @@ def peak_times(ctx: click.Context, group_identifier: str) -> None:
     with get_session() as session:
         result = queries.get_peak_activity_times(session, group_id)
 
+        if _write_ndjson([result] if result else []):
+            return
+
         if result:
             console.print("\n[bold]Peak Activity Time:[/bold]\n")
             console.print(f"[green]Day:[/green] {result['peak_day']}")
@@ -68,7 +87,11 @@ def trend(ctx: click.Context, group_identifier: str, days: int) -> None:
     with get_session() as session:
         results = queries.get_daily_message_trend(session, group_id, days)
 
-        if results:
+        if _write_ndjson(results):
+            return
+
+        # Every day in the window is returned, so check for any activity
+        if any(row["message_count"] for row in results):
             table = Table(title=f"Daily Message Trend (Last {days} Days)")
             table.add_column("Date", style="cyan")
             table.add_column("Messages", justify="right", style="green")
@@ -84,10 +107,102 @@ def trend(ctx: click.Context, group_identifier: str, days: int) -> None:
             console.print("[yellow]No trend data found[/yellow]")
 
 
+@cli.command()
+@click.argument("group_identifier")
+@click.option("--days", default=30, help="Number of days of trend to show")
+@click.option("--limit", default=10, help="Number of image sharers to show")
+@click.pass_context
+def dashboard(ctx: click.Context, group_identifier: str, days: int, limit: int) -> None:
+    """Show statistics, peak time, pace, trend and attachments in one view.
+
+    Example: groupme-backup dashboard 1 --days 14
+    """
+    group_id = parse_group_identifier(group_identifier)
+
+    with get_session() as session:
+        result = queries.get_dashboard_bundle(session, group_id, days, limit)
+
+        if "error" in result:
+            console.print(f"[red]Error:[/red] {result['error']}")
+            return
+
+        if _write_ndjson([result]):
+            return
+
+        stats = result["statistics"]
+        peak = result["peak"]
+        pace = result["response_time"]
+
+        console.print(f"\n[bold]{stats['group_name']}[/bold] Dashboard\n")
+
+        table = Table(show_header=False, box=None)
+        table.add_column("Metric", style="cyan")
+        table.add_column("Value", style="green")
+
+        table.add_row("Total Messages", f"{stats['total_messages']:,}")
+        table.add_row("Total Users", f"{stats['total_users']:,}")
+        table.add_row("Total Likes", f"{stats['total_likes']:,}")
+        table.add_row("Avg Messages/Day", f"{stats['avg_messages_per_day']:.2f}")
+        if peak:
+            table.add_row(
+                "Peak Time", f"{peak['peak_day']} {peak['peak_hour']}:00"
+            )
+        table.add_row("Median Gap", f"{pace['median_gap_minutes']:.2f} minutes")
+
+        console.print(table)
+
+        if any(row["message_count"] for row in result["trend"]):
+            trend_table = Table(title=f"Daily Message Trend (Last {days} Days)")
+            trend_table.add_column("Date", style="cyan")
+            trend_table.add_column("Messages", justify="right", style="green")
+
+            for row in result["trend"][-20:]:  # Show last 20 days
+                trend_table.add_row(str(row["date"]), str(row["message_count"]))
+
+            console.print(trend_table)
+
+        if result["images"]:
+            console.print(_image_sharers_table(result["images"]))
+
+        if result["attachments"]:
+            console.print(_attachment_types_table(result["attachments"]))
+
+        console.print()
+
+
 # ============================================================================
 # ATTACHMENT ANALYTICS
 # ============================================================================
 
+def _image_sharers_table(results: list) -> Table:
+    """Build the image sharers table."""
+    table = Table(title=f"Top {len(results)} Image Sharers")
+    table.add_column("Rank", justify="right", style="cyan")
+    table.add_column("Name", style="green", max_width=30, overflow="ellipsis", no_wrap=True)
+    table.add_column("Images", justify="right", style="magenta")
+
+    for i, row in enumerate(results, 1):
+        table.add_row(
+            str(i),
+            row["name"],
+            str(row["image_count"])
+        )
+
+    return table
+
+
+def _attachment_types_table(results: list) -> Table:
+    """Build the attachment type distribution table."""
+    table = Table(title="Attachment Types")
+    table.add_column("Type", style="cyan")
+    table.add_column("Count", justify="right", style="green")
+
+    for row in results:
+        table.add_row(row["type"], str(row["count"]))
+
+    return table
+
+
 @cli.command()
 @click.argument("group_identifier")
 @click.option("--limit", default=10, help="Number of users to show")
@@ -102,20 +217,11 @@ def images(ctx: click.Context, group_identifier: str, limit: int) -> None:
     with get_session() as session:
         results = queries.get_image_sharing_stats(session, group_id, limit)
 
-        if results:
-            table = Table(title=f"Top {len(results)} Image Sharers")
-            table.add_column("Rank", justify="right", style="cyan")
-            table.add_column("Name", style="green")
-            table.add_column("Images", justify="right", style="magenta")
-
-            for i, row in enumerate(results, 1):
-                table.add_row(
-                    str(i),
-                    row["name"][:30],
-                    str(row["image_count"])
-                )
+        if _write_ndjson(results):
+            return
 
-            console.print(table)
+        if results:
+            console.print(_image_sharers_table(results))
         else:
             console.print("[yellow]No image data found[/yellow]")
 
@@ -133,15 +239,11 @@ def attachments(ctx: click.Context, group_identifier: str) -> None:
     with get_session() as session:
         results = queries.get_attachment_type_distribution(session, group_id)
 
-        if results:
-            table = Table(title="Attachment Types")
-            table.add_column("Type", style="cyan")
-            table.add_column("Count", justify="right", style="green")
-
-            for row in results:
-                table.add_row(row["type"], str(row["count"]))
+        if _write_ndjson(results):
+            return
 
-            console.print(table)
+        if results:
+            console.print(_attachment_types_table(results))
         else:
             console.print("[yellow]No attachment data found[/yellow]")
 
@@ -150,6 +252,56 @@ def attachments(ctx: click.Context, group_identifier: str) -> None:
 # ENGAGEMENT ANALYTICS
 # ============================================================================
 
+def _like_ratio_table(results: list) -> Table:
+    """Build the like-to-message ratio table."""
+    table = Table(title="Best Like-to-Message Ratios")
+    table.add_column("Rank", justify="right", style="cyan")
+    table.add_column("Name", style="green", max_width=30, overflow="ellipsis", no_wrap=True)
+    table.add_column("Messages", justify="right")
+    table.add_column("Total Likes", justify="right")
+    table.add_column("Likes/Msg", justify="right", style="magenta")
+
+    rows = [
+        (
+            str(i),
+            row["name"],
+            str(row["message_count"]),
+            str(row["total_likes"]),
+            format(row["likes_per_message"], ".2f"),
+        )
+        for i, row in enumerate(results, 1)
+    ]
+    for cells in rows:
+        table.add_row(*cells)
+
+    return table
+
+
+def _message_length_table(results: list) -> Table:
+    """Build the message length statistics table."""
+    table = Table(title="Message Length Statistics")
+    table.add_column("Name", style="green", max_width=30, overflow="ellipsis", no_wrap=True)
+    table.add_column("Messages", justify="right")
+    table.add_column("Avg", justify="right", style="cyan")
+    table.add_column("Max", justify="right")
+    table.add_column("Min", justify="right")
+
+    rows = [
+        (
+            row["name"],
+            str(row["message_count"]),
+            str(row["avg_length"]),
+            str(row["max_length"]),
+            str(row["min_length"]),
+        )
+        for row in results
+    ]
+    for cells in rows:
+        table.add_row(*cells)
+
+    return table
+
+
 @cli.command()
 @click.argument("group_identifier")
 @click.option("--limit", default=10, help="Number of users to show")
@@ -164,24 +316,11 @@ def like_ratio(ctx: click.Context, group_identifier: str, limit: int) -> None:
     with get_session() as session:
         results = queries.get_like_to_message_ratio(session, group_id, limit)
 
-        if results:
-            table = Table(title="Best Like-to-Message Ratios")
-            table.add_column("Rank", justify="right", style="cyan")
-            table.add_column("Name", style="green")
-            table.add_column("Messages", justify="right")
-            table.add_column("Total Likes", justify="right")
-            table.add_column("Likes/Msg", justify="right", style="magenta")
+        if _write_ndjson(results):
+            return
 
-            for i, row in enumerate(results, 1):
-                table.add_row(
-                    str(i),
-                    row["name"][:30],
-                    str(row["message_count"]),
-                    str(row["total_likes"]),
-                    f"{row['likes_per_message']:.2f}"
-                )
-
-            console.print(table)
+        if results:
+            console.print(_like_ratio_table(results))
         else:
             console.print("[yellow]No data found[/yellow]")
 
@@ -200,16 +339,19 @@ def mentions(ctx: click.Context, group_identifier: str, limit: int) -> None:
     with get_session() as session:
         results = queries.get_most_mentioned_users(session, group_id, limit)
 
+        if _write_ndjson(results):
+            return
+
         if results:
             table = Table(title="Most Mentioned Users")
             table.add_column("Rank", justify="right", style="cyan")
-            table.add_column("Name", style="green")
+            table.add_column("Name", style="green", max_width=30, overflow="ellipsis", no_wrap=True)
             table.add_column("Mentions", justify="right", style="magenta")
 
             for i, row in enumerate(results, 1):
                 table.add_row(
                     str(i),
-                    row["name"][:30],
+                    row["name"],
                     str(row["mention_count"])
                 )
 
@@ -233,16 +375,19 @@ def starters(ctx: click.Context, group_identifier: str, threshold: int, limit: i
     with get_session() as session:
         results = queries.get_conversation_starters(session, group_id, threshold, limit)
 
+        if _write_ndjson(results):
+            return
+
         if results:
             table = Table(title=f"Conversation Starters (>{threshold}min silence)")
             table.add_column("Rank", justify="right", style="cyan")
-            table.add_column("Name", style="green")
+            table.add_column("Name", style="green", max_width=30, overflow="ellipsis", no_wrap=True)
             table.add_column("Starts", justify="right", style="magenta")
 
             for i, row in enumerate(results, 1):
                 table.add_row(
                     str(i),
-                    row["name"][:30],
+                    row["name"],
                     str(row["conversation_starts"])
                 )
 
@@ -269,24 +414,11 @@ def message_length(ctx: click.Context, group_identifier: str, limit: int) -> Non
     with get_session() as session:
         results = queries.get_message_length_stats(session, group_id, limit)
 
-        if results:
-            table = Table(title="Message Length Statistics")
-            table.add_column("Name", style="green")
-            table.add_column("Messages", justify="right")
-            table.add_column("Avg", justify="right", style="cyan")
-            table.add_column("Max", justify="right")
-            table.add_column("Min", justify="right")
-
-            for row in results:
-                table.add_row(
-                    row["name"][:30],
-                    str(row["message_count"]),
-                    str(row["avg_length"]),
-                    str(row["max_length"]),
-                    str(row["min_length"])
-                )
+        if _write_ndjson(results):
+            return
 
-            console.print(table)
+        if results:
+            console.print(_message_length_table(results))
         else:
             console.print("[yellow]No data found[/yellow]")
 
@@ -305,6 +437,9 @@ def emojis(ctx: click.Context, group_identifier: str, limit: int) -> None:
     with get_session() as session:
         results = queries.get_emoji_usage(session, group_id, limit)
 
+        if _write_ndjson(results):
+            return
+
         if results:
             table = Table(title=f"Top {len(results)} Emojis")
             table.add_column("Rank", justify="right", style="cyan")
@@ -323,117 +458,6 @@ def emojis(ctx: click.Context, group_identifier: str, limit: int) -> None:
             console.print("[yellow]No emoji data found[/yellow]")
 
 
-# ============================================================================
-# USER-SPECIFIC TOOLS
-# ============================================================================
-
-@cli.command()
-@click.argument("group_identifier")
-@click.argument("user_id")
-@click.pass_context
-def aliases(ctx: click.Context, group_identifier: str, user_id: str) -> None:
-    """Show all names (aliases) a user has used.
-
-    Example: groupme-backup aliases 1 12345678
-    """
-    group_id = parse_group_identifier(group_identifier)
-
-    with get_session() as session:
-        results = queries.get_user_name_history(session, group_id, user_id)
-
-        if results:
-            table = Table(title=f"Name History for User {user_id}")
-            table.add_column("Name", style="green")
-            table.add_column("First Used", style="cyan")
-            table.add_column("Last Used", style="cyan")
-            table.add_column("Messages", justify="right", style="magenta")
-
-            for row in results:
-                table.add_row(
-                    row["name"],
-                    row["first_used"].strftime("%Y-%m-%d"),
-                    row["last_used"].strftime("%Y-%m-%d"),
-                    str(row["message_count"])
-                )
-
-            console.print(table)
-        else:
-            console.print(f"[yellow]No name history found for user {user_id}[/yellow]")
-
-
-@cli.command()
-@click.argument("group_identifier")
-@click.argument("name")
-@click.option("--limit", default=20, help="Number of messages to show")
-@click.pass_context
-def by_name(ctx: click.Context, group_identifier: str, name: str, limit: int) -> None:
-    """Show messages sent under a specific name.
-
-    Example: groupme-backup by-name 1 "John"
-    """
-    group_id = parse_group_identifier(group_identifier)
-
-    with get_session() as session:
-        results = queries.get_messages_by_name(session, group_id, name, limit)
-
-        if results:
-            table = Table(title=f"Messages from '{name}' (showing {len(results)})")
-            table.add_column("Date", style="cyan")
-            table.add_column("Name", style="green")
-            table.add_column("Message", style="white")
-
-            for row in results[:10]:  # Show first 10
-                text = row["text"][:60]
-                if len(row["text"]) > 60:
-                    text += "..."
-
-                table.add_row(
-                    row["created_at"].strftime("%Y-%m-%d"),
-                    row["name"][:20],
-                    text
-                )
-
-            console.print(table)
-            console.print(f"\n[dim]Found {len(results)} messages[/dim]")
-        else:
-            console.print(f"[yellow]No messages found for name '{name}'[/yellow]")
-
-
-@cli.command()
-@click.argument("group_identifier")
-@click.pass_context
-def all_aliases(ctx: click.Context, group_identifier: str) -> None:
-    """Show all users with multiple names (aliases).
-
-    Example: groupme-backup all-aliases 1
-    """
-    group_id = parse_group_identifier(group_identifier)
-
-    with get_session() as session:
-        results = queries.get_user_aliases(session, group_id)
-
-        if results:
-            table = Table(title="Users with Multiple Names")
-            table.add_column("User ID", style="cyan")
-            table.add_column("Aliases", justify="right", style="magenta")
-            table.add_column("Names", style="green")
-
-            for row in results[:20]:  # Show first 20
-                names_str = ", ".join(row["names"][:5])
-                if len(row["names"]) > 5:
-                    names_str += f" (+{len(row['names']) - 5} more)"
-
-                table.add_row(
-                    row["user_id"],
-                    str(row["alias_count"]),
-                    names_str
-                )
-
-            console.print(table)
-        else:
-            console.print("[yellow]No users with multiple names found[/yellow]")
-
-
 # ============================================================================
 # SOCIAL NETWORK ANALYTICS
 # ============================================================================
@@ -452,22 +476,33 @@ def who_mentions_who(ctx: click.Context, group_identifier: str, limit: int) -> N
     with get_session() as session:
         results = queries.get_mention_interaction_matrix(session, group_id, limit)
 
-        if results:
+        if _write_ndjson(results):
+            return
+
+        first = next(results, None)
+
+        if first is not None:
             table = Table(title="Mention Interactions")
-            table.add_column("Mentioner", style="green")
+            table.add_column(
+                "Mentioner", style="green",
+                max_width=20, overflow="ellipsis", no_wrap=True,
+            )
             table.add_column("→", style="dim")
-            table.add_column("Mentioned", style="cyan")
+            table.add_column(
+                "Mentioned", style="cyan",
+                max_width=20, overflow="ellipsis", no_wrap=True,
+            )
             table.add_column("Count", justify="right", style="magenta")
 
-            for row in results:
-                table.add_row(
-                    row["mentioner_name"][:20],
-                    "→",
-                    row["mentioned_name"][:20],
-                    str(row["mention_count"])
-                )
-
-            console.print(table)
+            # Rows are added as they stream in rather than after a full fetch
+            with Live(table, console=console):
+                for row in itertools.chain([first], results):
+                    table.add_row(
+                        row["mentioner_name"],
+                        "→",
+                        row["mentioned_name"],
+                        str(row["mention_count"])
+                    )
         else:
             console.print("[yellow]No mention data found[/yellow]")
 
@@ -491,19 +526,28 @@ def reply_patterns(ctx: click.Context, group_identifier: str, days: int, window:
     with get_session() as session:
         results = queries.get_reply_patterns(session, group_id, days, window, limit)
 
+        if _write_ndjson(results):
+            return
+
         if results:
             table = Table(title=f"Reply Patterns (Last {days} Days, within {window}min)")
-            table.add_column("First User", style="green")
+            table.add_column(
+                "First User", style="green",
+                max_width=20, overflow="ellipsis", no_wrap=True,
+            )
             table.add_column("→", style="dim")
-            table.add_column("Responder", style="cyan")
+            table.add_column(
+                "Responder", style="cyan",
+                max_width=20, overflow="ellipsis", no_wrap=True,
+            )
             table.add_column("Replies", justify="right", style="magenta")
             table.add_column("Avg Time", justify="right")
 
             for row in results:
                 table.add_row(
-                    row["first_user_name"][:20],
+                    row["first_user_name"],
                     "→",
-                    row["second_user_name"][:20],
+                    row["second_user_name"],
                     str(row["reply_count"]),
                     f"{row['avg_response_minutes']:.1f}m"
                 )
@@ -517,6 +561,77 @@ def reply_patterns(ctx: click.Context, group_identifier: str, days: int, window:
 # LEADERBOARDS
 # ============================================================================
 
+def _night_owl_table(results: list) -> Table:
+    """Build the night owl leaderboard table."""
+    table = Table(title="Night Owl Leaderboard (12 AM - 5 AM)")
+    table.add_column("Rank", justify="right", style="cyan")
+    table.add_column("Name", style="green", max_width=30, overflow="ellipsis", no_wrap=True)
+    table.add_column("Night Messages", justify="right", style="magenta")
+    table.add_column("%", justify="right")
+
+    rows = [
+        (
+            str(i),
+            row["name"],
+            str(row["night_messages"]),
+            format(row["percentage"], ".1f") + "%",
+        )
+        for i, row in enumerate(results, 1)
+    ]
+    for cells in rows:
+        table.add_row(*cells)
+
+    return table
+
+
+def _early_bird_table(results: list) -> Table:
+    """Build the early bird leaderboard table."""
+    table = Table(title="Early Bird Leaderboard (5 AM - 9 AM)")
+    table.add_column("Rank", justify="right", style="cyan")
+    table.add_column("Name", style="green", max_width=30, overflow="ellipsis", no_wrap=True)
+    table.add_column("Morning Messages", justify="right", style="magenta")
+    table.add_column("%", justify="right")
+
+    rows = [
+        (
+            str(i),
+            row["name"],
+            str(row["morning_messages"]),
+            format(row["percentage"], ".1f") + "%",
+        )
+        for i, row in enumerate(results, 1)
+    ]
+    for cells in rows:
+        table.add_row(*cells)
+
+    return table
+
+
+def _weekend_warrior_table(results: list) -> Table:
+    """Build the weekend warrior leaderboard table."""
+    table = Table(title="Weekend Warrior Leaderboard")
+    table.add_column("Rank", justify="right", style="cyan")
+    table.add_column("Name", style="green", max_width=30, overflow="ellipsis", no_wrap=True)
+    table.add_column("Weekend Msgs", justify="right")
+    table.add_column("Total", justify="right")
+    table.add_column("Weekend %", justify="right", style="magenta")
+
+    rows = [
+        (
+            str(i),
+            row["name"],
+            str(row["weekend_messages"]),
+            str(row["total_messages"]),
+            format(row["weekend_percentage"], ".1f") + "%",
+        )
+        for i, row in enumerate(results, 1)
+    ]
+    for cells in rows:
+        table.add_row(*cells)
+
+    return table
+
+
 @cli.command()
 @click.argument("group_identifier")
 @click.option("--limit", default=10, help="Number of users to show")
@@ -531,22 +646,11 @@ def night_owl(ctx: click.Context, group_identifier: str, limit: int) -> None:
     with get_session() as session:
         results = queries.get_night_owl_leaderboard(session, group_id, limit)
 
-        if results:
-            table = Table(title="Night Owl Leaderboard (12 AM - 5 AM)")
-            table.add_column("Rank", justify="right", style="cyan")
-            table.add_column("Name", style="green")
-            table.add_column("Night Messages", justify="right", style="magenta")
-            table.add_column("%", justify="right")
+        if _write_ndjson(results):
+            return
 
-            for i, row in enumerate(results, 1):
-                table.add_row(
-                    str(i),
-                    row["name"][:30],
-                    str(row["night_messages"]),
-                    f"{row['percentage']:.1f}%"
-                )
-
-            console.print(table)
+        if results:
+            console.print(_night_owl_table(results))
         else:
             console.print("[yellow]No night owl data found[/yellow]")
 
@@ -565,22 +669,11 @@ def early_bird(ctx: click.Context, group_identifier: str, limit: int) -> None:
     with get_session() as session:
         results = queries.get_early_bird_leaderboard(session, group_id, limit)
 
-        if results:
-            table = Table(title="Early Bird Leaderboard (5 AM - 9 AM)")
-            table.add_column("Rank", justify="right", style="cyan")
-            table.add_column("Name", style="green")
-            table.add_column("Morning Messages", justify="right", style="magenta")
-            table.add_column("%", justify="right")
-
-            for i, row in enumerate(results, 1):
-                table.add_row(
-                    str(i),
-                    row["name"][:30],
-                    str(row["morning_messages"]),
-                    f"{row['percentage']:.1f}%"
-                )
+        if _write_ndjson(results):
+            return
 
-            console.print(table)
+        if results:
+            console.print(_early_bird_table(results))
         else:
             console.print("[yellow]No early bird data found[/yellow]")
 
@@ -599,28 +692,53 @@ def weekend_warrior(ctx: click.Context, group_identifier: str, limit: int) -> No
     with get_session() as session:
         results = queries.get_weekend_warrior_leaderboard(session, group_id, limit)
 
-        if results:
-            table = Table(title="Weekend Warrior Leaderboard")
-            table.add_column("Rank", justify="right", style="cyan")
-            table.add_column("Name", style="green")
-            table.add_column("Weekend Msgs", justify="right")
-            table.add_column("Total", justify="right")
-            table.add_column("Weekend %", justify="right", style="magenta")
-
-            for i, row in enumerate(results, 1):
-                table.add_row(
-                    str(i),
-                    row["name"][:30],
-                    str(row["weekend_messages"]),
-                    str(row["total_messages"]),
-                    f"{row['weekend_percentage']:.1f}%"
-                )
+        if _write_ndjson(results):
+            return
 
-            console.print(table)
+        if results:
+            console.print(_weekend_warrior_table(results))
         else:
             console.print("[yellow]No weekend warrior data found[/yellow]")
 
 
+@cli.command()
+@click.argument("group_identifier")
+@click.option("--limit", default=10, help="Number of users per leaderboard")
+@click.pass_context
+def leaderboards(ctx: click.Context, group_identifier: str, limit: int) -> None:
+    """Show the night owl, early bird, weekend warrior, like ratio and
+    message length leaderboards.
+
+    All five are computed in a single database query.
+
+    Example: groupme-backup leaderboards 1
+    """
+    group_id = parse_group_identifier(group_identifier)
+
+    with get_session() as session:
+        results = queries.get_all_leaderboards(session, group_id, limit)
+
+    if _write_ndjson(
+        {"leaderboard": name, **row} for name, rows in results.items() for row in rows
+    ):
+        return
+
+    if not any(results.values()):
+        console.print("[yellow]No leaderboard data found[/yellow]")
+        return
+
+    if results["night_owl"]:
+        console.print(_night_owl_table(results["night_owl"]))
+    if results["early_bird"]:
+        console.print(_early_bird_table(results["early_bird"]))
+    if results["weekend_warrior"]:
+        console.print(_weekend_warrior_table(results["weekend_warrior"]))
+    if results["like_ratio"]:
+        console.print(_like_ratio_table(results["like_ratio"]))
+    if results["message_length"]:
+        console.print(_message_length_table(results["message_length"]))
+
+
 @cli.command()
 @click.argument("group_identifier")
 @click.option("--days", default=30, help="Number of days to analyze")
@@ -636,23 +754,27 @@ def controversial(ctx: click.Context, group_identifier: str, days: int, limit: i
     with get_session() as session:
         results = queries.get_controversial_messages(session, group_id, days, limit)
 
+        if _write_ndjson(results):
+            return
+
         if results:
             table = Table(title=f"Controversial Messages (Last {days} Days)")
             table.add_column("Date", style="cyan")
-            table.add_column("Name", style="green")
+            table.add_column("Name", style="green", max_width=15, overflow="ellipsis", no_wrap=True)
             table.add_column("Message", style="white")
             table.add_column("Likes", justify="right")
             table.add_column("Replies", justify="right")
             table.add_column("Score", justify="right", style="magenta")
 
             for row in results:
-                text = row["text"][:40]
-                if len(row["text"]) > 40:
+                text = row["text_preview"][:40]
+                if row["full_len"] > 40:
                     text += "..."
 
+                created_at = row["created_at"]
                 table.add_row(
-                    row["created_at"].strftime("%m/%d"),
-                    row["name"][:15],
+                    f"{created_at.month:02d}/{created_at.day:02d}",
+                    row["name"],
                     text,
                     str(row["like_count"]),
                     str(row["reply_count"]),
@@ -1,40 +1,54 @@
 """Analytics CLI commands."""
 
+import itertools
 from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
 
 import click
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
+from rich.text import Text
 
 from ..analytics import queries
 from ..db.session import get_session
+from .common import parse_group_identifier
 from .main import cli
 
 console = Console()
 
 
-def parse_group_identifier(identifier: str) -> str:
+def _fmt_datetime(value: datetime) -> str:
+    """Format a timestamp as YYYY-MM-DD HH:MM without strftime."""
+    return (
+        f"{value.year:04d}-{value.month:02d}-{value.day:02d} "
+        f"{value.hour:02d}:{value.minute:02d}"
+    )
+
+
+def _context_line(msg: Dict[str, Any]) -> Text:
     """
-    Parse group identifier - can be a numeric index or group ID.
+    Format a surrounding message in a search result's context panel.
 
-    Returns the group ID.
+    Returned as plain Text so Rich does not parse user-written brackets as
+    markup.
     """
-    from ..utils.groups_cache import get_group_id_by_index
-
-    # Try to parse as integer (numeric index)
-    try:
-        index = int(identifier)
-        group_id = get_group_id_by_index(index)
-        if group_id:
-            return group_id
-        else:
-            console.print(f"[red]Error:[/red] No group at index {index}")
-            console.print("Run [cyan]groupme-backup groups[/cyan] to see available groups")
-            raise click.Abort()
-    except ValueError:
-        # Not a number, assume it's a group ID
-        return identifier
+    return Text(
+        f"{_fmt_datetime(msg['created_at'])} {msg['sender_name']}: {msg['text'][:80]}",
+        style="dim",
+    )
+
+
+def _preview(text: str, width: int) -> Text:
+    """
+    Truncate message text for a table cell.
+
+    Returned as plain Text so Rich does not parse user-written brackets as
+    markup.
+    """
+    if len(text) > width:
+        return Text(text[:width] + "...")
+    return Text(text)
 
 
 @cli.command()
@@ -69,18 +83,18 @@ def popular(ctx: click.Context, group_identifier: str, days: int, limit: int) ->
         table.add_column("Message", style="white")
         table.add_column("Date", style="dim")
 
-        for i, msg in enumerate(results, 1):
-            text = msg["text"][:60]
-            if len(msg["text"]) > 60:
-                text += "..."
-
-            table.add_row(
+        rows = [
+            (
                 str(i),
                 str(msg["like_count"]),
-                msg["sender_name"][:20],
-                text,
-                msg["created_at"].strftime("%Y-%m-%d %H:%M"),
+                Text(msg["sender_name"][:20]),
+                _preview(msg["text"], 60),
+                _fmt_datetime(msg["created_at"]),
             )
+            for i, msg in enumerate(results, 1)
+        ]
+        for cells in rows:
+            table.add_row(*cells)
 
         console.print(table)
 
@@ -106,20 +120,25 @@ def consecutive(ctx: click.Context, group_identifier: str) -> None:
             console.print("[yellow]No consecutive messages found[/yellow]")
             return
 
+        duration = result["streak_end"] - result["streak_start"]
+        # The name is user-written, so the output is built as Text rather
+        # than parsed as markup
         console.print(
-            f"\n[bold]Longest Consecutive Message Streak:[/bold]\n"
-        )
-        console.print(f"[green]User:[/green] {result['name']}")
-        console.print(f"[green]Messages:[/green] {result['consecutive_count']}")
-        console.print(
-            f"[green]Period:[/green] {result['streak_start'].strftime('%Y-%m-%d %H:%M')} "
-            f"to {result['streak_end'].strftime('%Y-%m-%d %H:%M')}"
+            Text.assemble(
+                ("\nLongest Consecutive Message Streak:", "bold"),
+                "\n\n",
+                ("User:", "green"),
+                f" {result['name']}\n",
+                ("Messages:", "green"),
+                f" {result['consecutive_count']}\n",
+                ("Period:", "green"),
+                f" {_fmt_datetime(result['streak_start'])} "
+                f"to {_fmt_datetime(result['streak_end'])}\n",
+                ("Duration:", "green"),
+                f" {duration}\n",
+            )
         )
 
-        duration = result["streak_end"] - result["streak_start"]
-        console.print(f"[green]Duration:[/green] {duration}")
-        console.print()
-
 
 @cli.command()
 @click.argument("group_identifier")
@@ -149,10 +168,12 @@ def active(ctx: click.Context, group_identifier: str, days: int, limit: int) ->
         table.add_column("User", style="green")
         table.add_column("Messages", style="magenta", justify="right")
 
-        for i, user in enumerate(results, 1):
-            table.add_row(
-                str(i), user["name"][:30], str(user["message_count"])
-            )
+        rows = [
+            (str(i), Text(user["name"][:30]), str(user["message_count"]))
+            for i, user in enumerate(results, 1)
+        ]
+        for cells in rows:
+            table.add_row(*cells)
 
         console.print(table)
 
@@ -185,8 +206,12 @@ def liked(ctx: click.Context, group_identifier: str, days: int, limit: int) -> N
         table.add_column("User", style="green")
         table.add_column("Total Likes", style="magenta", justify="right")
 
-        for i, user in enumerate(results, 1):
-            table.add_row(str(i), user["name"][:30], str(user["total_likes"]))
+        rows = [
+            (str(i), Text(user["name"][:30]), str(user["total_likes"]))
+            for i, user in enumerate(results, 1)
+        ]
+        for cells in rows:
+            table.add_row(*cells)
 
         console.print(table)
 
@@ -212,8 +237,6 @@ def stats(ctx: click.Context, group_identifier: str) -> None:
             console.print(f"[red]Error:[/red] {result['error']}")
             return
 
-        console.print(f"\n[bold]{result['group_name']}[/bold] Statistics\n")
-
         table = Table(show_header=False, box=None)
         table.add_column("Metric", style="cyan")
         table.add_column("Value", style="green")
@@ -228,21 +251,21 @@ def stats(ctx: click.Context, group_identifier: str) -> None:
         if result["first_message"]:
             table.add_row(
                 "First Message",
-                result["first_message"].strftime("%Y-%m-%d %H:%M"),
+                _fmt_datetime(result["first_message"]),
             )
         if result["last_message"]:
             table.add_row(
                 "Last Message",
-                result["last_message"].strftime("%Y-%m-%d %H:%M"),
+                _fmt_datetime(result["last_message"]),
             )
         if result["last_synced_at"]:
             table.add_row(
                 "Last Synced",
-                result["last_synced_at"].strftime("%Y-%m-%d %H:%M"),
+                _fmt_datetime(result["last_synced_at"]),
             )
 
-        console.print(table)
-        console.print()
+        heading = Text.assemble("\n", (result["group_name"], "bold"), " Statistics\n")
+        console.print(Group(heading, table, ""))
 
 
 @cli.command()
@@ -291,8 +314,12 @@ def response_time(ctx: click.Context, group_identifier: str) -> None:
 @click.argument("text", required=False)
 @click.option("--user", help="Filter by username")
 @click.option("--liked-by", help="Filter by who liked the message")
-@click.option("--after", help="Messages after date (YYYY-MM-DD)")
-@click.option("--before", help="Messages before date (YYYY-MM-DD)")
+@click.option(
+    "--after", type=click.DateTime(formats=["%Y-%m-%d"]), help="Messages after date (YYYY-MM-DD)"
+)
+@click.option(
+    "--before", type=click.DateTime(formats=["%Y-%m-%d"]), help="Messages before date (YYYY-MM-DD)"
+)
 @click.option("--case-sensitive", is_flag=True, help="Case-sensitive text search")
 @click.option("--exact", is_flag=True, help="Exact phrase match")
 @click.option("--limit", default=50, help="Maximum results to show")
@@ -305,8 +332,8 @@ def search(
     text: str,
     user: str,
     liked_by: str,
-    after: str,
-    before: str,
+    after: Optional[datetime],
+    before: Optional[datetime],
     case_sensitive: bool,
     exact: bool,
     limit: int,
@@ -327,28 +354,12 @@ def search(
         groupme-backup search 1 "urgent" --case-sensitive --exact
         groupme-backup search 1 "meeting" --with-context
     """
-    group_id = parse_group_identifier(group_identifier)
+    # click has already validated the date format; dates are taken as UTC
+    after_date = after.replace(tzinfo=timezone.utc) if after else None
+    before_date = before.replace(tzinfo=timezone.utc) if before else None
 
-    # Parse dates
-    after_date = None
-    before_date = None
-    if after:
-        try:
-            after_date = datetime.strptime(after, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-        except ValueError:
-            console.print(f"[red]Invalid date format for --after: {after}[/red]")
-            console.print("Use format: YYYY-MM-DD (e.g., 2024-01-01)")
-            raise click.Abort()
-
-    if before:
-        try:
-            before_date = datetime.strptime(before, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-        except ValueError:
-            console.print(f"[red]Invalid date format for --before: {before}[/red]")
-            console.print("Use format: YYYY-MM-DD (e.g., 2024-12-31)")
-            raise click.Abort()
-
-    # Validate at least one search criterion
+    # Validate at least one search criterion before resolving the group or
+    # opening a database session, so invalid invocations touch neither
     if not any([text, user, liked_by, after_date, before_date]):
         console.print("[red]Error:[/red] Please provide at least one search criterion")
         console.print("  - Search text (positional argument)")
@@ -358,10 +369,77 @@ def search(
         console.print("  - --before date")
         raise click.Abort()
 
+    group_id = parse_group_identifier(group_identifier)
+
+    # Build title with filters
+    title_parts = []
+    if text:
+        title_parts.append(f'"{text}"')
+    if user:
+        title_parts.append(f"by {user}")
+    if liked_by:
+        title_parts.append(f"liked by {liked_by}")
+    if after_date:
+        title_parts.append(f"after {after_date.date().isoformat()}")
+    if before_date:
+        title_parts.append(f"before {before_date.date().isoformat()}")
+    filters_title = " ".join(title_parts)
+
+    # One extra row tells whether more results exist without a COUNT(*)
+    fetch_limit = limit + 1
+
     with get_session() as session:
+        if not with_context and not show_likers:
+            # Compact table view: rows go straight from the cursor into the
+            # table rather than through a list of every result first
+            table = Table()
+            table.add_column("#", style="cyan", justify="right", width=4)
+            table.add_column("Date", style="dim", width=16)
+            table.add_column("Sender", style="green", width=20)
+            table.add_column("Message", style="white")
+            table.add_column("Likes", style="magenta", justify="right", width=6)
+
+            rows = queries.iter_search_messages(
+                session,
+                group_id,
+                text=text,
+                user=user,
+                liked_by=liked_by,
+                after=after_date,
+                before=before_date,
+                case_sensitive=case_sensitive,
+                exact=exact,
+                limit=fetch_limit,
+            )
+            for i, msg in enumerate(itertools.islice(rows, limit), 1):
+                table.add_row(
+                    str(i),
+                    _fmt_datetime(msg["created_at"]),
+                    Text(msg["sender_name"][:20]),
+                    _preview(msg["text"], 80),
+                    str(msg["like_count"]),
+                )
+            has_more = next(rows, None) is not None
+
+            if not table.row_count:
+                console.print("[yellow]No messages found matching your criteria[/yellow]")
+                return
+
+            table.title = f"Search Results: {filters_title} ({table.row_count} found)"
+            console.print(f"\n[bold]{table.title}[/bold]\n")
+            console.print(table)
+            console.print()
+
+            if has_more:
+                console.print(
+                    f"[dim]Showing first {limit} results. "
+                    "Use --limit to see more.[/dim]"
+                )
+            return
+
         results = queries.search_messages(
-            session=session,
-            group_id=group_id,
+            session,
+            group_id,
             text=text,
             user=user,
             liked_by=liked_by,
@@ -369,77 +447,58 @@ def search(
             before=before_date,
             case_sensitive=case_sensitive,
             exact=exact,
-            limit=limit,
+            limit=fetch_limit,
         )
+        has_more = len(results) > limit
+        results = results[:limit]
 
         if not results:
             console.print("[yellow]No messages found matching your criteria[/yellow]")
             return
 
-        # Build title with filters
-        title_parts = []
-        if text:
-            title_parts.append(f'"{text}"')
-        if user:
-            title_parts.append(f"by {user}")
-        if liked_by:
-            title_parts.append(f"liked by {liked_by}")
-        if after_date:
-            title_parts.append(f"after {after}")
-        if before_date:
-            title_parts.append(f"before {before}")
-
-        title = f"Search Results: {' '.join(title_parts)} ({len(results)} found)"
+        title = f"Search Results: {filters_title} ({len(results)} found)"
         console.print(f"\n[bold]{title}[/bold]\n")
 
+        # Who liked each result, fetched for all of them at once
+        likers: Dict[str, List[str]] = {}
+        if show_likers or not with_context:
+            likers = queries.get_likers(
+                session, [msg["message_id"] for msg in results if msg["like_count"] > 0]
+            )
+
         # Display results
         if with_context:
-            # Show detailed view with context
+            # Show detailed view with context, fetched for all results at once
+            contexts = queries.get_search_results_with_context(
+                session, group_id, [msg["message_id"] for msg in results]
+            )
             for i, msg in enumerate(results, 1):
-                context = queries.get_message_context(session, group_id, msg["message_id"])
-
-                # Build context display
-                lines = []
+                context = contexts[msg["message_id"]]
 
-                # Before messages (dimmed)
-                if context.get("before"):
-                    for before_msg in context["before"]:
-                        lines.append(
-                            f"[dim]{before_msg['created_at'].strftime('%Y-%m-%d %H:%M')} "
-                            f"{before_msg['sender_name']}: {before_msg['text'][:80]}[/dim]"
-                        )
+                # Build context display, before messages (dimmed) first
+                lines = [_context_line(m) for m in context.get("before", ())]
 
                 # Target message (highlighted)
                 lines.append(
-                    f"[bold green]{msg['created_at'].strftime('%Y-%m-%d %H:%M')} "
-                    f"{msg['sender_name']}[/bold green]: [white]{msg['text'][:200]}[/white]"
+                    Text.assemble(
+                        (f"{_fmt_datetime(msg['created_at'])} {msg['sender_name']}", "bold green"),
+                        ": ",
+                        (msg["text"][:200], "white"),
+                    )
                 )
                 if msg['like_count'] > 0:
-                    lines.append(f"[magenta]❤ {msg['like_count']} likes[/magenta]")
+                    lines.append(Text(f"❤ {msg['like_count']} likes", style="magenta"))
 
                     # Show who liked if requested
-                    if show_likers:
-                        from ..db.models import Message, MessageFavorite, User
-                        message_obj = session.query(Message).filter(Message.id == msg["message_id"]).first()
-                        if message_obj and message_obj.favorites:
-                            liker_names = []
-                            for fav in message_obj.favorites:
-                                user = session.query(User).filter(User.id == fav.user_id).first()
-                                if user:
-                                    liker_names.append(user.name)
-                            if liker_names:
-                                lines.append(f"[dim]Liked by: {', '.join(liker_names[:10])}[/dim]")
+                    liker_names = likers.get(msg["message_id"])
+                    if liker_names:
+                        lines.append(Text(f"Liked by: {', '.join(liker_names[:10])}", style="dim"))
 
                 # After messages (dimmed)
-                if context.get("after"):
-                    for after_msg in context["after"]:
-                        lines.append(
-                            f"[dim]{after_msg['created_at'].strftime('%Y-%m-%d %H:%M')} "
-                            f"{after_msg['sender_name']}: {after_msg['text'][:80]}[/dim]"
-                        )
+                lines.extend(_context_line(m) for m in context.get("after", ()))
 
                 panel = Panel(
-                    "\n".join(lines),
+                    Text("\n").join(lines),
                     title=f"Result {i}/{len(results)}",
                     border_style="blue",
                 )
@@ -447,73 +506,37 @@ def search(
                 console.print()
 
         else:
-            # Show table view
-            if show_likers:
-                # Show detailed view with likers
-                from ..db.models import Message, MessageFavorite, User
-
-                for i, msg in enumerate(results, 1):
-                    console.print(f"\n[cyan]#{i}[/cyan] {msg['created_at'].strftime('%Y-%m-%d %H:%M')} - [green]{msg['sender_name']}[/green]")
-
-                    text_preview = msg["text"][:120]
-                    if len(msg["text"]) > 120:
-                        text_preview += "..."
-                    console.print(f"  {text_preview}")
-
-                    if msg['like_count'] > 0:
-                        console.print(f"  [magenta]❤ {msg['like_count']} likes[/magenta]", end="")
-
-                        # Get who liked it
-                        message_obj = session.query(Message).filter(Message.id == msg["message_id"]).first()
-                        if message_obj and message_obj.favorites:
-                            liker_names = []
-                            for fav in message_obj.favorites:
-                                user = session.query(User).filter(User.id == fav.user_id).first()
-                                if user:
-                                    liker_names.append(user.name)
-                            if liker_names:
-                                console.print(f" - [dim]{', '.join(liker_names[:15])}[/dim]")
-                            else:
-                                console.print()
-                        else:
-                            console.print()
-                    console.print()
-
-                if len(results) == limit:
-                    console.print(
-                        f"[dim]Showing first {limit} results. "
-                        "Use --limit to see more.[/dim]"
-                    )
-            else:
-                # Show compact table view
-                table = Table(title=title)
-                table.add_column("#", style="cyan", justify="right", width=4)
-                table.add_column("Date", style="dim", width=16)
-                table.add_column("Sender", style="green", width=20)
-                table.add_column("Message", style="white")
-                table.add_column("Likes", style="magenta", justify="right", width=6)
-
-                for i, msg in enumerate(results, 1):
-                    text_preview = msg["text"][:80]
-                    if len(msg["text"]) > 80:
-                        text_preview += "..."
-
-                    table.add_row(
-                        str(i),
-                        msg["created_at"].strftime("%Y-%m-%d %H:%M"),
-                        msg["sender_name"][:20],
-                        text_preview,
-                        str(msg["like_count"]),
+            # Show detailed view with likers
+            for i, msg in enumerate(results, 1):
+                console.print(
+                    Text.assemble(
+                        "\n",
+                        (f"#{i}", "cyan"),
+                        f" {_fmt_datetime(msg['created_at'])} - ",
+                        (msg["sender_name"], "green"),
                     )
+                )
 
-                console.print(table)
+                text_preview = msg["text"][:120]
+                if len(msg["text"]) > 120:
+                    text_preview += "..."
+                console.print(Text(f"  {text_preview}"))
+
+                if msg['like_count'] > 0:
+                    console.print(f"  [magenta]❤ {msg['like_count']} likes[/magenta]", end="")
+
+                    liker_names = likers.get(msg["message_id"])
+                    if liker_names:
+                        console.print(Text(f" - {', '.join(liker_names[:15])}", style="dim"))
+                    else:
+                        console.print()
                 console.print()
 
-                if len(results) == limit:
-                    console.print(
-                        f"[dim]Showing first {limit} results. "
-                        "Use --limit to see more.[/dim]"
-                    )
+            if has_more:
+                console.print(
+                    f"[dim]Showing first {limit} results. "
+                    "Use --limit to see more.[/dim]"
+                )
 
 
 @cli.command()
@@ -538,7 +561,7 @@ def aliases(ctx: click.Context, group_identifier: str, user: str) -> None:
             console.print(f"[red]Error:[/red] {result['error']}")
             return
 
-        console.print(f"\n[bold]{result['current_name']}[/bold]")
+        console.print(Text.assemble("\n", (result["current_name"], "bold")))
         console.print(f"User ID: [dim]{result['user_id']}[/dim]")
         console.print(f"Total aliases: [cyan]{result['total_aliases']}[/cyan]\n")
 
@@ -549,19 +572,21 @@ def aliases(ctx: click.Context, group_identifier: str, user: str) -> None:
         table.add_column("First Used", style="dim")
         table.add_column("Last Used", style="dim")
 
+        current_name = result["current_name"]
         for i, alias in enumerate(result["aliases"], 1):
-            # Highlight current name
-            name_style = "bold green" if alias["name"] == result["current_name"] else "white"
-            name = f"[{name_style}]{alias['name']}[/{name_style}]"
-            if alias["name"] == result["current_name"]:
-                name += " [cyan](current)[/cyan]"
+            # Highlight current name; built as Text so names are not parsed as markup
+            if alias["name"] == current_name:
+                name = Text(alias["name"], style="bold green")
+                name.append(" (current)", style="cyan")
+            else:
+                name = Text(alias["name"], style="white")
 
             table.add_row(
                 str(i),
                 name,
                 f"{alias['message_count']:,}",
-                alias["first_used"].strftime("%Y-%m-%d"),
-                alias["last_used"].strftime("%Y-%m-%d"),
+                alias["first_used"].date().isoformat(),
+                alias["last_used"].date().isoformat(),
             )
 
         console.print(table)
@@ -585,28 +610,29 @@ def all_aliases(ctx: click.Context, group_identifier: str, min_aliases: int, lim
     group_id = parse_group_identifier(group_identifier)
 
     with get_session() as session:
-        results = queries.get_all_users_with_aliases(session, group_id, min_aliases)
+        results = queries.get_all_users_with_aliases(session, group_id, min_aliases, limit)
 
         if not results:
             console.print(f"[yellow]No users found with {min_aliases}+ aliases[/yellow]")
             return
 
-        # Limit results
-        results = results[:limit]
-
         table = Table(title=f"Users with Multiple Names ({len(results)} shown)")
         table.add_column("Rank", style="cyan", justify="right")
         table.add_column("Current Name", style="green")
         table.add_column("Aliases", style="magenta", justify="right")
         table.add_column("Messages", style="dim", justify="right")
 
-        for i, user in enumerate(results, 1):
-            table.add_row(
+        rows = [
+            (
                 str(i),
-                user["current_name"][:40],
+                Text(user["current_name"][:40]),
                 str(user["alias_count"]),
                 f"{user['total_messages']:,}",
             )
+            for i, user in enumerate(results, 1)
+        ]
+        for cells in rows:
+            table.add_row(*cells)
 
         console.print(table)
         console.print(f"\n[dim]Use 'groupme-backup aliases {group_identifier} --user <name>' to see details[/dim]")
@@ -647,36 +673,122 @@ def by_name(
             console.print(f"[red]Error:[/red] {result['error']}")
             return
 
-        console.print(f"\n[bold]{result['current_name']}[/bold]")
-        console.print(f"Historical name: [green]{result['historical_name']}[/green]")
+        console.print(Text.assemble("\n", (result["current_name"], "bold")))
+        console.print(Text.assemble("Historical name: ", (result["historical_name"], "green")))
         console.print(
-            f"Period: {result['date_range']['first'].strftime('%Y-%m-%d')} to "
-            f"{result['date_range']['last'].strftime('%Y-%m-%d')}"
+            f"Period: {result['date_range']['first'].date().isoformat()} to "
+            f"{result['date_range']['last'].date().isoformat()}"
         )
         console.print(f"Messages during this period: [cyan]{result['message_count']}[/cyan]\n")
 
-        table = Table(title=f"Messages as '{result['historical_name']}'")
+        table = Table(title=Text(f"Messages as '{result['historical_name']}'"))
         table.add_column("#", style="dim", justify="right", width=4)
         table.add_column("Date", style="dim", width=16)
         table.add_column("Message", style="white")
         table.add_column("Likes", style="magenta", justify="right", width=6)
 
-        for i, msg in enumerate(result["messages"], 1):
-            text_preview = msg["text"][:80]
-            if len(msg["text"]) > 80:
-                text_preview += "..."
-
-            table.add_row(
+        rows = [
+            (
                 str(i),
-                msg["created_at"].strftime("%Y-%m-%d %H:%M"),
-                text_preview,
+                _fmt_datetime(msg["created_at"]),
+                _preview(msg["text"], 80),
                 str(msg["like_count"]),
             )
+            for i, msg in enumerate(result["messages"], 1)
+        ]
+        for cells in rows:
+            table.add_row(*cells)
 
         console.print(table)
         console.print()
 
-        if result["message_count"] == limit:
+        if result["has_more"]:
             console.print(
                 f"[dim]Showing first {limit} results. Use --limit to see more.[/dim]"
             )
+
+
+@cli.command()
+@click.argument("group_identifier")
+@click.option("--user", required=True, help="Username to search for")
+@click.option("--limit", default=10, help="Number of recent messages to show")
+@click.pass_context
+def profile(ctx: click.Context, group_identifier: str, user: str, limit: int) -> None:
+    """Show a user's names, message totals and recent messages.
+
+    Combines 'aliases' and 'by-name' into a single database query.
+
+    GROUP_IDENTIFIER can be a numeric index (from 'groups' command) or group ID.
+
+    Examples:
+        groupme-backup profile 1 --user "Calm"
+        groupme-backup profile 1 --user "Chuck" --limit 20
+    """
+    group_id = parse_group_identifier(group_identifier)
+
+    with get_session() as session:
+        result = queries.get_user_profile(session, group_id, user, limit)
+
+        if "error" in result:
+            console.print(f"[red]Error:[/red] {result['error']}")
+            return
+
+        stats = result["stats"]
+        console.print(Text.assemble("\n", (result["current_name"], "bold")))
+        console.print(f"User ID: [dim]{result['user_id']}[/dim]")
+        console.print(
+            f"Messages: [cyan]{stats['message_count']:,}[/cyan]  "
+            f"Likes received: [magenta]{stats['total_likes']:,}[/magenta]"
+        )
+        console.print(
+            f"Active: {stats['first_message'].date().isoformat()} to "
+            f"{stats['last_message'].date().isoformat()}\n"
+        )
+
+        table = Table(title=f"All Names Used ({len(result['aliases'])} total)")
+        table.add_column("#", style="dim", justify="right", width=4)
+        table.add_column("Name", style="green")
+        table.add_column("Messages", style="cyan", justify="right")
+        table.add_column("First Used", style="dim")
+        table.add_column("Last Used", style="dim")
+
+        current_name = result["current_name"]
+        for i, alias in enumerate(result["aliases"], 1):
+            name = Text(alias["name"])
+            if alias["name"] == current_name:
+                name.stylize("bold green")
+                name.append(" (current)", style="cyan")
+
+            table.add_row(
+                str(i),
+                name,
+                f"{alias['message_count']:,}",
+                alias["first_used"].date().isoformat(),
+                alias["last_used"].date().isoformat(),
+            )
+
+        console.print(table)
+        console.print()
+
+        table = Table(title="Recent Messages")
+        table.add_column("Date", style="dim", width=16)
+        table.add_column("Name", style="green", max_width=20, overflow="ellipsis", no_wrap=True)
+        table.add_column("Message", style="white")
+        table.add_column("Likes", style="magenta", justify="right", width=6)
+
+        for msg in result["recent_messages"]:
+            text_preview = msg["text_preview"]
+            if msg["full_len"] > len(text_preview):
+                text_preview += "..."
+
+            # Names and message text are user-written, so they go in as Text
+            # rather than being parsed as markup
+            table.add_row(
+                _fmt_datetime(msg["created_at"]),
+                Text(msg["name"] or "Unknown"),
+                Text(text_preview),
+                str(msg["like_count"]),
+            )
+
+        console.print(table)
+        console.print()
@@ -1,21 +1,52 @@
 """Backup CLI commands."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import click
-from rich.console import Console
+from rich.console import Console, Group
+from rich.live import Live
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
+from rich.text import Text
 
 from ..api.client import GroupMeClient
 from ..db.session import get_session
 from ..sync.engine import SyncEngine
+from .common import echo_rows_via_pager, load_groups, should_page
 from .main import cli
 
 logger = logging.getLogger(__name__)
 console = Console()
 
 
+# Results shown while backup --all runs; the full table is printed at the end
+_LIVE_RESULTS_SHOWN = 10
+
+
+def _sync_results_table(title: str, results: list[tuple[str, int, str | None]]) -> Table:
+    """Tabulate (group name, new messages, error) results from backup --all."""
+    table = Table(title=title)
+    table.add_column("Group", style="green")
+    table.add_column("New Messages", style="magenta", justify="right")
+    table.add_column("Status")
+
+    for name, messages_count, error in results:
+        status = Text(f"✗ {error}", style="red") if error else Text("✓", style="green")
+        table.add_row(Text(name), str(messages_count), status)
+
+    return table
+
+
+def _sync_group(
+    api_client: GroupMeClient, group_id: str, fast_mode: bool
+) -> tuple[int, str | None]:
+    """Sync one group in its own session, so groups can sync on worker threads."""
+    with get_session() as session:
+        sync_engine = SyncEngine(api_client, session, fast_mode=fast_mode)
+        return sync_engine.sync_group_with_retry(group_id)
+
+
 @cli.command()
 @click.option("--group-id", help="Specific group ID to backup")
 @click.option("--all", "backup_all", is_flag=True, help="Backup all groups")
@@ -78,7 +109,7 @@ def backup(ctx: click.Context, group_id: str | None, backup_all: bool, fast_mode
                 member_count = members.get("count") if members and isinstance(members, dict) else "?"
                 table.add_row(
                     group["id"],
-                    group.get("name", "Unknown"),
+                    Text(group.get("name", "Unknown")),
                     str(member_count),
                 )
 
@@ -88,31 +119,42 @@ def backup(ctx: click.Context, group_id: str | None, backup_all: bool, fast_mode
             console.print(table)
             console.print()
 
-            # Sync all groups
-            with Progress(console=console) as progress:
-                task = progress.add_task(
-                    "[cyan]Syncing groups...", total=len(groups)
+            # Sync all groups; each worker has its own session and the API
+            # client's rate limiter is shared between them. Results are shown
+            # in one live view redrawn a few times a second rather than
+            # printed line by line.
+            total_new = 0
+            results: list[tuple[str, int, str | None]] = []
+            progress = Progress(console=console)
+            task = progress.add_task("[cyan]Syncing groups...", total=len(groups))
+
+            def render() -> Group:
+                return Group(
+                    progress,
+                    _sync_results_table("Latest Results", results[-_LIVE_RESULTS_SHOWN:]),
                 )
 
-                for group in groups:
-                    progress.update(
-                        task, description=f"[cyan]Syncing {group['name'][:30]}..."
-                    )
-                    messages_count, error = sync_engine.sync_group_with_retry(
-                        group["id"]
-                    )
-
-                    if error:
-                        console.print(
-                            f"[red]✗[/red] {group['name']}: {error}"
-                        )
-                    else:
-                        console.print(
-                            f"[green]✓[/green] {group['name']}: "
-                            f"{messages_count} new messages"
-                        )
-
-                    progress.update(task, advance=1)
+            workers = max(1, min(settings.backup_concurrency, len(groups)))
+            with Live(
+                render(), console=console, refresh_per_second=4, transient=True
+            ) as live, ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(_sync_group, api_client, group["id"], fast_mode): group
+                    for group in groups
+                }
+                for future in as_completed(futures):
+                    group = futures[future]
+                    messages_count, error = future.result()
+
+                    results.append((group.get("name", "Unknown"), messages_count, error))
+                    total_new += messages_count
+                    progress.advance(task)
+                    live.update(render())
+
+            console.print(_sync_results_table("Backup Results", results))
+
+            if total_new:
+                sync_engine.refresh_rollups()
 
             console.print("\n[bold green]Backup complete![/bold green]")
 
@@ -132,6 +174,8 @@ def backup(ctx: click.Context, group_id: str | None, backup_all: bool, fast_mode
             if error:
                 console.print(f"\n[red]Error:[/red] {error}")
             else:
+                if messages_count:
+                    sync_engine.refresh_rollups()
                 console.print(
                     f"\n[green]Success![/green] Fetched {messages_count} new messages"
                 )
@@ -139,27 +183,50 @@ def backup(ctx: click.Context, group_id: str | None, backup_all: bool, fast_mode
 
 @cli.command("list-groups")
 @click.option("--limit", default=None, type=int, help="Limit number of groups shown")
+@click.option("--refresh", is_flag=True, help="Refresh groups from API")
+@click.option(
+    "--page/--no-page",
+    default=None,
+    help="Show groups as plain text in a pager (default: when more than 500)",
+)
 @click.pass_context
-def list_groups(ctx: click.Context, limit: int | None) -> None:
-    """List all available GroupMe groups."""
+def list_groups(
+    ctx: click.Context, limit: int | None, refresh: bool, page: bool | None
+) -> None:
+    """List all available GroupMe groups.
+
+    Groups come from the same cache as the 'groups' command, so they are
+    only fetched from the API on first use or with --refresh. Long listings
+    are shown as plain text in a pager; see --page/--no-page.
+    """
     settings = ctx.obj["settings"]
-    api_client = GroupMeClient(
-        access_token=settings.groupme_access_token,
-        base_url=settings.groupme_api_base_url,
-    )
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Fetching groups...", total=None)
-        groups = api_client.get_all_groups()
-        progress.update(task, completed=True)
+    groups = load_groups(settings, refresh=refresh)
 
     if limit:
         groups = groups[:limit]
 
+    # Names and descriptions are user-written, so they go in as Text rather
+    # than being parsed as markup
+    rows = []
+    for group in groups:
+        members = group.get("members")
+        member_count = members.get("count") if members and isinstance(members, dict) else "?"
+        messages = group.get("messages")
+        message_count = messages.get("count") if messages and isinstance(messages, dict) else "?"
+        rows.append(
+            (
+                group["id"],
+                Text(group.get("name", "Unknown")[:40]),
+                Text((group.get("description") or "")[:50]),
+                str(member_count),
+                str(message_count),
+            )
+        )
+
+    if should_page(page, len(rows)):
+        echo_rows_via_pager(("Group ID", "Name", "Description", "Members", "Messages"), rows)
+        return
+
     # Create table
     table = Table(title=f"GroupMe Groups ({len(groups)} total)")
     table.add_column("Group ID", style="cyan", no_wrap=True)
@@ -167,19 +234,7 @@ def list_groups(ctx: click.Context, limit: int | None) -> None:
     table.add_column("Description", style="dim")
     table.add_column("Members", justify="right")
     table.add_column("Messages", justify="right")
-
-    for group in groups:
-        members = group.get("members")
-        member_count = members.get("count") if members and isinstance(members, dict) else "?"
-        messages = group.get("messages")
-        message_count = messages.get("count") if messages and isinstance(messages, dict) else "?"
-
-        table.add_row(
-            group["id"],
-            group.get("name", "Unknown")[:40],
-            (group.get("description") or "")[:50],
-            str(member_count),
-            str(message_count),
-        )
+    for cells in rows:
+        table.add_row(*cells)
 
     console.print(table)
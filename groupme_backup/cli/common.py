@@ -0,0 +1,98 @@
+"""Helpers shared by the CLI command modules."""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import click
+from rich.console import Console
+from rich.progress import Progress, SpinnerColumn, TextColumn
+
+from ..api.client import GroupMeClient
+from ..config.settings import Settings
+from ..utils.groups_cache import get_group_id_by_index, load_groups_cache, save_groups_cache
+
+console = Console()
+
+# Row count above which group listings go to a plain-text pager instead of a table
+PAGE_THRESHOLD = 500
+
+
+def parse_group_identifier(identifier: str) -> str:
+    """
+    Parse group identifier - can be a numeric index or group ID.
+
+    Returns the group ID.
+    """
+    # Try to parse as integer (numeric index)
+    try:
+        index = int(identifier)
+        group_id = get_group_id_by_index(index)
+        if group_id:
+            return group_id
+        else:
+            console.print(f"[red]Error:[/red] No group at index {index}")
+            console.print("Run [cyan]groupme-backup groups[/cyan] to see available groups")
+            raise click.Abort()
+    except ValueError:
+        # Not a number, assume it's a group ID
+        return identifier
+
+
+def _last_message_at(group: Dict[str, Any]) -> int:
+    """Sort key: the group's last message timestamp, or 0 if unknown."""
+    messages = group.get("messages")
+    if isinstance(messages, dict):
+        return messages.get("last_message_created_at") or 0
+    return 0
+
+
+def load_groups(settings: Settings, refresh: bool = False) -> List[Dict[str, Any]]:
+    """
+    Get the user's groups from the groups cache, fetching them if needed.
+
+    Groups are fetched from the API when refresh is set or the cache is
+    empty, then sorted by last message time (most recent first) and saved.
+    The whole list is sorted because its order defines the numeric indices
+    that parse_group_identifier resolves.
+    """
+    if not refresh:
+        groups_list = load_groups_cache()
+        if groups_list:
+            return groups_list
+
+    api_client = GroupMeClient(
+        access_token=settings.groupme_access_token,
+        base_url=settings.groupme_api_base_url,
+    )
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    ) as progress:
+        task = progress.add_task("Fetching groups...", total=None)
+        groups_list = api_client.get_all_groups()
+        progress.update(task, completed=True)
+
+    groups_list.sort(key=_last_message_at, reverse=True)
+    save_groups_cache(groups_list)
+    return groups_list
+
+
+def should_page(page: Optional[bool], row_count: int) -> bool:
+    """Resolve a --page/--no-page flag, paging by default past PAGE_THRESHOLD rows."""
+    if page is None:
+        return row_count > PAGE_THRESHOLD
+    return page
+
+
+def echo_rows_via_pager(header: Sequence[str], rows: Sequence[Sequence[Any]]) -> None:
+    """
+    Show rows as tab-separated plain text through the system pager.
+
+    This skips Rich's table layout, which measures every cell before
+    printing anything, so very long listings start showing immediately.
+    Whitespace inside a cell is collapsed so each row stays on one line.
+    """
+    lines = ["\t".join(header)]
+    lines.extend("\t".join(" ".join(str(cell).split()) for cell in row) for row in rows)
+    click.echo_via_pager("\n".join(lines))
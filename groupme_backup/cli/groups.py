@@ -2,77 +2,39 @@
 
 import click
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
+from rich.text import Text
 
-from ..api.client import GroupMeClient
-from ..utils.groups_cache import save_groups_cache, load_groups_cache
+from ..utils.groups_cache import load_groups_cache
+from .common import echo_rows_via_pager, load_groups, should_page
 from .main import cli
 
 console = Console()
 
 
-def parse_group_identifier(identifier: str) -> str:
-    """
-    Parse group identifier - can be a numeric index or group ID.
-
-    Returns the group ID.
-    """
-    from ..utils.groups_cache import get_group_id_by_index
-
-    # Try to parse as integer (numeric index)
-    try:
-        index = int(identifier)
-        group_id = get_group_id_by_index(index)
-        if group_id:
-            return group_id
-        else:
-            console.print(f"[red]Error:[/red] No group at index {index}")
-            console.print("Run [cyan]groupme-backup groups[/cyan] to see available groups")
-            raise click.Abort()
-    except ValueError:
-        # Not a number, assume it's a group ID
-        return identifier
-
-
 @cli.command()
 @click.option("--all", "show_all", is_flag=True, help="Show all groups (not just top 5)")
 @click.option("--refresh", is_flag=True, help="Refresh groups from API")
+@click.option(
+    "--page/--no-page",
+    default=None,
+    help="Show groups as plain text in a pager (default: when more than 500)",
+)
 @click.pass_context
-def groups(ctx: click.Context, show_all: bool, refresh: bool) -> None:
+def groups(ctx: click.Context, show_all: bool, refresh: bool, page: bool | None) -> None:
     """List groups with numeric indices for easy reference.
 
     By default shows top 5 groups by recent activity.
     Use --all to show all groups.
     Use --refresh to fetch latest from API.
+    Long listings are shown as plain text in a pager; see --page/--no-page.
     """
     settings = ctx.obj["settings"]
 
     # Load from cache unless refresh requested
     if refresh or not load_groups_cache():
         console.print("[bold blue]Fetching groups from API...[/bold blue]")
-        api_client = GroupMeClient(
-            access_token=settings.groupme_access_token,
-            base_url=settings.groupme_api_base_url,
-        )
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Fetching groups...", total=None)
-            groups_list = api_client.get_all_groups()
-            progress.update(task, completed=True)
-
-        # Sort by last message time (most recent first)
-        groups_list.sort(
-            key=lambda g: g.get("messages", {}).get("last_message_created_at", 0)
-            if isinstance(g.get("messages"), dict) else 0,
-            reverse=True
-        )
-
-        save_groups_cache(groups_list)
+        groups_list = load_groups(settings, refresh=True)
         console.print("[green]Groups cache updated![/green]\n")
     else:
         groups_list = load_groups_cache()
@@ -81,6 +43,25 @@ def groups(ctx: click.Context, show_all: bool, refresh: bool) -> None:
     display_count = len(groups_list) if show_all else min(5, len(groups_list))
     groups_to_show = groups_list[:display_count]
 
+    # Names are user-written, so they go in as Text rather than being parsed as markup
+    rows = [
+        (
+            str(i),
+            Text(group.get("name", "Unknown")[:40]),
+            str(
+                group["messages"].get("count", "?")
+                if isinstance(group.get("messages"), dict)
+                else "?"
+            ),
+            group["id"],
+        )
+        for i, group in enumerate(groups_to_show, 1)
+    ]
+
+    if should_page(page, len(rows)):
+        echo_rows_via_pager(("#", "Name", "Messages", "Group ID"), rows)
+        return
+
     # Create table
     title = f"Your Groups ({display_count} of {len(groups_list)} shown)"
     if show_all:
@@ -92,19 +73,8 @@ def groups(ctx: click.Context, show_all: bool, refresh: bool) -> None:
     table.add_column("Messages", style="magenta", justify="right")
     table.add_column("Group ID", style="dim")
 
-    for i, group in enumerate(groups_to_show, 1):
-        messages = group.get("messages")
-        if isinstance(messages, dict):
-            message_count = messages.get("count", "?")
-        else:
-            message_count = "?"
-
-        table.add_row(
-            str(i),
-            group.get("name", "Unknown")[:40],
-            str(message_count),
-            group["id"]
-        )
+    for cells in rows:
+        table.add_row(*cells)
 
     console.print(table)
 
@@ -1,7 +1,10 @@
 """Main CLI entry point."""
 
+import importlib
 import logging
+import shlex
 import sys
+from typing import Any, Dict, List, Optional
 
 import click
 from rich.console import Console
@@ -23,7 +26,70 @@ def setup_logging(verbose: bool = False) -> None:
     )
 
 
-@click.group()
+class LazyGroup(click.Group):
+    """
+    Click group that imports a command's module the first time it is used.
+
+    Command modules register themselves with @cli.command() on import, so a
+    single command only pays for its own module's imports (version skips
+    SQLAlchemy and the analytics queries entirely). --help still imports
+    every module to list all commands.
+    """
+
+    def __init__(self, *args: Any, lazy_commands: Optional[Dict[str, str]] = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            importlib.import_module(self.lazy_commands[cmd_name], __package__)
+        return super().get_command(ctx, cmd_name)
+
+
+# Command name -> module that defines it; a new command must be listed here
+_LAZY_COMMANDS = {
+    # advanced.py
+    "attachments": ".advanced",
+    "controversial": ".advanced",
+    "dashboard": ".advanced",
+    "early-bird": ".advanced",
+    "emojis": ".advanced",
+    "images": ".advanced",
+    "leaderboards": ".advanced",
+    "like-ratio": ".advanced",
+    "mentions": ".advanced",
+    "message-length": ".advanced",
+    "night-owl": ".advanced",
+    "peak-times": ".advanced",
+    "reply-patterns": ".advanced",
+    "starters": ".advanced",
+    "trend": ".advanced",
+    "weekend-warrior": ".advanced",
+    "who-mentions-who": ".advanced",
+    # analytics.py
+    "active": ".analytics",
+    "aliases": ".analytics",
+    "all-aliases": ".analytics",
+    "by-name": ".analytics",
+    "consecutive": ".analytics",
+    "liked": ".analytics",
+    "popular": ".analytics",
+    "profile": ".analytics",
+    "response-time": ".analytics",
+    "search": ".analytics",
+    "stats": ".analytics",
+    # backup.py
+    "backup": ".backup",
+    "list-groups": ".backup",
+    # groups.py
+    "groups": ".groups",
+}
+
+
+@click.group(cls=LazyGroup, lazy_commands=_LAZY_COMMANDS)
 @click.option("-v", "--verbose", is_flag=True, help="Enable verbose logging")
 @click.pass_context
 def cli(ctx: click.Context, verbose: bool) -> None:
@@ -55,11 +121,58 @@ def version() -> None:
     console.print("https://github.com/spaceisawaste/groupme-backup")
 
 
-# Import command modules to register them with the CLI
-from . import advanced  # noqa: F401, E402
-from . import analytics  # noqa: F401, E402
-from . import backup  # noqa: F401, E402
-from . import groups  # noqa: F401, E402
+@cli.command()
+@click.pass_context
+def shell(ctx: click.Context) -> None:
+    """Run commands interactively in a single process.
+
+    Imports, the database connection pool and cached analytics results are
+    kept between commands, so each one starts faster than a new invocation.
+    Enter commands without the 'groupme-backup' prefix; 'exit' or Ctrl-D quits.
+
+    Example: groupme-backup shell
+    """
+    try:
+        import readline  # noqa: F401  (line editing and history for input())
+    except ImportError:
+        pass
+
+    while True:
+        try:
+            line = input("groupme-backup> ")
+        except (EOFError, KeyboardInterrupt):
+            console.print()
+            break
+
+        try:
+            args = shlex.split(line)
+        except ValueError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            continue
+
+        if args and args[0] == "groupme-backup":
+            args = args[1:]
+        if not args:
+            continue
+        if args[0] in ("exit", "quit"):
+            break
+        if args[0] == "shell":
+            console.print("[yellow]Already in the shell[/yellow]")
+            continue
+
+        try:
+            cli.main(args, prog_name="groupme-backup", standalone_mode=False, obj=ctx.obj)
+        except click.ClickException as e:
+            e.show()
+        except click.Abort:
+            console.print("[yellow]Aborted[/yellow]")
+        except KeyboardInterrupt:
+            console.print()
+        except SystemExit:
+            pass
+        except Exception as e:
+            # Keep the shell alive; a fresh invocation would have exited here
+            console.print(f"[red]Error:[/red] {e}")
 
 
 if __name__ == "__main__":
@@ -33,6 +33,41 @@ class Settings(BaseSettings):
     db_name: str = Field(default="groupme_backup", description="Database name")
     db_user: str = Field(..., description="Database user")
     db_password: str = Field(..., description="Database password")
+    db_pool_size: int = Field(
+        default=10, ge=1, description="Persistent connections kept in the pool"
+    )
+    db_max_overflow: int = Field(
+        default=20, ge=0, description="Extra connections allowed beyond the pool size"
+    )
+    db_pool_recycle: int = Field(
+        default=1800, description="Seconds before a pooled connection is replaced"
+    )
+    db_pool_pre_ping: bool = Field(
+        default=True,
+        description="Test pooled connections with a round-trip before each checkout",
+    )
+    db_work_mem: Optional[str] = Field(
+        default=None,
+        description=(
+            "Per-connection work_mem (e.g. 64MB) so analytics sorts and hash "
+            "aggregates stay in memory; unset uses the server default"
+        ),
+    )
+    db_query_log_enabled: bool = Field(
+        default=False, description="Log the number of SQL statements per session"
+    )
+    db_query_log_n1_threshold: int = Field(
+        default=3,
+        ge=1,
+        description="Warn when a session executes more statements than this",
+    )
+
+    # Analytics Settings
+    analytics_disk_cache_ttl: int = Field(
+        default=3600,
+        ge=0,
+        description="Seconds to keep analytics results in the on-disk cache; 0 disables it",
+    )
 
     # Sync Settings
     sync_batch_size: int = Field(
@@ -44,6 +79,9 @@ class Settings(BaseSettings):
     sync_retry_delay: int = Field(
         default=5, ge=1, description="Initial delay between retries in seconds"
     )
+    backup_concurrency: int = Field(
+        default=4, ge=1, description="Groups fetched in parallel by backup --all"
+    )
 
     # Optional: Specific groups to backup
     backup_group_ids: List[str] = Field(
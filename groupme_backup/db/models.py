@@ -7,6 +7,7 @@ from sqlalchemy import (
     Boolean,
     CheckConstraint,
     Column,
+    Computed,
     DateTime,
     ForeignKey,
     Index,
@@ -17,6 +18,7 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
 )
+from sqlalchemy import text as sql_text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -52,6 +54,15 @@ class Group(Base):
     )
     last_synced_message_id: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
 
+    # Running totals kept by the sync as it stores messages, so group
+    # statistics don't have to count messages and likes on every read
+    message_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    like_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
     # Relationships
     messages: Mapped[List["Message"]] = relationship(
         "Message", back_populates="group", cascade="all, delete-orphan"
@@ -104,6 +115,10 @@ class Message(Base):
     source_guid: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Stored so length aggregates read a small int instead of detoasting text
+    text_len: Mapped[Optional[int]] = mapped_column(
+        Integer, Computed("length(text)", persisted=True), nullable=True
+    )
     system: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
 
     # Snapshot of sender info at message time
@@ -132,6 +147,47 @@ class Message(Base):
         Index("idx_messages_created_at", "created_at", postgresql_using="btree"),
         Index("idx_messages_user_id", "user_id"),
         Index("idx_messages_group_created", "group_id", "created_at"),
+        # Partial indexes for analytics, which always exclude system messages.
+        # This one includes id and user_id so date-window aggregates (popular,
+        # active, liked) are answered by index-only scans
+        Index(
+            "idx_messages_group_created_nonsystem_cover",
+            "group_id",
+            "created_at",
+            postgresql_include=["id", "user_id"],
+            postgresql_where=sql_text("system = FALSE"),
+        ),
+        Index(
+            "idx_messages_user_created_nonsystem",
+            "user_id",
+            "created_at",
+            postgresql_where=sql_text("system = FALSE"),
+        ),
+        # Covers per-user aggregates and lookups (counts, name history,
+        # aliases, by-name) with index-only scans, ordered by time within each
+        # user; system is included so non-system filters skip the heap too
+        Index(
+            "idx_messages_group_user_created",
+            "group_id",
+            "user_id",
+            "created_at",
+            postgresql_include=["name", "text_len", "system"],
+        ),
+        # Trigram index so name ILIKE '%...%' searches avoid a full scan
+        # (requires the pg_trgm extension)
+        Index(
+            "idx_messages_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        # Same for message search on text (contains / ILIKE)
+        Index(
+            "idx_messages_text_trgm",
+            "text",
+            postgresql_using="gin",
+            postgresql_ops={"text": "gin_trgm_ops"},
+        ),
     )
 
 
@@ -169,6 +225,10 @@ class Attachment(Base):
     message_id: Mapped[str] = mapped_column(
         String(50), ForeignKey("messages.id", ondelete="CASCADE"), nullable=False
     )
+    # Copied from the message so per-group attachment analytics skip the join
+    group_id: Mapped[str] = mapped_column(
+        String(50), ForeignKey("groups.id", ondelete="CASCADE"), nullable=False
+    )
     type: Mapped[str] = mapped_column(String(20), nullable=False)
 
     # Image fields
@@ -199,6 +259,13 @@ class Attachment(Base):
     __table_args__ = (
         Index("idx_attachments_message_id", "message_id"),
         Index("idx_attachments_type", "type"),
+        # Emoji usage counts are answered by an index-only scan
+        Index(
+            "idx_attachments_group_emoji",
+            "group_id",
+            "placeholder",
+            postgresql_where=sql_text("type = 'emoji' AND placeholder IS NOT NULL"),
+        ),
     )
 
 
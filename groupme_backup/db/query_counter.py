@@ -0,0 +1,51 @@
+"""SQL statement counting for spotting N+1 query regressions."""
+
+from contextlib import contextmanager
+from typing import Any, Generator, List
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExecutionContext
+
+
+class QueryCounter:
+    """Records the SQL statements an engine sends to the database."""
+
+    def __init__(self) -> None:
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        """Number of statements executed so far."""
+        return len(self.statements)
+
+    def _before_cursor_execute(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext,
+        executemany: bool,
+    ) -> None:
+        self.statements.append(statement)
+
+
+@contextmanager
+def count_queries(engine: Engine) -> Generator[QueryCounter, None, None]:
+    """
+    Count statements executed on an engine within the block.
+
+    Counting is engine-wide, so statements from other threads using the same
+    engine are included.
+
+    Usage:
+        with count_queries(get_engine()) as counter:
+            get_group_statistics(session, group_id)
+        assert counter.count <= 2
+    """
+    counter = QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter._before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", counter._before_cursor_execute)
@@ -0,0 +1,40 @@
+"""Materialized rollup views used by analytics queries.
+
+Rollups are pre-aggregated views over the messages table. They are refreshed
+after each sync, so analytics that read from them may lag behind the raw
+tables until the next successful backup.
+"""
+
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Materialized views created by Alembic migrations, in refresh order
+ROLLUP_VIEWS = (
+    "mv_hourly_activity",
+    "mv_user_engagement",
+    "mv_user_hour_stats",
+    "mv_user_mentions",
+    "mv_emoji_usage",
+    "mv_user_aliases",
+    "mv_mention_pairs",
+)
+
+
+def refresh_rollups(session: Session, concurrently: bool = True) -> None:
+    """
+    Refresh all materialized rollup views.
+
+    Args:
+        session: Database session
+        concurrently: Refresh without locking out readers (requires a unique
+            index on each view, which the migrations create)
+    """
+    mode = "CONCURRENTLY " if concurrently else ""
+    for view in ROLLUP_VIEWS:
+        logger.debug(f"Refreshing materialized view {view}")
+        session.execute(text(f"REFRESH MATERIALIZED VIEW {mode}{view}"))
+    session.commit()
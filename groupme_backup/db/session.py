@@ -1,12 +1,18 @@
 """Database session management."""
 
-from contextlib import contextmanager
+import atexit
+import logging
+from contextlib import contextmanager, nullcontext
 from typing import Generator
 
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from ..config.settings import get_settings
+from .query_counter import count_queries
+
+logger = logging.getLogger(__name__)
 
 # Global engine and session factory
 _engine = None
@@ -14,20 +20,49 @@ _SessionLocal = None
 
 
 def get_engine():
-    """Get or create the global database engine."""
+    """
+    Get or create the global database engine.
+
+    The engine and its connection pool are created once per process and
+    shared by every get_session() call, so later sessions reuse pooled
+    connections instead of reconnecting.
+    """
     global _engine
     if _engine is None:
         settings = get_settings()
+        connect_args = {}
+        if settings.db_work_mem:
+            # Applied by the server at connection start, so no extra round-trip
+            connect_args["options"] = f"-c work_mem={settings.db_work_mem}"
         _engine = create_engine(
             settings.database_url,
+            connect_args=connect_args,
+            # Decodes json/json_agg results from the driver; faster than json.loads
+            json_deserializer=orjson.loads,
             echo=False,  # Set to True for SQL query logging during development
-            pool_pre_ping=True,  # Verify connections before using them
-            pool_size=5,
-            max_overflow=10,
+            pool_pre_ping=settings.db_pool_pre_ping,  # Verify connections before using them
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_recycle=settings.db_pool_recycle,  # Replace connections before server/proxy idle timeouts
         )
+        atexit.register(dispose_engine)
     return _engine
 
 
+def dispose_engine() -> None:
+    """
+    Close every pooled connection and forget the global engine.
+
+    Registered with atexit when the engine is created, so connections are
+    closed cleanly rather than dropped when the process exits.
+    """
+    global _engine, _SessionLocal
+    if _engine is not None:
+        _engine.dispose()
+    _engine = None
+    _SessionLocal = None
+
+
 def get_session_factory():
     """Get or create the global session factory."""
     global _SessionLocal
@@ -47,21 +82,37 @@ def get_session() -> Generator[Session, None, None]:
     """
     Context manager for database sessions.
 
+    When DB_QUERY_LOG_ENABLED is set, the number of statements executed in
+    the session is logged, with a warning above DB_QUERY_LOG_N1_THRESHOLD.
+
     Usage:
         with get_session() as session:
             user = session.query(User).first()
     """
+    settings = get_settings()
     SessionLocal = get_session_factory()
     session = SessionLocal()
+    counting = count_queries(get_engine()) if settings.db_query_log_enabled else nullcontext()
     try:
-        yield session
-        session.commit()
+        with counting as counter:
+            yield session
+            session.commit()
     except Exception:
         session.rollback()
         raise
     finally:
         session.close()
 
+    if counter is not None:
+        threshold = settings.db_query_log_n1_threshold
+        if counter.count > threshold:
+            logger.warning(
+                f"Session executed {counter.count} SQL statements "
+                f"(threshold {threshold}); possible N+1 query"
+            )
+        else:
+            logger.debug(f"Session executed {counter.count} SQL statements")
+
 
 def create_session() -> Session:
     """
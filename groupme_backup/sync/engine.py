@@ -12,9 +12,11 @@ from tenacity import (
     wait_exponential,
 )
 
+from ..analytics.queries import clear_results_cache
 from ..api.client import GroupMeClient
 from ..api.exceptions import GroupMeAPIError, RateLimitError
 from ..db.models import SyncLog
+from ..db.rollups import refresh_rollups
 from .incremental import IncrementalSyncEngine
 
 logger = logging.getLogger(__name__)
@@ -88,6 +90,9 @@ class SyncEngine:
             error_msg = str(e)
             logger.error(f"Failed to sync group {group_id}: {error_msg}")
 
+            # Discard the failed batch so the session can record the failure
+            self.db.rollback()
+
             # Try to create a failed sync log (group may or may not exist)
             try:
                 sync_log = SyncLog(
@@ -126,8 +131,28 @@ class SyncEngine:
             messages_fetched, error = self.sync_group_with_retry(group_id)
             results[group_id] = (messages_fetched, error)
 
+        if any(count for count, _ in results.values()):
+            self.refresh_rollups()
+
         return results
 
+    def refresh_rollups(self) -> None:
+        """
+        Refresh analytics rollup views after new messages are stored.
+
+        Failures are logged rather than raised; rollups are allowed to be
+        stale until the next successful refresh. After a successful refresh
+        the analytics results cache is cleared, since entries stored since
+        the sync began may hold pre-refresh rollup data.
+        """
+        try:
+            refresh_rollups(self.db)
+        except Exception as e:
+            self.db.rollback()
+            logger.warning(f"Could not refresh analytics rollups: {e}")
+            return
+        clear_results_cache()
+
     def sync_all_groups(self) -> dict[str, tuple[int, Optional[str]]]:
         """
         Sync all groups accessible to the API token.
@@ -1,6 +1,7 @@
 """Incremental sync engine for GroupMe messages."""
 
 import logging
+import threading
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
@@ -11,6 +12,10 @@ from ..db.models import Attachment, Group, Message, MessageFavorite, Mention, Us
 
 logger = logging.getLogger(__name__)
 
+# Storing messages updates rows shared between groups (users), so concurrent
+# group syncs in one process fetch in parallel but store one group at a time
+_store_lock = threading.Lock()
+
 
 class IncrementalSyncEngine:
     """
@@ -113,25 +118,34 @@ class IncrementalSyncEngine:
         if self.fast_mode:
             logger.info(f"Fast mode enabled: batch_size={batch_size}, flush disabled")
 
-        for i, msg_data in enumerate(all_new_messages, 1):
-            if i % 100 == 0:
-                logger.info(f"Processed {i}/{len(all_new_messages)} messages")
-
-            self._store_message(msg_data, group_id)
-            new_messages_count += 1
-
-            # Commit in batches to handle interruptions gracefully
-            if i % batch_size == 0 or i == len(all_new_messages):
-                # Update last synced message ID to this batch
-                current_message_id = msg_data["id"]
-                group.last_synced_message_id = current_message_id
-                group.last_synced_at = datetime.now(timezone.utc)
-
-                self.db.commit()
-                logger.info(
-                    f"Committed batch: {i}/{len(all_new_messages)} messages "
-                    f"(last_synced_message_id={current_message_id})"
-                )
+        with _store_lock:
+            # One timestamp for the whole run instead of a datetime per message
+            synced_at = datetime.now(timezone.utc)
+
+            for i, msg_data in enumerate(all_new_messages, 1):
+                if i % 100 == 0:
+                    logger.info(f"Processed {i}/{len(all_new_messages)} messages")
+
+                if self._store_message(msg_data, group_id, synced_at):
+                    # Committed with the batch below, so the totals always match
+                    # the stored messages
+                    if not msg_data.get("system", False):
+                        group.message_count += 1
+                    group.like_count += len(msg_data.get("favorited_by", []))
+                new_messages_count += 1
+
+                # Commit in batches to handle interruptions gracefully
+                if i % batch_size == 0 or i == len(all_new_messages):
+                    # Update last synced message ID to this batch
+                    current_message_id = msg_data["id"]
+                    group.last_synced_message_id = current_message_id
+                    group.last_synced_at = datetime.now(timezone.utc)
+
+                    self.db.commit()
+                    logger.info(
+                        f"Committed batch: {i}/{len(all_new_messages)} messages "
+                        f"(last_synced_message_id={current_message_id})"
+                    )
 
         logger.info(
             f"Completed sync for group {group_id}. "
@@ -173,13 +187,19 @@ class IncrementalSyncEngine:
             share_url=group_data.get("share_url"),
         )
 
-    def _store_message(self, msg_data: Dict[str, Any], group_id: str) -> None:
+    def _store_message(
+        self, msg_data: Dict[str, Any], group_id: str, synced_at: datetime
+    ) -> bool:
         """
         Store a single message with all metadata.
 
         Args:
             msg_data: Message data from GroupMe API
             group_id: The group ID
+            synced_at: Time of this sync run, recorded as users' last_seen_at
+
+        Returns:
+            True if the message was stored, False if it already existed
         """
         # Create or update user
         if msg_data.get("user_id"):
@@ -194,7 +214,7 @@ class IncrementalSyncEngine:
                 self.db.add(user)
             else:
                 # Update user info
-                user.last_seen_at = datetime.now(timezone.utc)
+                user.last_seen_at = synced_at
                 if msg_data.get("name"):
                     user.name = msg_data["name"]
                 if msg_data.get("avatar_url"):
@@ -204,7 +224,7 @@ class IncrementalSyncEngine:
         existing = self.db.query(Message).filter(Message.id == msg_data["id"]).first()
         if existing:
             logger.debug(f"Message {msg_data['id']} already exists, skipping")
-            return
+            return False
 
         # Create message
         created_timestamp = msg_data.get("created_at")
@@ -236,26 +256,30 @@ class IncrementalSyncEngine:
 
         # Store attachments
         for attachment_data in msg_data.get("attachments", []):
-            self._store_attachment(msg_data["id"], attachment_data)
+            self._store_attachment(msg_data["id"], group_id, attachment_data)
 
         # Flush to catch any errors before committing the batch (disabled in fast mode)
         if not self.fast_mode:
             self.db.flush()
 
+        return True
+
     def _store_attachment(
-        self, message_id: str, attachment_data: Dict[str, Any]
+        self, message_id: str, group_id: str, attachment_data: Dict[str, Any]
     ) -> None:
         """
         Store an attachment with all metadata.
 
         Args:
             message_id: The message ID
+            group_id: The group ID of the message
             attachment_data: Attachment data from GroupMe API
         """
         attachment_type = attachment_data.get("type")
 
         attachment = Attachment(
             message_id=message_id,
+            group_id=group_id,
             type=attachment_type,
             raw_data=attachment_data,  # Store complete JSON for future-proofing
         )
@@ -0,0 +1,120 @@
+"""Small in-process and on-disk caches."""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Bounded in-memory cache whose entries expire after a fixed time.
+
+    Once maxsize is reached the oldest entry is evicted first. Safe to share
+    between threads.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 60.0):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries to keep
+            ttl: Seconds an entry stays valid after it is stored
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the oldest entries if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskCache:
+    """
+    Cache that pickles each entry to its own file, so entries outlive the process.
+
+    Entries expire ttl seconds after they were written. Reads and writes are
+    best effort: an unreadable or unwritable entry behaves as a miss.
+    """
+
+    def __init__(self, directory: Path, ttl: float = 3600.0):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory holding the entry files (created on first write)
+            ttl: Seconds an entry stays valid after it is stored
+        """
+        self.directory = directory
+        self.ttl = ttl
+
+    def _path(self, key: Hashable) -> Path:
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.pkl"
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        path = self._path(key)
+        try:
+            if path.stat().st_mtime + self.ttl < time.time():
+                return default
+            with path.open("rb") as f:
+                return pickle.load(f)
+        except Exception:
+            return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, replacing the file atomically."""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_name, self._path(key))
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except Exception:
+            pass
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for path in self.directory.glob("*.pkl"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
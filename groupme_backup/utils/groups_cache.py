@@ -2,25 +2,41 @@
 
 import json
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 CACHE_FILE = Path.home() / ".groupme_backup_groups.json"
 
+# Parsed cache file keyed by its mtime, so repeat lookups in one process skip
+# re-reading and re-parsing the JSON until the file changes
+_loaded: Optional[Tuple[int, List[Dict]]] = None
+
 
 def save_groups_cache(groups: List[Dict]) -> None:
     """Save groups to cache file."""
+    global _loaded
     CACHE_FILE.write_text(json.dumps(groups, indent=2))
+    _loaded = None
 
 
 def load_groups_cache() -> List[Dict]:
     """Load groups from cache file."""
-    if not CACHE_FILE.exists():
+    global _loaded
+    try:
+        mtime = CACHE_FILE.stat().st_mtime_ns
+    except OSError:
         return []
+
+    if _loaded is not None and _loaded[0] == mtime:
+        return _loaded[1]
+
     try:
-        return json.loads(CACHE_FILE.read_text())
+        groups: List[Dict] = json.loads(CACHE_FILE.read_text())
     except Exception:
         return []
 
+    _loaded = (mtime, groups)
+    return groups
+
 
 def get_group_by_index(index: int) -> Optional[Dict]:
     """Get group by numeric index (1-based)."""
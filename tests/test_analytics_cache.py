@@ -0,0 +1,48 @@
+"""Tests for memoizing analytics results."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from groupme_backup.analytics import queries
+
+
+class FakeSession:
+    """Answers the last-synced lookup without a database."""
+
+    def scalar(self, statement, params):
+        return None
+
+
+@pytest.fixture
+def settings(monkeypatch):
+    settings = SimpleNamespace(
+        db_host="localhost", db_port=5432, db_name="first", analytics_disk_cache_ttl=0
+    )
+    monkeypatch.setattr(queries, "get_settings", lambda: settings)
+    queries._results_cache.clear()
+    yield settings
+    queries._results_cache.clear()
+
+
+def test_memoized_reuses_result(settings):
+    calls = []
+
+    @queries._memoized
+    def count(session, group_id):
+        calls.append(group_id)
+        return len(calls)
+
+    assert count(FakeSession(), "g1") == 1
+    assert count(FakeSession(), "g1") == 1
+    assert count(FakeSession(), "g2") == 2
+
+
+def test_memoized_keys_on_database(settings):
+    @queries._memoized
+    def database(session, group_id):
+        return settings.db_name
+
+    assert database(FakeSession(), "g1") == "first"
+    settings.db_name = "second"
+    assert database(FakeSession(), "g1") == "second"
@@ -0,0 +1,160 @@
+"""
+Statement budgets for the analytics queries.
+
+Each public analytics function must issue a fixed, small number of SQL
+statements however many rows the group has, so an accidental per-row query
+(N+1) fails here. These tests run against the PostgreSQL database configured
+in the environment or .env and are skipped when none is configured or
+reachable. Set DB_QUERY_LOG_ENABLED=true to also log per-session counts.
+"""
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from groupme_backup.analytics import queries
+from groupme_backup.config.settings import get_settings
+from groupme_backup.db.query_counter import count_queries
+from groupme_backup.db.session import get_engine, get_session
+
+
+def _database_configured() -> bool:
+    try:
+        get_settings()
+    except ValidationError:
+        return False
+    return True
+
+
+pytestmark = pytest.mark.skipif(
+    not _database_configured(), reason="no database configured (DB_USER, DB_PASSWORD)"
+)
+
+# (function name, args after group_id, maximum statements). Memoized
+# functions spend one statement looking up the group's last sync time.
+BUDGETS = [
+    ("get_group_statistics", (), 1),
+    ("get_most_popular_messages", (), 4),
+    ("get_longest_consecutive_streak", (), 2),
+    ("get_most_active_users", (), 2),
+    ("get_most_liked_users", (), 2),
+    ("get_hourly_activity_heatmap", (), 2),
+    ("get_response_time_analysis", (), 2),
+    ("get_peak_activity_times", (), 2),
+    ("get_daily_message_trend", (), 2),
+    ("get_dashboard_bundle", (), 2),
+    ("get_image_sharing_stats", (), 2),
+    ("get_attachment_type_distribution", (), 2),
+    ("get_like_to_message_ratio", (), 2),
+    ("get_most_mentioned_users", (), 2),
+    ("get_conversation_starters", (), 2),
+    ("get_message_length_stats", (), 2),
+    ("get_emoji_usage", (), 2),
+    ("get_reply_patterns", (), 2),
+    ("get_night_owl_leaderboard", (), 2),
+    ("get_early_bird_leaderboard", (), 2),
+    ("get_weekend_warrior_leaderboard", (), 2),
+    ("get_all_leaderboards", (), 2),
+    ("get_controversial_messages", (), 2),
+    ("get_all_users_with_aliases", (), 2),
+    ("search_messages", (), 2),
+]
+
+
+@pytest.fixture(scope="module")
+def group_id():
+    """The group with the most messages, so per-row queries would show up."""
+    try:
+        with get_session() as session:
+            group_id = session.scalar(
+                text(
+                    "SELECT group_id FROM messages GROUP BY group_id "
+                    "ORDER BY COUNT(*) DESC LIMIT 1"
+                )
+            )
+    except OperationalError:
+        pytest.skip("database not reachable")
+    if group_id is None:
+        pytest.skip("database has no messages")
+    return group_id
+
+
+@pytest.fixture
+def session(monkeypatch):
+    """A session with the analytics results caches bypassed."""
+    monkeypatch.setattr(queries, "_get_disk_cache", lambda: None)
+    queries._results_cache.clear()
+    with get_session() as session:
+        yield session
+    queries._results_cache.clear()
+
+
+@pytest.mark.parametrize("name,args,budget", BUDGETS, ids=[b[0] for b in BUDGETS])
+def test_query_budget(session, group_id, name, args, budget):
+    with count_queries(get_engine()) as counter:
+        getattr(queries, name)(session, group_id, *args)
+    assert counter.count <= budget, counter.statements
+
+
+def test_memoized_hit_costs_one_statement(session, group_id):
+    queries.get_all_leaderboards(session, group_id)
+    with count_queries(get_engine()) as counter:
+        queries.get_all_leaderboards(session, group_id)
+    assert counter.count == 1
+
+
+def test_user_queries_budget(session, group_id):
+    user_id, name = session.execute(
+        text("SELECT user_id, name FROM messages WHERE group_id = :group_id LIMIT 1"),
+        {"group_id": group_id},
+    ).one()
+    with count_queries(get_engine()) as counter:
+        queries.get_user_profile(session, group_id, user_id)
+    assert counter.count <= 1, counter.statements
+
+    with count_queries(get_engine()) as counter:
+        queries.get_user_aliases(session, group_id, user_id)
+    assert counter.count <= 2, counter.statements
+
+    with count_queries(get_engine()) as counter:
+        queries.get_messages_by_name(session, group_id, user_id, name)
+    assert counter.count <= 3, counter.statements
+
+
+def test_mention_matrix_budget(session, group_id):
+    with count_queries(get_engine()) as counter:
+        list(queries.get_mention_interaction_matrix(session, group_id))
+    assert counter.count <= 1, counter.statements
+
+
+def test_message_context_budget(session, group_id):
+    message_ids = list(
+        session.scalars(
+            text("SELECT id FROM messages WHERE group_id = :group_id LIMIT 5"),
+            {"group_id": group_id},
+        )
+    )
+    with count_queries(get_engine()) as counter:
+        queries.get_message_context(session, group_id, message_ids[0])
+    assert counter.count <= 4, counter.statements
+
+    with count_queries(get_engine()) as counter:
+        queries.get_search_results_with_context(session, group_id, message_ids)
+    assert counter.count <= 2, counter.statements
+
+
+def test_likers_budget(session, group_id):
+    message_ids = list(
+        session.scalars(
+            text(
+                "SELECT m.id FROM messages m JOIN message_favorites f ON f.message_id = m.id "
+                "WHERE m.group_id = :group_id LIMIT 20"
+            ),
+            {"group_id": group_id},
+        )
+    )
+    with count_queries(get_engine()) as counter:
+        likers = queries.get_likers(session, message_ids)
+    assert counter.count <= 1, counter.statements
+    assert set(likers) == set(message_ids)
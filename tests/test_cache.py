@@ -0,0 +1,140 @@
+"""Tests for the in-process and on-disk caches."""
+
+import pytest
+
+from groupme_backup.utils import cache
+from groupme_backup.utils.cache import DiskCache, TTLCache
+
+
+class FakeClock:
+    """Stands in for time.monotonic/time.time so expiry can be stepped."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def wall_clock(monkeypatch):
+    clock = FakeClock(now=2_000_000_000.0)
+    monkeypatch.setattr(cache.time, "time", clock)
+    return clock
+
+
+def test_ttl_cache_get_missing_returns_default():
+    ttl_cache = TTLCache()
+    assert ttl_cache.get("missing") is None
+    assert ttl_cache.get("missing", "default") == "default"
+
+
+def test_ttl_cache_set_and_get(clock):
+    ttl_cache = TTLCache(ttl=60)
+    ttl_cache.set("key", {"value": 1})
+    assert ttl_cache.get("key") == {"value": 1}
+    assert len(ttl_cache) == 1
+
+
+def test_ttl_cache_entries_expire(clock):
+    ttl_cache = TTLCache(ttl=60)
+    ttl_cache.set("key", "value")
+
+    clock.now += 59
+    assert ttl_cache.get("key") == "value"
+
+    clock.now += 2
+    assert ttl_cache.get("key") is None
+    assert len(ttl_cache) == 0
+
+
+def test_ttl_cache_evicts_oldest_when_full(clock):
+    ttl_cache = TTLCache(maxsize=2)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+    ttl_cache.set("c", 3)
+
+    assert ttl_cache.get("a") is None
+    assert ttl_cache.get("b") == 2
+    assert ttl_cache.get("c") == 3
+
+
+def test_ttl_cache_set_refreshes_position(clock):
+    ttl_cache = TTLCache(maxsize=2)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+    ttl_cache.set("a", 10)
+    ttl_cache.set("c", 3)
+
+    assert ttl_cache.get("a") == 10
+    assert ttl_cache.get("b") is None
+
+
+def test_ttl_cache_clear(clock):
+    ttl_cache = TTLCache()
+    ttl_cache.set("a", 1)
+    ttl_cache.clear()
+    assert ttl_cache.get("a") is None
+    assert len(ttl_cache) == 0
+
+
+def test_disk_cache_round_trip(tmp_path):
+    disk_cache = DiskCache(tmp_path / "cache")
+    key = ("get_stats", "group", (10,), (), None)
+    disk_cache.set(key, [{"name": "Alice", "count": 3}])
+
+    assert disk_cache.get(key) == [{"name": "Alice", "count": 3}]
+    assert DiskCache(tmp_path / "cache").get(key) == [{"name": "Alice", "count": 3}]
+
+
+def test_disk_cache_missing_returns_default(tmp_path):
+    disk_cache = DiskCache(tmp_path)
+    assert disk_cache.get("missing") is None
+    assert disk_cache.get("missing", "default") == "default"
+
+
+def test_disk_cache_entries_expire(tmp_path, wall_clock):
+    disk_cache = DiskCache(tmp_path, ttl=60)
+    disk_cache.set("key", "value")
+    written_at = disk_cache._path("key").stat().st_mtime
+
+    wall_clock.now = written_at + 59
+    assert disk_cache.get("key") == "value"
+
+    wall_clock.now = written_at + 61
+    assert disk_cache.get("key") is None
+
+
+def test_disk_cache_unreadable_entry_is_a_miss(tmp_path):
+    disk_cache = DiskCache(tmp_path)
+    disk_cache.set("key", "value")
+    disk_cache._path("key").write_bytes(b"not a pickle")
+
+    assert disk_cache.get("key", "default") == "default"
+
+
+def test_disk_cache_unwritable_directory_is_ignored(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    disk_cache = DiskCache(blocker / "cache")
+
+    disk_cache.set("key", "value")
+    assert disk_cache.get("key") is None
+
+
+def test_disk_cache_clear(tmp_path):
+    disk_cache = DiskCache(tmp_path)
+    disk_cache.set("a", 1)
+    disk_cache.set("b", 2)
+    disk_cache.clear()
+
+    assert disk_cache.get("a") is None
+    assert disk_cache.get("b") is None
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,31 @@
+"""Tests for lazy loading of CLI command modules."""
+
+import importlib
+
+from click.testing import CliRunner
+
+from groupme_backup.cli import main
+from groupme_backup.cli.main import _LAZY_COMMANDS, cli
+
+COMMAND_MODULES = sorted(set(_LAZY_COMMANDS.values()))
+
+
+def test_lazy_commands_match_registered_commands():
+    for module in COMMAND_MODULES:
+        importlib.import_module(module, "groupme_backup.cli")
+
+    registered = {
+        name: command.callback.__module__
+        for name, command in cli.commands.items()
+        if command.callback.__module__ != main.__name__
+    }
+    expected = {name: f"groupme_backup.cli{module}" for name, module in _LAZY_COMMANDS.items()}
+    assert registered == expected
+
+
+def test_lazy_command_help_loads_its_module(monkeypatch):
+    # The group callback loads settings before the subcommand parses --help
+    monkeypatch.setattr(main, "get_settings", lambda: None)
+    result = CliRunner().invoke(cli, ["list-groups", "--help"])
+    assert result.exit_code == 0
+    assert "--page / --no-page" in result.output
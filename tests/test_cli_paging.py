@@ -0,0 +1,26 @@
+"""Tests for paging long group listings."""
+
+import pytest
+
+from groupme_backup.cli import common
+from groupme_backup.cli.common import PAGE_THRESHOLD, echo_rows_via_pager, should_page
+
+
+def test_should_page_defaults_to_row_count():
+    assert not should_page(None, PAGE_THRESHOLD)
+    assert should_page(None, PAGE_THRESHOLD + 1)
+
+
+@pytest.mark.parametrize("row_count", [0, PAGE_THRESHOLD + 1])
+def test_should_page_flag_overrides_row_count(row_count):
+    assert should_page(True, row_count)
+    assert not should_page(False, row_count)
+
+
+def test_echo_rows_via_pager_writes_tab_separated_rows(monkeypatch):
+    paged = []
+    monkeypatch.setattr(common.click, "echo_via_pager", paged.append)
+
+    echo_rows_via_pager(("#", "Name"), [(1, "Book\tclub\nchat"), (2, "  Family  ")])
+
+    assert paged == ["#\tName\n1\tBook club chat\n2\tFamily"]
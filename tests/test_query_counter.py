@@ -0,0 +1,45 @@
+"""Tests for SQL statement counting."""
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from groupme_backup.db.query_counter import QueryCounter, count_queries
+
+
+def test_query_counter_starts_empty():
+    counter = QueryCounter()
+    assert counter.count == 0
+    assert counter.statements == []
+
+
+def test_count_queries_records_statements():
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        with count_queries(engine) as counter:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+
+    assert counter.count == 2
+    assert counter.statements == ["SELECT 1", "SELECT 2"]
+
+
+def test_count_queries_stops_counting_after_block():
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        with count_queries(engine) as counter:
+            conn.execute(text("SELECT 1"))
+        conn.execute(text("SELECT 2"))
+
+    assert counter.count == 1
+
+
+def test_count_queries_removes_listener_on_error():
+    engine = create_engine("sqlite://")
+    with pytest.raises(RuntimeError):
+        with count_queries(engine) as counter:
+            raise RuntimeError
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    assert counter.count == 0
@@ -0,0 +1,75 @@
+"""Tests for the API client's token bucket rate limiter."""
+
+import pytest
+
+from groupme_backup.api import client as client_module
+from groupme_backup.api.client import GroupMeClient
+
+
+class FakeClock:
+    """Monotonic clock whose sleep() advances time instead of blocking."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(client_module.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(client_module.time, "sleep", clock.sleep)
+    return clock
+
+
+def make_client(calls: int = 10, period: int = 10) -> GroupMeClient:
+    return GroupMeClient(access_token="token", rate_limit_calls=calls, rate_limit_period=period)
+
+
+def test_full_bucket_allows_burst_without_waiting(clock):
+    client = make_client(calls=10, period=10)
+    for _ in range(10):
+        client._wait_for_rate_limit()
+    assert clock.sleeps == []
+
+
+def test_empty_bucket_waits_for_one_token(clock):
+    client = make_client(calls=10, period=10)
+    for _ in range(10):
+        client._wait_for_rate_limit()
+
+    client._wait_for_rate_limit()
+
+    assert clock.sleeps == [pytest.approx(1.0)]
+
+
+def test_bucket_refills_over_time(clock):
+    client = make_client(calls=10, period=10)
+    for _ in range(10):
+        client._wait_for_rate_limit()
+
+    clock.now += 3
+    for _ in range(3):
+        client._wait_for_rate_limit()
+    assert clock.sleeps == []
+
+    client._wait_for_rate_limit()
+    assert len(clock.sleeps) == 1
+
+
+def test_refill_is_capped_at_bucket_size(clock):
+    client = make_client(calls=5, period=10)
+    clock.now += 3600
+    for _ in range(5):
+        client._wait_for_rate_limit()
+    assert clock.sleeps == []
+
+    client._wait_for_rate_limit()
+    assert clock.sleeps == [pytest.approx(2.0)]
@@ -0,0 +1,40 @@
+"""Tests for the sync engine's post-sync rollup refresh."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from groupme_backup.analytics import queries
+from groupme_backup.sync.engine import SyncEngine
+from groupme_backup.utils.cache import DiskCache
+
+
+@pytest.fixture
+def disk_cache(tmp_path, monkeypatch):
+    disk_cache = DiskCache(tmp_path)
+    monkeypatch.setattr(queries, "_get_disk_cache", lambda: disk_cache)
+    return disk_cache
+
+
+def test_refresh_rollups_clears_analytics_cache(disk_cache):
+    queries._results_cache.set("key", "stale")
+    disk_cache.set("key", "stale")
+
+    SyncEngine(MagicMock(), MagicMock()).refresh_rollups()
+
+    assert queries._results_cache.get("key") is None
+    assert disk_cache.get("key") is None
+
+
+def test_failed_refresh_keeps_analytics_cache(disk_cache):
+    queries._results_cache.set("key", "cached")
+    disk_cache.set("key", "cached")
+    session = MagicMock()
+    session.execute.side_effect = RuntimeError("refresh failed")
+
+    SyncEngine(MagicMock(), session).refresh_rollups()
+
+    assert queries._results_cache.get("key") == "cached"
+    assert disk_cache.get("key") == "cached"
+    session.rollback.assert_called_once()
+    queries._results_cache.clear()